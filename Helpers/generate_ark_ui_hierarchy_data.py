@@ -0,0 +1,137 @@
+"""
+ARK UI class hierarchy data generator.
+This script reads training/config/ark_ui_hierarchy.yaml and generates
+training/ark_ui_hierarchy_data.py, the class table used by ark_ui_class_hierarchy.py.
+"""
+
+import os
+import yaml
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+INPUT_FILE = os.path.join(REPO_ROOT, "training", "config", "ark_ui_hierarchy.yaml")
+OUTPUT_FILE = os.path.join(REPO_ROOT, "training", "ark_ui_hierarchy_data.py")
+
+
+def load_class_specs(yaml_path):
+    """
+    Load the hierarchy YAML and flatten it into class name -> spec tuples.
+
+    Returns the specs and the class __name__ of every entry that sets "name".
+    """
+    with open(yaml_path, 'r', encoding='utf-8') as f:
+        table = yaml.safe_load(f)
+
+    specs = {}
+    # Table key -> class __name__, for entries whose key is not their class name
+    class_names = {}
+    # Element name -> first class declaring it, to report elements shared by classes
+    owners = {}
+    for category, category_info in table["categories"].items():
+        specs[category] = ("UIElement", category_info["label"], category_info["color"],
+                           category_info.get("doc"), ())
+        if "name" in category_info:
+            class_names[category] = category_info["name"]
+        for subcategory, info in (category_info.get("subcategories") or {}).items():
+            if subcategory in specs:
+                raise ValueError(f"{subcategory} is defined more than once")
+            elements = tuple(info.get("elements") or ())
+            for element in elements:
+                if elements.count(element) > 1:
+                    raise ValueError(f"{subcategory} declares {element} more than once")
+                owner = owners.setdefault(element, subcategory)
+                if owner != subcategory:
+                    print(f"Note: {element} is declared by both {owner} and {subcategory}, "
+                          f"ELEMENT_OWNERS maps it to {owner}")
+            specs[subcategory] = (category, info["label"], info["color"], info.get("doc"), elements)
+            if "name" in info:
+                class_names[subcategory] = info["name"]
+
+    return specs, class_names
+
+
+def build_derived_tables(specs):
+    """Build the lookup tables derived from the class table."""
+    # Element name -> name of the class declaring it (the first one if several do)
+    element_owners = {}
+    # Category label -> subcategory label -> name of the subcategory class
+    hierarchy = {}
+    for class_name, (base, label, color, doc, elements) in specs.items():
+        for element in elements:
+            element_owners.setdefault(element, class_name)
+        if base == "UIElement":
+            hierarchy.setdefault(label, {})
+        else:
+            hierarchy.setdefault(specs[base][1], {})[label] = class_name
+
+    return element_owners, hierarchy
+
+
+def generate_python_file(specs, class_names, output_path):
+    """Generate the Python data module holding the class table."""
+    element_owners, hierarchy = build_derived_tables(specs)
+    lines = [
+        '"""',
+        'ARK UI class hierarchy data.',
+        'Generated by Helpers/generate_ark_ui_hierarchy_data.py from',
+        'training/config/ark_ui_hierarchy.yaml - do not edit by hand.',
+        '"""',
+        '',
+        '# class name: (base class name, category/subcategory label, default color,',
+        '#              docstring or None for a generated one, element names)',
+        'CLASS_SPECS = {',
+    ]
+    for class_name, (base, label, color, doc, elements) in specs.items():
+        head = f"    {class_name!r}: ({base!r}, {label!r}, {color!r}, {doc!r}, "
+        if not elements:
+            lines.append(head + "()),")
+            continue
+        lines.append(head + "(")
+        lines.extend(f"        {element!r}," for element in elements)
+        lines.append("    )),")
+    lines.append('}')
+
+    lines += [
+        '',
+        '# Table key -> class __name__, for the classes whose key differs from it',
+        '# (keys starting with "_" are kept out of the module namespace)',
+        'CLASS_NAMES = {',
+    ]
+    lines.extend(f"    {class_name!r}: {name!r}," for class_name, name in class_names.items())
+    lines.append('}')
+
+    lines += [
+        '',
+        '# Element name -> name of the class declaring it (the first one if several do)',
+        'ELEMENT_OWNERS = {',
+    ]
+    lines.extend(f"    {element!r}: {class_name!r}," for element, class_name in element_owners.items())
+    lines.append('}')
+
+    lines += [
+        '',
+        '# Category label -> subcategory label -> element names',
+        'HIERARCHY = {',
+    ]
+    for category, subcategories in hierarchy.items():
+        # Reference the table's element tuples instead of repeating them
+        lines.append(f"    {category!r}: {{")
+        lines.extend(f"        {label!r}: CLASS_SPECS[{class_name!r}][4],"
+                     for label, class_name in subcategories.items())
+        lines.append("    },")
+    lines.append('}')
+
+    with open(output_path, 'w', encoding='utf-8') as f:
+        f.write('\n'.join(lines) + '\n')
+
+
+if __name__ == "__main__":
+    try:
+        print(f"Loading class hierarchy from {INPUT_FILE}...")
+        specs, class_names = load_class_specs(INPUT_FILE)
+        print(f"Found {len(specs)} classes")
+
+        print(f"Generating {OUTPUT_FILE}...")
+        generate_python_file(specs, class_names, OUTPUT_FILE)
+        print(f"Successfully generated {OUTPUT_FILE}")
+    except Exception as e:
+        print(f"Error: {str(e)}")
@@ -269,16 +269,10 @@ class ARKUICollector:
                 }
                 
                 # Find all UI elements in this subcategory class
-                for attr_name in dir(obj):
-                    # Skip special attributes and methods
-                    if attr_name.startswith("__") or callable(getattr(obj, attr_name)):
-                        continue
-                    
-                    # Check if it looks like an element name
-                    attr_value = getattr(obj, attr_name)
-                    if isinstance(attr_value, str) and '_' in attr_value:
-                        self.category_structure[parent_name]["subcategories"][subcategory_name]["elements"].append(attr_value)
-                        self.ui_elements.append(attr_value)
+                # Elements declared by this subcategory class (sorted, matching the old dir() order)
+                for element_name in sorted(obj.ALL):
+                    self.category_structure[parent_name]["subcategories"][subcategory_name]["elements"].append(element_name)
+                    self.ui_elements.append(element_name)
         
         # Prepare navigation references
         self.category_names = list(self.category_structure.keys())
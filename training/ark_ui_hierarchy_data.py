@@ -0,0 +1,4304 @@
+"""
+ARK UI class hierarchy data.
+Generated by Helpers/generate_ark_ui_hierarchy_data.py from
+training/config/ark_ui_hierarchy.yaml - do not edit by hand.
+"""
+
+# class name: (base class name, category/subcategory label, default color,
+#              docstring or None for a generated one, element names)
+CLASS_SPECS = {
+    'HUDElements': ('UIElement', 'HUD Elements', '#ffffff', None, ()),
+    'HUDHealthIndicators': ('HUDElements', 'Health Indicators', '#c80000', 'Class for health-related HUD indicators', (
+        'hud_healthbar',
+        'hud_healthbar_full',
+        'hud_healthbar_medium',
+        'hud_healthbar_low',
+    )),
+    'HUDStaminaIndicators': ('HUDElements', 'Stamina Indicators', '#00d43c', 'Class for stamina-related HUD indicators', (
+        'hud_staminabar',
+        'hud_staminabar_full',
+        'hud_staminabar_medium',
+        'hud_staminabar_low',
+    )),
+    'HUDFoodIndicators': ('HUDElements', 'Food Indicators', '#ff9a00', 'Class for food-related HUD indicators', (
+        'hud_foodbar',
+        'hud_foodbar_full',
+        'hud_foodbar_medium',
+        'hud_foodbar_low',
+    )),
+    'HUDWaterIndicators': ('HUDElements', 'Water Indicators', '#00a9ff', 'Class for water-related HUD indicators', (
+        'hud_waterbar',
+        'hud_waterbar_full',
+        'hud_waterbar_medium',
+        'hud_waterbar_low',
+    )),
+    'HUDOxygenIndicators': ('HUDElements', 'Oxygen Indicators', '#00c3ff', 'Class for oxygen-related HUD indicators', (
+        'hud_oxygenbar',
+        'hud_oxygenbar_full',
+        'hud_oxygenbar_medium',
+        'hud_oxygenbar_low',
+    )),
+    'HUDWeightIndicators': ('HUDElements', 'Weight Indicators', '#a0a0a0', 'Class for weight-related HUD indicators', (
+        'hud_weightbar',
+        'hud_weightbar_light',
+        'hud_weightbar_medium',
+        'hud_weightbar_heavy',
+        'hud_weightbar_overweight',
+    )),
+    'HUDTorpidityIndicators': ('HUDElements', 'Torpidity Indicators', '#9b59b6', 'Class for torpidity-related HUD indicators', (
+        'hud_torpiditybar',
+        'hud_torpiditybar_low',
+        'hud_torpiditybar_medium',
+        'hud_torpiditybar_high',
+    )),
+    'HUDExperienceIndicators': ('HUDElements', 'Experience Indicators', '#f1c40f', 'Class for experience-related HUD indicators', (
+        'hud_xp_bar',
+        'hud_levelup_alert',
+        'hud_xp_notification',
+    )),
+    'HUDCompassElements': ('HUDElements', 'Compass Elements', '#ffffff', 'Class for compass-related HUD elements', (
+        'hud_compass',
+        'hud_compass_north',
+        'hud_compass_east',
+        'hud_compass_south',
+        'hud_compass_west',
+        'hud_compass_degrees',
+        'hud_compass_direction',
+        'hud_gps_coordinates',
+        'hud_altitude_indicator',
+        'hud_depth_indicator',
+    )),
+    'HUDTemperatureIndicators': ('HUDElements', 'Temperature Indicators', '#e74c3c', 'Class for temperature-related HUD indicators', (
+        'hud_temperature_indicator',
+        'hud_temperature_hot',
+        'hud_temperature_comfortable',
+        'hud_temperature_cold',
+    )),
+    'HUDBuffIndicators': ('HUDElements', 'Buff Indicators', '#2ecc71', 'Class for buff-related HUD indicators', (
+        'hud_buff_icon',
+        'hud_buff_icon_generalized',
+        'hud_buff_icon_food',
+        'hud_buff_icon_water',
+        'hud_buff_icon_shelter',
+        'hud_buff_icon_mating',
+    )),
+    'HUDDebuffIndicators': ('HUDElements', 'Debuff Indicators', '#e74c3c', 'Class for debuff-related HUD indicators', (
+        'hud_debuff_icon',
+        'hud_buff_icon_encumbered',
+        'hud_buff_icon_hypothermia',
+        'hud_buff_icon_hyperthermia',
+        'hud_buff_icon_poisoned',
+        'hud_buff_icon_diseased',
+        'hud_buff_icon_broken_bone',
+    )),
+    'HUDChatElements': ('HUDElements', 'Chat Elements', '#ffffff', 'Class for chat-related HUD elements', (
+        'hud_chat_window',
+        'hud_chat_input',
+        'hud_chat_global_tab',
+        'hud_chat_local_tab',
+        'hud_chat_tribe_tab',
+        'hud_chat_alliance_tab',
+        'hud_tribe_log',
+        'hud_tribe_log_entry',
+        'hud_death_message',
+        'hud_taming_notification',
+        'hud_server_message',
+    )),
+    'HUDCrosshairElements': ('HUDElements', 'Crosshair Elements', '#ffffff', 'Class for crosshair-related HUD elements', (
+        'hud_crosshair_default',
+        'hud_crosshair_harvesting',
+        'hud_crosshair_ranged',
+        'hud_crosshair_spyglass',
+    )),
+    'HUDInteractionPrompts': ('HUDElements', 'Interaction Prompts', '#ffffff', 'Class for interaction prompt HUD elements', (
+        'hud_interaction_prompt',
+        'hud_pickup_prompt',
+        'hud_mount_prompt',
+        'hud_access_prompt',
+    )),
+    'HUDWheelMenus': ('HUDElements', 'Wheel Menus', '#ffffff', 'Class for wheel menu HUD elements', (
+        'hud_whistle_wheel',
+        'hud_emote_wheel',
+        'hud_quickchat_wheel',
+    )),
+    'HUDWaypointElements': ('HUDElements', 'Waypoint Elements', '#3498db', 'Class for waypoint-related HUD elements', (
+        'hud_waypoint_marker',
+        'hud_waypoint_distance',
+        'hud_objective_marker',
+        'hud_mission_timer',
+        'hud_boss_arena_timer',
+    )),
+    'HUDNameTags': ('HUDElements', 'Name Tags', '#ffffff', 'Class for name tag HUD elements', (
+        'hud_player_name_tag',
+        'hud_tamed_dino_name_tag',
+        'hud_wild_dino_name_tag',
+        'hud_structure_name_tag',
+        'hud_tribe_name_tag',
+        'hud_ally_indicator',
+        'hud_enemy_indicator',
+        'hud_neutral_indicator',
+    )),
+    'HUDMarkerElements': ('HUDElements', 'Marker Elements', '#3498db', 'Class for marker-related HUD elements', (
+        'hud_hlna_icon',
+        'hud_hlna_message',
+        'hud_resource_node_marker',
+        'hud_explorer_note_marker',
+        'hud_supply_drop_marker',
+        'hud_beaver_dam_marker',
+        'hud_artifact_marker',
+    )),
+    'HUDWarningElements': ('HUDElements', 'Warning Elements', '#e74c3c', 'Class for warning-related HUD elements', (
+        'hud_radiation_warning',
+        'hud_gas_warning',
+        'hud_element_warning',
+    )),
+    'HUDTekElements': ('HUDElements', 'Tek HUD Elements', '#3498db', 'Class for Tek-related HUD elements', (
+        'hud_tek_visor_overlay',
+        'hud_tek_visor_target',
+        'hud_tek_visor_stats',
+        'hud_tek_punch_charge',
+    )),
+    'HUDOverlayElements': ('HUDElements', 'Overlay Elements', '#ffffff', 'Class for overlay-related HUD elements', (
+        'hud_spyglass_overlay',
+        'hud_spyglass_info',
+        'hud_taxidermy_camera',
+        'hud_paintbrush_color_picker',
+        'hud_paintbrush_brush_size',
+        'hud_creature_stats_overlay',
+        'hud_structure_health_overlay',
+        'hud_resource_yields_popup',
+    )),
+    'QuickbarElements': ('UIElement', 'Quickbar Elements', '#ffffff', None, ()),
+    'QuickbarSlots': ('QuickbarElements', 'Quickbar Slots', '#ffffff', 'Class for quickbar slot elements', (
+        'quickbar_background',
+        'quickbar_slot_1',
+        'quickbar_slot_2',
+        'quickbar_slot_3',
+        'quickbar_slot_4',
+        'quickbar_slot_5',
+        'quickbar_slot_6',
+        'quickbar_slot_7',
+        'quickbar_slot_8',
+        'quickbar_slot_9',
+        'quickbar_slot_0',
+        'quickbar_slot_filled',
+        'quickbar_slot_empty',
+        'quickbar_slot_selected',
+    )),
+    'QuickbarIndicators': ('QuickbarElements', 'Quickbar Indicators', '#ffffff', 'Class for quickbar indicator elements', (
+        'quickbar_selector',
+        'quickbar_item_name',
+        'quickbar_item_count',
+        'quickbar_item_durability_high',
+        'quickbar_item_durability_medium',
+        'quickbar_item_durability_low',
+        'quickbar_weapon_ammo_count',
+        'quickbar_weapon_reload_prompt',
+        'quickbar_item_cooldown',
+        'quickbar_item_keybind',
+        'quickbar_item_equip_animation',
+        'quickbar_contextual_action',
+    )),
+    'QuickbarHotkeys': ('QuickbarElements', 'Quickbar Hotkeys', '#ffffff', 'Class for quickbar hotkey elements', (
+        'quickbar_hotkey_1',
+        'quickbar_hotkey_2',
+        'quickbar_hotkey_3',
+        'quickbar_hotkey_4',
+        'quickbar_hotkey_5',
+        'quickbar_hotkey_6',
+        'quickbar_hotkey_7',
+        'quickbar_hotkey_8',
+        'quickbar_hotkey_9',
+        'quickbar_hotkey_0',
+    )),
+    'InventoryElements': ('UIElement', 'Inventory Elements', '#ffffff', None, ()),
+    'InventoryPanels': ('InventoryElements', 'Inventory Panels', '#ffffff', 'Class for inventory panel elements', (
+        'inventory_background',
+        'inventory_player_region',
+        'inventory_entity_region',
+        'inventory_player_model',
+        'inventory_player_stats',
+        'inventory_toolbar',
+        'inventory_close_button',
+    )),
+    'InventorySlots': ('InventoryElements', 'Inventory Slots', '#ffffff', 'Class for inventory slot elements', (
+        'inventory_player_slot_empty',
+        'inventory_player_slot_filled',
+        'inventory_item_icon',
+        'inventory_item_stack_count',
+        'inventory_item_durability_high',
+        'inventory_item_durability_medium',
+        'inventory_item_durability_low',
+        'inventory_item_broken_indicator',
+    )),
+    'InventoryQualityIndicators': ('InventoryElements', 'Quality Indicators', '#ffffff', 'Class for inventory quality indicator elements', (
+        'inventory_item_quality_primitive',
+        'inventory_item_quality_ramshackle',
+        'inventory_item_quality_apprentice',
+        'inventory_item_quality_journeyman',
+        'inventory_item_quality_mastercraft',
+        'inventory_item_quality_ascendant',
+    )),
+    'InventoryItemSpecials': ('InventoryElements', 'Item Specials', '#ffffff', 'Class for special inventory item elements', (
+        'inventory_item_blueprint_icon',
+        'inventory_item_blueprint_text',
+        'inventory_item_equipped_marker',
+        'inventory_item_favorite_marker',
+        'inventory_item_spoil_timer',
+        'inventory_item_repair_cost',
+    )),
+    'InventoryControls': ('InventoryElements', 'Inventory Controls', '#ffffff', 'Class for inventory control elements', (
+        'inventory_search_bar',
+        'inventory_search_icon',
+        'inventory_search_results',
+        'inventory_transfer_right_button',
+        'inventory_transfer_left_button',
+        'inventory_transfer_item_button',
+        'inventory_weight_current',
+        'inventory_weight_max',
+        'inventory_weight_percentage',
+        'inventory_weight_progress_bar',
+        'inventory_sort_button',
+        'inventory_drop_button',
+        'inventory_drop_all_button',
+        'inventory_split_stack_slider',
+        'inventory_remote_use_button',
+    )),
+    'InventoryArmorSlots': ('InventoryElements', 'Armor Slots', '#ffffff', 'Class for inventory armor slot elements', (
+        'inventory_armor_slot_head',
+        'inventory_armor_slot_chest',
+        'inventory_armor_slot_hands',
+        'inventory_armor_slot_legs',
+        'inventory_armor_slot_feet',
+        'inventory_armor_slot_shield',
+    )),
+    'InventoryTooltips': ('InventoryElements', 'Tooltips', '#ffffff', 'Class for inventory tooltip elements', (
+        'inventory_item_tooltip',
+        'inventory_item_tooltip_title',
+        'inventory_item_tooltip_description',
+        'inventory_item_tooltip_weight',
+        'inventory_item_tooltip_stats',
+        'inventory_item_tooltip_durability',
+        'inventory_item_tooltip_effects',
+    )),
+    'InventoryContextMenu': ('InventoryElements', 'Context Menu', '#ffffff', 'Class for inventory context menu elements', (
+        'inventory_item_context_menu',
+        'inventory_item_context_option_equip',
+        'inventory_item_context_option_drop',
+        'inventory_item_context_option_drop_all',
+        'inventory_item_context_option_transfer',
+        'inventory_item_context_option_transfer_all',
+        'inventory_item_context_option_split',
+        'inventory_item_context_option_consume',
+        'inventory_item_context_option_examine',
+        'inventory_item_context_option_rename',
+        'inventory_item_context_option_repair',
+    )),
+    'InventoryFolders': ('InventoryElements', 'Folders', '#ffffff', 'Class for inventory folder elements', (
+        'inventory_folder_tab',
+        'inventory_folder_icon',
+        'inventory_folder_name',
+        'inventory_folder_item_count',
+        'inventory_scroll_bar',
+        'inventory_scroll_up_button',
+        'inventory_scroll_down_button',
+    )),
+    'EntityInventoryElements': ('InventoryElements', 'Entity Inventory', '#ffffff', 'Class for entity inventory elements', (
+        'inventory_entity_slot_empty',
+        'inventory_entity_slot_filled',
+        'inventory_entity_name',
+        'inventory_structure_type',
+        'inventory_entity_level',
+        'inventory_entity_model',
+        'inventory_entity_inventory_slots_count',
+    )),
+    'SpecialInventoryElements': ('InventoryElements', 'Special Inventories', '#ffffff', 'Class for special inventory elements', (
+        'inventory_beacon_countdown',
+        'inventory_tek_transmitter_interface',
+        'inventory_obelisk_interface',
+        'inventory_genesis_mission_interface',
+        'inventory_cryopod_contents',
+        'inventory_artifact_slot',
+        'inventory_boss_tribute_slot',
+        'inventory_tek_element_count',
+    )),
+    '_InventoryTerminalTabs': ('InventoryElements', 'Terminal Tabs', '#ffffff', 'Class for terminal tab elements', (
+        'inventory_terminal_download_tab',
+        'inventory_terminal_upload_tab',
+        'inventory_terminal_creature_tab',
+        'inventory_terminal_data_tab',
+    )),
+    'TabElements': ('UIElement', 'Tab Elements', '#ffffff', None, ()),
+    'InventoryTabs': ('TabElements', 'Inventory Tabs', '#ffffff', 'Class for inventory tab elements', (
+        'tab_inventory_active',
+        'tab_inventory_inactive',
+        'tab_crafting_active',
+        'tab_crafting_inactive',
+        'tab_engrams_active',
+        'tab_engrams_inactive',
+    )),
+    'CharacterTabs': ('TabElements', 'Character Tabs', '#ffffff', 'Class for character tab elements', (
+        'tab_tribe_active',
+        'tab_tribe_inactive',
+        'tab_stats_active',
+        'tab_stats_inactive',
+        'tab_notes_active',
+        'tab_notes_inactive',
+        'tab_map_active',
+        'tab_map_inactive',
+    )),
+    'DinoTabs': ('TabElements', 'Dino Tabs', '#ffffff', 'Class for dino tab elements', (
+        'tab_dino_stats_active',
+        'tab_dino_stats_inactive',
+        'tab_dino_inventory_active',
+        'tab_dino_inventory_inactive',
+        'tab_dino_behavior_active',
+        'tab_dino_behavior_inactive',
+    )),
+    'TerminalTabs': ('TabElements', 'Terminal Tabs', '#ffffff', 'Class for terminal tab elements', (
+        'tab_spawn_selection_active',
+        'tab_spawn_selection_inactive',
+        'tab_tribute_active',
+        'tab_tribute_inactive',
+        'tab_upload_active',
+        'tab_upload_inactive',
+        'tab_download_active',
+        'tab_download_inactive',
+        'tab_recipes_active',
+        'tab_recipes_inactive',
+        'tab_cluster_active',
+        'tab_cluster_inactive',
+        'tab_missions_active',
+        'tab_missions_inactive',
+        'tab_genesis_biomes_active',
+        'tab_genesis_biomes_inactive',
+    )),
+    'CraftingElements': ('UIElement', 'Crafting Elements', '#ffffff', None, ()),
+    'CraftingPanels': ('CraftingElements', 'Crafting Panels', '#ffffff', 'Class for crafting panel elements', (
+        'crafting_item_panel',
+        'crafting_item_icon',
+        'crafting_item_name',
+        'crafting_item_description',
+        'crafting_materials_header',
+        'crafting_materials_required',
+        'crafting_materials_sufficient',
+        'crafting_materials_insufficient',
+        'crafting_button_active',
+        'crafting_button_inactive',
+    )),
+    'CraftingControls': ('CraftingElements', 'Crafting Controls', '#ffffff', 'Class for crafting control elements', (
+        'crafting_blueprint_header',
+        'crafting_button_craft_one',
+        'crafting_button_craft_all',
+        'crafting_button_craft_custom',
+        'crafting_amount_selector',
+        'crafting_checkbox_craftall',
+        'crafting_time_estimate',
+    )),
+    'CraftingQueue': ('CraftingElements', 'Crafting Queue', '#ffffff', 'Class for crafting queue elements', (
+        'crafting_queue_header',
+        'crafting_queue_slot',
+        'crafting_queue_slot_empty',
+        'crafting_queue_slot_occupied',
+        'crafting_queue_item_name',
+        'crafting_queue_item_icon',
+        'crafting_queue_progress_text',
+        'crafting_queue_cancel_button',
+        'crafting_progress_bar_inactive',
+        'crafting_progress_bar_active',
+    )),
+    'CraftingStationInfo': ('CraftingElements', 'Station Info', '#ffffff', 'Class for crafting station information elements', (
+        'crafting_station_icon',
+        'crafting_station_name',
+        'crafting_station_level',
+    )),
+    'CraftingFilters': ('CraftingElements', 'Crafting Filters', '#ffffff', 'Class for crafting filter elements', (
+        'crafting_search_bar',
+        'crafting_search_icon',
+        'crafting_filter_button',
+        'crafting_filter_dropdown',
+        'crafting_filter_option_all',
+        'crafting_filter_option_armor',
+        'crafting_filter_option_weapons',
+        'crafting_filter_option_Structure',
+        'crafting_filter_option_consumables',
+        'crafting_filter_option_resources',
+        'crafting_filter_option_tools',
+    )),
+    'CraftingSorting': ('CraftingElements', 'Crafting Sorting', '#ffffff', 'Class for crafting sorting elements', (
+        'crafting_sort_button',
+        'crafting_sort_dropdown',
+        'crafting_sort_option_alphabetical',
+        'crafting_sort_option_level',
+        'crafting_sort_option_craftable',
+        'crafting_category_header',
+    )),
+    'CraftingBoosts': ('CraftingElements', 'Crafting Boosts', '#ffffff', 'Class for crafting boost elements', (
+        'crafting_skill_boost_indicator',
+        'crafting_speed_multiplier',
+        'crafting_blueprint_quality_indicator',
+        'crafting_blueprint_bonus_text',
+        'crafting_mindwipe_reminder',
+    )),
+    'CraftingRequirements': ('CraftingElements', 'Crafting Requirements', '#ffffff', 'Class for crafting requirement elements', (
+        'crafting_engram_points_cost',
+        'crafting_level_requirement',
+        'crafting_tek_element_cost',
+    )),
+    'CraftingResourceCosts': ('CraftingElements', 'Resource Costs', '#ffffff', 'Class for crafting resource cost elements', (
+        'crafting_crystal_cost',
+        'crafting_metal_cost',
+        'crafting_wood_cost',
+        'crafting_thatch_cost',
+        'crafting_stone_cost',
+        'crafting_hide_cost',
+        'crafting_fiber_cost',
+        'crafting_chitin_cost',
+        'crafting_keratin_cost',
+        'crafting_obsidian_cost',
+        'crafting_polymer_cost',
+        'crafting_electronics_cost',
+        'crafting_cementing_paste_cost',
+        'crafting_silica_pearls_cost',
+        'crafting_oil_cost',
+        'crafting_pelt_cost',
+        'crafting_black_pearl_cost',
+        'crafting_narcotics_cost',
+        'crafting_stimulant_cost',
+        'crafting_biotoxin_cost',
+        'crafting_congealed_gas_cost',
+        'crafting_element_shard_cost',
+        'crafting_element_dust_cost',
+        'crafting_mutagel_cost',
+        'crafting_ammunition_cost',
+    )),
+    'EngramElements': ('UIElement', 'Engram Elements', '#ffffff', None, ()),
+    'EngramIcons': ('EngramElements', 'Engram Icons', '#ffffff', 'Class for engram icon elements', (
+        'engram_icon_available',
+        'engram_icon_learned',
+        'engram_icon_locked',
+        'engram_icon_dlc_locked',
+        'engram_highlight_new',
+    )),
+    'EngramPoints': ('EngramElements', 'Engram Points', '#ffffff', 'Class for engram point elements', (
+        'engram_points_display',
+        'engram_points_total',
+        'engram_points_spent',
+        'engram_points_available',
+        'engram_level_requirement',
+    )),
+    'EngramControls': ('EngramElements', 'Engram Controls', '#ffffff', 'Class for engram control elements', (
+        'engram_learn_button_active',
+        'engram_learn_button_inactive',
+        'engram_learn_multiple_button',
+        'engram_auto_unlock_checkbox',
+        'engram_prerequisite_warning',
+    )),
+    'EngramItems': ('EngramElements', 'Engram Items', '#ffffff', 'Class for engram item elements', (
+        'engram_item_icon',
+        'engram_item_name',
+        'engram_item_description',
+    )),
+    'EngramSearch': ('EngramElements', 'Engram Search', '#ffffff', 'Class for engram search elements', (
+        'engram_search_bar',
+        'engram_search_icon',
+        'engram_search_results',
+        'engram_point_cost',
+    )),
+    'EngramCategories': ('EngramElements', 'Engram Categories', '#ffffff', 'Class for engram category elements', (
+        'engram_category_tab',
+        'engram_category_icon',
+        'engram_category_name',
+        'engram_category_progress',
+        'engram_show_unlocked_toggle',
+        'engram_hide_locked_toggle',
+    )),
+    'EngramTooltips': ('EngramElements', 'Engram Tooltips', '#ffffff', 'Class for engram tooltip elements', (
+        'engram_tooltip',
+        'engram_tooltip_name',
+        'engram_tooltip_description',
+        'engram_tooltip_level',
+        'engram_tooltip_cost',
+    )),
+    'EngramDLCIcons': ('EngramElements', 'DLC Icons', '#ffffff', 'Class for engram DLC icon elements', (
+        'engram_dlc_icon',
+        'engram_tek_icon',
+        'engram_genesis_icon',
+        'engram_aberration_icon',
+        'engram_scorched_earth_icon',
+        'engram_extinction_icon',
+        'engram_fjordur_icon',
+        'engram_valguero_icon',
+        'engram_crystal_isles_icon',
+        'engram_lost_island_icon',
+        'engram_gen1_icon',
+        'engram_gen2_icon',
+        'engram_primitive_plus_icon',
+        'engram_boss_unlock_icon',
+        'engram_mission_unlock_icon',
+    )),
+    'EngramNavigation': ('EngramElements', 'Engram Navigation', '#ffffff', 'Class for engram navigation elements', (
+        'engram_scroll_bar',
+        'engram_scroll_up_button',
+        'engram_scroll_down_button',
+        'engram_tech_tier_marker',
+        'engram_level_marker',
+    )),
+    'DinoElements': ('UIElement', 'Dino Elements', '#ffffff', None, ()),
+    'DinoInventory': ('DinoElements', 'Dino Inventory', '#ffffff', 'Class for dino inventory elements', (
+        'dino_inventory_name',
+        'dino_inventory_level',
+        'dino_health_bar',
+        'dino_stamina_bar',
+        'dino_food_bar',
+        'dino_torpidity_bar',
+        'dino_weight_bar',
+        'dino_options_button',
+        'dino_follow_setting',
+        'dino_behavior_setting',
+        'dino_saddle_slot',
+        'dino_stats_increase_button',
+    )),
+    'DinoBehavior': ('DinoElements', 'Dino Behavior', '#ffffff', 'Class for dino behavior elements', (
+        'dino_behavior_aggressive',
+        'dino_behavior_neutral',
+        'dino_behavior_passive',
+        'dino_behavior_passive_flee',
+        'dino_follow_distance_close',
+        'dino_follow_distance_medium',
+        'dino_follow_distance_far',
+        'dino_follow_distance_furthest',
+    )),
+    'DinoTargeting': ('DinoElements', 'Dino Targeting', '#ffffff', 'Class for dino targeting elements', (
+        'dino_targeting_setting',
+        'dino_targeting_low_hp',
+        'dino_targeting_high_dmg',
+        'dino_mating_toggle',
+        'dino_wandering_toggle',
+        'dino_turret_mode_toggle',
+        'dino_harvest_setting',
+        'dino_enable_ally_looking',
+        'dino_victim_item_collection',
+    )),
+    'DinoStats': ('DinoElements', 'Dino Stats', '#ffffff', 'Class for dino stat elements', (
+        'dino_stats_background',
+        'dino_stats_header',
+        'dino_stats_species',
+        'dino_stats_level',
+        'dino_stats_xp_bar',
+        'dino_stats_xp_to_next_level',
+        'dino_stat_health',
+        'dino_stat_health_value',
+        'dino_stat_health_increase_button',
+        'dino_stat_stamina',
+        'dino_stat_stamina_value',
+        'dino_stat_stamina_increase_button',
+        'dino_stat_oxygen',
+        'dino_stat_oxygen_value',
+        'dino_stat_oxygen_increase_button',
+        'dino_stat_food',
+        'dino_stat_food_value',
+        'dino_stat_food_increase_button',
+        'dino_stat_weight',
+        'dino_stat_weight_value',
+        'dino_stat_weight_increase_button',
+        'dino_stat_melee',
+        'dino_stat_melee_value',
+        'dino_stat_melee_increase_button',
+        'dino_stat_speed',
+        'dino_stat_speed_value',
+        'dino_stat_speed_increase_button',
+        'dino_stat_torpor',
+        'dino_stat_torpor_value',
+    )),
+    'DinoImprinting': ('DinoElements', 'Dino Imprinting', '#ffffff', 'Class for dino imprinting elements', (
+        'dino_imprinting_status',
+        'dino_imprinting_quality',
+        'dino_imprinting_progress',
+        'dino_imprinting_timer',
+        'dino_unclaim_button',
+        'dino_rename_button',
+        'dino_color_regions',
+        'dino_mutation_counter_paternal',
+        'dino_mutation_counter_maternal',
+        'dino_ancestry_button',
+        'dino_gender_indicator',
+    )),
+    'DinoAbilities': ('DinoElements', 'Dino Abilities', '#ffffff', 'Class for dino ability elements', (
+        'dino_special_ability_cooldown',
+        'dino_special_ability_button',
+        'dino_pack_buff_indicator',
+        'dino_mate_boost_indicator',
+        'dino_wild_stats',
+        'dino_tamed_bonus',
+        'dino_imprint_bonus',
+    )),
+    'TamingElements': ('DinoElements', 'Taming Elements', '#ffffff', 'Class for taming-related elements', (
+        'taming_effectiveness_bar',
+        'taming_progress_bar',
+        'taming_food_timer',
+        'taming_torpor_bar',
+        'taming_progress_bar_empty',
+        'taming_progress_bar_partial',
+        'taming_progress_bar_full',
+        'taming_effectiveness_high',
+        'taming_effectiveness_medium',
+        'taming_effectiveness_low',
+    )),
+    '_StructureInteractionElements': ('UIElement', 'Structure Elements', '#ffffff', None, ()),
+    'StructureInfo': ('_StructureInteractionElements', 'Structure Info', '#ffffff', 'Class for structure information elements', (
+        'structure_name_label',
+        'structure_inventory_button',
+        'structure_options_button',
+        'structure_power_indicator',
+        'structure_fuel_level',
+        'structure_pin_code_input',
+        'structure_demolish_timer',
+        'structure_health_bar',
+        'structure_shield_bar',
+        'structure_transfer_button',
+    )),
+    'StructureOptions': ('_StructureInteractionElements', 'Structure Options', '#ffffff', 'Class for structure option elements', (
+        'structure_options_menu',
+        'structure_demolish_option',
+        'structure_pickup_option',
+        'structure_paint_option',
+        'structure_change_pin_option',
+    )),
+    'StructurePlacement': ('_StructureInteractionElements', 'Structure Placement', '#ffffff', 'Class for structure placement elements', (
+        'structure_snap_points',
+        'structure_placement_valid',
+        'structure_placement_invalid',
+        'structure_placement_preview',
+        'structure_placement_obstruction',
+        'structure_placement_foundation_required',
+        'structure_placement_support_required',
+        'structure_placement_enemy_foundation',
+        'structure_placement_enemy_territory',
+        'structure_placement_snap_point',
+        'structure_placement_snap_preview',
+    )),
+    'StructurePower': ('_StructureInteractionElements', 'Structure Power', '#ffffff', 'Class for structure power elements', (
+        'structure_powered_indicator',
+        'structure_unpowered_indicator',
+        'generator_fuel_level',
+        'electrical_wire_connection',
+        'water_pipe_connection',
+        'gas_pipe_connection',
+        'storage_capacity_indicator',
+        'auto_turret_ammo_indicator',
+    )),
+    'MapElements': ('UIElement', 'Map Elements', '#ffffff', None, ()),
+    'MapBackground': ('MapElements', 'Map Background', '#ffffff', 'Class for map background elements', (
+        'map_background',
+        'map_background_terrain',
+        'map_background_ocean',
+        'map_grid_lines',
+        'map_grid_labels',
+        'map_biome_boundaries',
+        'map_biome_name_label',
+    )),
+    'MapMarkers': ('MapElements', 'Map Markers', '#ffffff', 'Class for map marker elements', (
+        'map_player_marker',
+        'map_player_marker_direction',
+        'map_player_text_label',
+        'map_tribe_member_marker',
+        'map_tribe_member_text_label',
+        'map_tamed_dino_marker',
+        'map_tamed_dino_text_label',
+        'map_tamed_dino_type_icon',
+        'map_bed_marker',
+        'map_bed_text_label',
+    )),
+    'MapBaseMarkers': ('MapElements', 'Base Markers', '#ffffff', 'Class for map base marker elements', (
+        'map_base_marker',
+        'map_base_text_label',
+        'map_waypoint_marker',
+        'map_waypoint_text_label',
+        'map_waypoint_distance',
+    )),
+    'MapObeliskMarkers': ('MapElements', 'Obelisk Markers', '#ffffff', 'Class for map obelisk marker elements', (
+        'map_obelisk_marker_red',
+        'map_obelisk_marker_blue',
+        'map_obelisk_marker_green',
+        'map_terminal_marker',
+        'map_cave_entrance_marker',
+        'map_underwater_cave_marker',
+    )),
+    'MapBeaconMarkers': ('MapElements', 'Beacon Markers', '#ffffff', 'Class for map beacon marker elements', (
+        'map_beacon_marker_white',
+        'map_beacon_marker_green',
+        'map_beacon_marker_blue',
+        'map_beacon_marker_purple',
+        'map_beacon_marker_yellow',
+        'map_beacon_marker_red',
+    )),
+    'MapSpecialMarkers': ('MapElements', 'Special Markers', '#ffffff', 'Class for map special marker elements', (
+        'map_mission_marker',
+        'map_boss_terminal_marker',
+        'map_supply_drop_marker',
+        'map_explorer_note_marker',
+        'map_glitch_marker',
+        'map_resource_node_marker',
+        'map_charging_station_marker',
+    )),
+    'MapWaterElements': ('MapElements', 'Water Elements', '#ffffff', 'Class for map water-related elements', (
+        'map_ocean_depth_indicator',
+        'map_shallow_water_indicator',
+        'map_deep_water_indicator',
+        'map_danger_zone_indicator',
+        'map_radiation_zone',
+    )),
+    'MapBiomeIndicators': ('MapElements', 'Biome Indicators', '#ffffff', 'Class for map biome indicator elements', (
+        'map_snow_biome_indicator',
+        'map_desert_biome_indicator',
+        'map_redwood_biome_indicator',
+        'map_swamp_biome_indicator',
+    )),
+    'MapCoordinates': ('MapElements', 'Coordinates', '#ffffff', 'Class for map coordinate elements', (
+        'map_coordinates_display',
+        'map_latitude_display',
+        'map_longitude_display',
+        'map_altitude_display',
+    )),
+    'MapControls': ('MapElements', 'Map Controls', '#ffffff', 'Class for map control elements', (
+        'map_zoom_in_button',
+        'map_zoom_out_button',
+        'map_zoom_level_indicator',
+        'map_filter_button',
+        'map_filter_panel',
+        'map_place_waypoint_button',
+        'map_clear_waypoint_button',
+        'map_fast_travel_button',
+    )),
+    'MapAdditionalInfo': ('MapElements', 'Additional Info', '#ffffff', 'Class for map additional information elements', (
+        'map_region_name_text',
+        'map_weather_indicator',
+        'map_fog_of_war',
+        'map_discovered_area',
+        'map_genesis_mission_zones',
+        'map_genesis_teleport_points',
+        'map_server_border',
+    )),
+    'MinimapElements': ('MapElements', 'Minimap', '#ffffff', 'Class for minimap elements', (
+        'map_minimap_frame',
+        'map_minimap_terrain',
+        'map_minimap_player_marker',
+        'map_minimap_north_indicator',
+    )),
+    'AlertElements': ('UIElement', 'Alert Elements', '#ffffff', None, ()),
+    'HealthAlerts': ('AlertElements', 'Health Alerts', '#e74c3c', 'Class for health-related alert elements', (
+        'alert_starvation',
+        'alert_dehydration',
+        'alert_encumbered',
+        'alert_too_hot',
+        'alert_too_cold',
+    )),
+    'NotificationAlerts': ('AlertElements', 'Notification Alerts', '#ffffff', 'Class for notification alert elements', (
+        'alert_level_up',
+        'alert_tribe_message',
+        'alert_death_message',
+        'alert_taming_complete',
+        'alert_insufficient_engrams',
+        'alert_structure_blocked',
+        'alert_enemy_player_nearby',
+        'alert_server_message',
+        'alert_disconnection_warning',
+    )),
+    'WarningAlerts': ('AlertElements', 'Warning Alerts', '#e74c3c', 'Class for warning alert elements', (
+        'alert_item_broken',
+        'alert_creature_starving',
+        'alert_creature_dying',
+        'alert_imprint_available',
+        'alert_gasoline_low',
+        'alert_element_low',
+        'alert_enemy_nearby',
+        'alert_structure_blocked',
+        'alert_taming_complete',
+    )),
+    'PlayerStatsElements': ('UIElement', 'Player Stats Elements', '#ffffff', None, ()),
+    'PlayerStatsPanels': ('PlayerStatsElements', 'Stats Panels', '#ffffff', 'Class for player stats panel elements', (
+        'player_stats_background',
+        'player_stats_header',
+    )),
+    'PlayerHealthStats': ('PlayerStatsElements', 'Health Stats', '#e74c3c', 'Class for player health stat elements', (
+        'player_stat_health',
+        'player_stat_health_value',
+        'player_stat_health_increase_button',
+    )),
+    'PlayerStaminaStats': ('PlayerStatsElements', 'Stamina Stats', '#2ecc71', 'Class for player stamina stat elements', (
+        'player_stat_stamina',
+        'player_stat_stamina_value',
+        'player_stat_stamina_increase_button',
+    )),
+    'PlayerOxygenStats': ('PlayerStatsElements', 'Oxygen Stats', '#3498db', 'Class for player oxygen stat elements', (
+        'player_stat_oxygen',
+        'player_stat_oxygen_value',
+        'player_stat_oxygen_increase_button',
+    )),
+    'PlayerFoodStats': ('PlayerStatsElements', 'Food Stats', '#f1c40f', 'Class for player food stat elements', (
+        'player_stat_food',
+        'player_stat_food_value',
+        'player_stat_food_increase_button',
+    )),
+    'PlayerWaterStats': ('PlayerStatsElements', 'Water Stats', '#3498db', 'Class for player water stat elements', (
+        'player_stat_water',
+        'player_stat_water_value',
+        'player_stat_water_increase_button',
+    )),
+    'PlayerWeightStats': ('PlayerStatsElements', 'Weight Stats', '#95a5a6', 'Class for player weight stat elements', (
+        'player_stat_weight',
+        'player_stat_weight_value',
+        'player_stat_weight_increase_button',
+    )),
+    'PlayerMeleeStats': ('PlayerStatsElements', 'Melee Stats', '#e74c3c', 'Class for player melee stat elements', (
+        'player_stat_melee',
+        'player_stat_melee_value',
+        'player_stat_melee_increase_button',
+    )),
+    'PlayerSpeedStats': ('PlayerStatsElements', 'Speed Stats', '#2ecc71', 'Class for player speed stat elements', (
+        'player_stat_speed',
+        'player_stat_speed_value',
+        'player_stat_speed_increase_button',
+    )),
+    'PlayerFortitudeStats': ('PlayerStatsElements', 'Fortitude Stats', '#e67e22', 'Class for player fortitude stat elements', (
+        'player_stat_fortitude',
+        'player_stat_fortitude_value',
+        'player_stat_fortitude_increase_button',
+    )),
+    'PlayerCraftingStats': ('PlayerStatsElements', 'Crafting Stats', '#9b59b6', 'Class for player crafting stat elements', (
+        'player_stat_crafting',
+        'player_stat_crafting_value',
+        'player_stat_crafting_increase_button',
+    )),
+    'PlayerLevelElements': ('PlayerStatsElements', 'Level Elements', '#f1c40f', 'Class for player level elements', (
+        'player_level_display',
+        'player_xp_bar',
+        'player_xp_to_next_level',
+        'player_levelup_points',
+        'player_total_levels_applied',
+        'player_max_level_warning',
+        'player_stat_tooltip',
+        'player_stat_percentage_bonus',
+        'player_ascension_level',
+        'player_mindwipe_button',
+    )),
+    'PlayerSpecialStats': ('PlayerStatsElements', 'Special Stats', '#3498db', 'Class for player special stat elements', (
+        'player_tek_implant_status',
+        'player_mutation_counter',
+        'player_pheromone_status',
+        'player_reset_stats_button',
+        'player_stat_wild_value',
+        'player_stat_tamed_bonus',
+        'player_stat_level_contribution',
+    )),
+    'TribeElements': ('UIElement', 'Tribe Elements', '#ffffff', None, ()),
+    'TribeManagementPanels': ('TribeElements', 'Management Panels', '#ffffff', 'Class for tribe management panel elements', (
+        'tribe_management_background',
+        'tribe_management_header',
+        'tribe_name_display',
+        'tribe_owner_indicator',
+        'tribe_rank_display',
+    )),
+    'TribeMembers': ('TribeElements', 'Tribe Members', '#ffffff', 'Class for tribe member elements', (
+        'tribe_member_list',
+        'tribe_member_entry',
+        'tribe_member_name',
+        'tribe_member_rank',
+        'tribe_member_level',
+        'tribe_member_online_status',
+        'tribe_member_online',
+        'tribe_member_offline',
+        'tribe_member_last_online',
+    )),
+    'TribeLog': ('TribeElements', 'Tribe Log', '#ffffff', 'Class for tribe log elements', (
+        'tribe_log_tab',
+        'tribe_log_container',
+        'tribe_log_entry',
+        'tribe_log_timestamp',
+        'tribe_log_filter',
+        'tribe_log_clear_button',
+    )),
+    'TribeAlliances': ('TribeElements', 'Tribe Alliances', '#ffffff', 'Class for tribe alliance elements', (
+        'tribe_alliance_tab',
+        'tribe_alliance_list',
+        'tribe_alliance_entry',
+        'tribe_alliance_request_button',
+        'tribe_alliance_accept_button',
+        'tribe_alliance_reject_button',
+    )),
+    'TribeGovernance': ('TribeElements', 'Tribe Governance', '#ffffff', 'Class for tribe governance elements', (
+        'tribe_governance_tab',
+        'tribe_governance_settings',
+        'tribe_rank_management',
+        'tribe_rank_entry',
+        'tribe_rank_name',
+        'tribe_rank_permissions',
+        'tribe_permissions_setting',
+    )),
+    'TribePermissions': ('TribeElements', 'Tribe Permissions', '#ffffff', 'Class for tribe permission elements', (
+        'tribe_permission_Structure',
+        'tribe_permission_access',
+        'tribe_permission_dinos',
+        'tribe_permission_inventories',
+        'tribe_permission_unclaim',
+        'tribe_permission_invite',
+        'tribe_permission_promote',
+        'tribe_permission_demote',
+        'tribe_permission_kick',
+    )),
+    'TribeSettings': ('TribeElements', 'Tribe Settings', '#ffffff', 'Class for tribe setting elements', (
+        'tribe_pincode_setting',
+        'tribe_pincode_toggle',
+        'tribe_tame_claim_setting',
+        'tribe_structure_ownership',
+        'tribe_invitation_button',
+        'tribe_invitation_field',
+        'tribe_kick_button',
+        'tribe_promote_button',
+        'tribe_demote_button',
+        'tribe_leave_button',
+        'tribe_disband_button',
+    )),
+    'TribeAdvancedSettings': ('TribeElements', 'Advanced Settings', '#ffffff', 'Class for tribe advanced setting elements', (
+        'tribe_taxes_setting',
+        'tribe_stats_panel',
+        'tribe_territory_map',
+        'tribe_member_notes',
+        'tribe_message_of_the_day',
+        'tribe_government_type',
+    )),
+    'StructurePlacementElements': ('UIElement', 'Structure Placement Elements', '#ffffff', None, ()),
+    'PlacementValidation': ('StructurePlacementElements', 'Placement Validation', '#ffffff', 'Class for placement validation elements', (
+        'structure_placement_valid',
+        'structure_placement_invalid',
+        'structure_placement_distance_indicator',
+        'structure_placement_angle_indicator',
+        'structure_placement_align_indicator',
+        'structure_placement_underwater_indicator',
+        'structure_placement_no_underwater',
+    )),
+    'PlacementControls': ('StructurePlacementElements', 'Placement Controls', '#ffffff', 'Class for placement control elements', (
+        'structure_placement_rotation_controls',
+        'structure_placement_radius_indicator',
+        'structure_placement_ceiling_height',
+        'structure_placement_wall_height',
+        'structure_placement_water_pipe_connection',
+        'structure_placement_electrical_connection',
+        'structure_placement_level_indicator',
+    )),
+    'PlacementResources': ('StructurePlacementElements', 'Placement Resources', '#ffffff', 'Class for placement resource elements', (
+        'structure_placement_resource_costs',
+        'structure_placement_insufficient_resources',
+        'structure_placement_structure_limit',
+        'structure_placement_platform_limit',
+        'structure_placement_platform_restriction',
+        'structure_placement_tek_requirement',
+        'structure_placement_dlc_requirement',
+        'structure_placement_boss_unlock_required',
+    )),
+    'PlacementTimers': ('StructurePlacementElements', 'Placement Timers', '#ffffff', 'Class for placement timer elements', (
+        'structure_placement_pickup_timer',
+        'structure_placement_demolish_refund',
+        'structure_placement_element_range',
+        'structure_placement_tek_shield_range',
+        'structure_placement_turret_range',
+    )),
+    'PlacementEnvironment': ('StructurePlacementElements', 'Placement Environment', '#ffffff', 'Class for placement environment elements', (
+        'structure_placement_greenhouse_effect',
+        'structure_placement_crop_plot_fertility',
+        'structure_placement_temperature_effect',
+        'structure_placement_air_conditioner_range',
+        'structure_placement_generator_range',
+        'structure_placement_hatchery_range',
+        'structure_placement_trap_trigger_range',
+    )),
+    'PlacementSpecials': ('StructurePlacementElements', 'Placement Specials', '#ffffff', 'Class for placement special elements', (
+        'structure_placement_dino_gate_clearance',
+        'structure_placement_ceiling_stability',
+        'structure_placement_foundation_stability',
+        'structure_placement_pvp_restriction',
+        'structure_placement_foundation_depth',
+        'structure_placement_terrain_flatten',
+        'structure_placement_dedi_storage_selection',
+        'structure_placement_pipe_intersection',
+        'structure_placement_irrigation_status',
+        'structure_placement_wind_turbine_efficiency',
+        'structure_placement_no_build_zone',
+    )),
+    'ElectricalSystemElements': ('UIElement', 'Electrical System Elements', '#ffffff', None, ()),
+    'ElectricalInterface': ('ElectricalSystemElements', 'Electrical Interface', '#ffffff', 'Class for electrical interface elements', (
+        'electrical_system_background',
+        'electrical_system_title',
+        'electrical_system_powered_indicator',
+        'electrical_system_unpowered_indicator',
+        'electrical_system_consumption_display',
+        'electrical_system_generation_display',
+        'electrical_system_range_indicator',
+        'electrical_system_connection_points',
+        'electrical_system_cable_indicator',
+    )),
+    'ElectricalDevices': ('ElectricalSystemElements', 'Electrical Devices', '#ffffff', 'Class for electrical device elements', (
+        'electrical_system_device_list',
+        'electrical_system_device_entry',
+        'electrical_system_device_name',
+        'electrical_system_device_power_draw',
+        'electrical_system_device_status',
+        'electrical_system_device_range',
+        'electrical_system_device_toggle',
+    )),
+    'ElectricalCircuits': ('ElectricalSystemElements', 'Electrical Circuits', '#ffffff', 'Class for electrical circuit elements', (
+        'electrical_system_circuit_group',
+        'electrical_system_circuit_selector',
+        'electrical_system_junction_status',
+        'electrical_system_add_connection_button',
+        'electrical_system_remove_connection_button',
+    )),
+    'ElectricalGenerators': ('ElectricalSystemElements', 'Electrical Generators', '#ffffff', 'Class for electrical generator elements', (
+        'electrical_system_generator_fuel_level',
+        'electrical_system_generator_fuel_slot',
+        'electrical_system_generator_efficiency',
+        'electrical_system_generator_output',
+        'electrical_system_battery_charge',
+        'electrical_system_battery_duration',
+        'electrical_system_battery_charging_indicator',
+        'electrical_system_battery_discharging_indicator',
+        'electrical_system_solar_panel_efficiency',
+        'electrical_system_wind_turbine_efficiency',
+    )),
+    'ElectricalSettings': ('ElectricalSystemElements', 'Electrical Settings', '#ffffff', 'Class for electrical setting elements', (
+        'electrical_system_auto_power_toggle',
+        'electrical_system_timer_setting',
+        'electrical_system_schedule_button',
+        'electrical_system_schedule_entry',
+        'electrical_system_on_time_selector',
+        'electrical_system_off_time_selector',
+        'electrical_system_day_selector',
+        'electrical_system_pin_code_field',
+        'electrical_system_lock_button',
+        'electrical_system_unlock_button',
+        'electrical_system_tribe_access_toggle',
+        'electrical_system_public_access_toggle',
+    )),
+    'ElectricalGrid': ('ElectricalSystemElements', 'Electrical Grid', '#ffffff', 'Class for electrical grid elements', (
+        'electrical_system_power_grid_map',
+        'electrical_system_grid_segment',
+        'electrical_system_redundancy_indicator',
+        'electrical_system_overload_warning',
+        'electrical_system_short_circuit_warning',
+        'electrical_system_gasoline_efficiency',
+        'electrical_system_tek_generator_element',
+        'electrical_system_tek_generator_range',
+        'electrical_system_tek_generator_devices',
+    )),
+    'ElectricalAdvanced': ('ElectricalSystemElements', 'Electrical Advanced', '#ffffff', 'Class for electrical advanced elements', (
+        'electrical_system_device_priority',
+        'electrical_system_unconnected_warning',
+        'electrical_system_device_hover_info',
+        'electrical_system_cable_management',
+        'electrical_system_cable_color_selector',
+        'electrical_system_cable_visibility_toggle',
+        'electrical_system_wireless_connection',
+        'electrical_system_transmitter_status',
+        'electrical_system_receiver_status',
+        'electrical_system_frequency_selector',
+    )),
+    'ElectricalMonitoring': ('ElectricalSystemElements', 'Electrical Monitoring', '#ffffff', 'Class for electrical monitoring elements', (
+        'electrical_system_energy_consumption_graph',
+        'electrical_system_peak_usage_display',
+        'electrical_system_power_fluctuation',
+        'electrical_system_backup_power_status',
+        'electrical_system_alarm_system_button',
+        'electrical_system_alarm_notification',
+        'electrical_system_remote_power_button',
+        'electrical_system_disconnect_button',
+        'electrical_system_reconnect_button',
+        'electrical_system_rename_device_button',
+        'electrical_system_signal_indicator',
+    )),
+    'TransferInterfaceElements': ('UIElement', 'Transfer Interface Elements', '#ffffff', None, ()),
+    'TransferBackground': ('TransferInterfaceElements', 'Transfer Background', '#ffffff', 'Class for transfer background elements', (
+        'transfer_interface_background',
+        'transfer_interface_title',
+    )),
+    'TransferServerList': ('TransferInterfaceElements', 'Server List', '#ffffff', 'Class for transfer server list elements', (
+        'transfer_interface_server_list',
+        'transfer_interface_server_entry',
+        'transfer_interface_server_name',
+        'transfer_interface_server_type',
+        'transfer_interface_server_population',
+        'transfer_interface_server_ping',
+        'transfer_interface_server_version',
+        'transfer_interface_server_official',
+        'transfer_interface_server_unofficial',
+        'transfer_interface_server_modded',
+        'transfer_interface_server_cluster',
+        'transfer_interface_server_favorite',
+        'transfer_interface_server_recent',
+        'transfer_interface_server_password',
+    )),
+    'TransferSearch': ('TransferInterfaceElements', 'Transfer Search', '#ffffff', 'Class for transfer search elements', (
+        'transfer_interface_server_filter',
+        'transfer_interface_search_bar',
+        'transfer_interface_search_icon',
+        'transfer_interface_sort_button',
+        'transfer_interface_sort_options',
+        'transfer_interface_refresh_button',
+    )),
+    'TransferButtons': ('TransferInterfaceElements', 'Transfer Buttons', '#ffffff', 'Class for transfer button elements', (
+        'transfer_interface_join_button',
+        'transfer_interface_cancel_button',
+        'transfer_interface_select_button',
+    )),
+    'TransferTabs': ('TransferInterfaceElements', 'Transfer Tabs', '#ffffff', 'Class for transfer tab elements', (
+        'transfer_interface_player_tab',
+        'transfer_interface_item_tab',
+        'transfer_interface_dino_tab',
+    )),
+    'TransferPlayers': ('TransferInterfaceElements', 'Transfer Players', '#ffffff', 'Class for transfer player elements', (
+        'transfer_interface_player_select',
+        'transfer_interface_player_entry',
+        'transfer_interface_player_name',
+        'transfer_interface_player_level',
+        'transfer_interface_player_tribe',
+        'transfer_interface_player_server',
+        'transfer_interface_player_preview',
+        'transfer_interface_player_last_played',
+        'transfer_interface_download_player_button',
+        'transfer_interface_upload_player_button',
+        'transfer_interface_create_player_button',
+    )),
+    'TransferItems': ('TransferInterfaceElements', 'Transfer Items', '#ffffff', 'Class for transfer item elements', (
+        'transfer_interface_item_storage',
+        'transfer_interface_item_slot',
+        'transfer_interface_item_icon',
+        'transfer_interface_item_name',
+        'transfer_interface_item_count',
+        'transfer_interface_item_tooltip',
+        'transfer_interface_download_item_button',
+        'transfer_interface_upload_item_button',
+    )),
+    'TransferDinos': ('TransferInterfaceElements', 'Transfer Dinos', '#ffffff', 'Class for transfer dino elements', (
+        'transfer_interface_dino_storage',
+        'transfer_interface_dino_entry',
+        'transfer_interface_dino_icon',
+        'transfer_interface_dino_name',
+        'transfer_interface_dino_level',
+        'transfer_interface_dino_gender',
+        'transfer_interface_dino_stats',
+        'transfer_interface_dino_preview',
+        'transfer_interface_download_dino_button',
+        'transfer_interface_upload_dino_button',
+    )),
+    'TransferStatus': ('TransferInterfaceElements', 'Transfer Status', '#ffffff', 'Class for transfer status elements', (
+        'transfer_interface_transfer_cooldown',
+        'transfer_interface_cooldown_icon',
+        'transfer_interface_storage_slots',
+        'transfer_interface_storage_used',
+        'transfer_interface_storage_total',
+        'transfer_interface_weight_indicator',
+        'transfer_interface_weight_limit',
+        'transfer_interface_weight_warning',
+        'transfer_interface_timer_countdown',
+        'transfer_interface_transfer_rules',
+        'transfer_interface_prohibited_items',
+        'transfer_interface_prohibited_dinos',
+        'transfer_interface_event_warning',
+        'transfer_interface_tek_warning',
+        'transfer_interface_element_warning',
+    )),
+    'TransferConfirmation': ('TransferInterfaceElements', 'Transfer Confirmation', '#ffffff', 'Class for transfer confirmation elements', (
+        'transfer_interface_connection_status',
+        'transfer_interface_transfer_progress',
+        'transfer_interface_transfer_error',
+        'transfer_interface_confirmation_prompt',
+        'transfer_interface_confirm_button',
+        'transfer_interface_decline_button',
+        'transfer_interface_password_field',
+    )),
+    'TransferFilters': ('TransferInterfaceElements', 'Transfer Filters', '#ffffff', 'Class for transfer filter elements', (
+        'transfer_interface_cluster_filter',
+        'transfer_interface_official_filter',
+        'transfer_interface_unofficial_filter',
+        'transfer_interface_favorites_filter',
+        'transfer_interface_recent_filter',
+        'transfer_interface_history_button',
+        'transfer_interface_history_list',
+        'transfer_interface_history_entry',
+    )),
+    'TransferServerInfo': ('TransferInterfaceElements', 'Server Info', '#ffffff', 'Class for transfer server info elements', (
+        'transfer_interface_server_info_panel',
+        'transfer_interface_map_indicator',
+        'transfer_interface_rates_display',
+        'transfer_interface_event_display',
+        'transfer_interface_server_rules',
+        'transfer_interface_server_mods',
+        'transfer_interface_mod_entry',
+        'transfer_interface_tribute_requirements',
+        'transfer_interface_tribute_slot',
+    )),
+    'SettingsMenuElements': ('UIElement', 'Settings Menu Elements', '#ffffff', None, ()),
+    'SettingsBackground': ('SettingsMenuElements', 'Settings Background', '#ffffff', 'Class for settings background elements', (
+        'settings_menu_background',
+        'settings_menu_title',
+    )),
+    'SettingsTabs': ('SettingsMenuElements', 'Settings Tabs', '#ffffff', 'Class for settings tab elements', (
+        'settings_category_tabs',
+        'settings_tab_general',
+        'settings_tab_graphics',
+        'settings_tab_audio',
+        'settings_tab_controls',
+        'settings_tab_game',
+        'settings_tab_server',
+        'settings_tab_interface',
+        'settings_tab_advanced',
+    )),
+    'SettingsSections': ('SettingsMenuElements', 'Settings Sections', '#ffffff', 'Class for settings section elements', (
+        'settings_section_header',
+        'settings_option_row',
+        'settings_option_name',
+        'settings_option_description',
+        'settings_option_value',
+    )),
+    'SettingsControls': ('SettingsMenuElements', 'Settings Controls', '#ffffff', 'Class for settings control elements', (
+        'settings_slider_control',
+        'settings_slider_value',
+        'settings_dropdown_control',
+        'settings_dropdown_option',
+        'settings_checkbox_control',
+        'settings_checkbox_checked',
+        'settings_checkbox_unchecked',
+        'settings_radio_button',
+        'settings_radio_selected',
+        'settings_radio_unselected',
+        'settings_input_field',
+        'settings_input_value',
+        'settings_button_control',
+    )),
+    'SettingsActions': ('SettingsMenuElements', 'Settings Actions', '#ffffff', 'Class for settings action elements', (
+        'settings_reset_button',
+        'settings_apply_button',
+        'settings_save_button',
+        'settings_cancel_button',
+    )),
+    'HolidayEventElements': ('UIElement', 'Holiday Event Elements', '#ffffff', None, ()),
+    'HolidayInterfaces': ('HolidayEventElements', 'Holiday Interfaces', '#ffffff', 'Class for holiday interface elements', (
+        'holiday_event_interface',
+        'easter_egg_hunt_tracker',
+        'summer_bash_interface',
+        'fear_evolved_interface',
+        'winter_wonderland_interface',
+        'valentines_day_interface',
+        'eggcellent_adventure_ui',
+    )),
+    'GenesisMissions': ('HolidayEventElements', 'Genesis Missions', '#ffffff', 'Class for Genesis mission elements', (
+        'genesis_race_timer',
+        'genesis_hunt_tracker',
+        'genesis_fishing_meter',
+    )),
+    'TekElements': ('UIElement', 'Tek Elements', '#00ccff', None, ()),
+    'TekInterfaces': ('TekElements', 'Tek Interfaces', '#00ccff', 'Class for tek interface elements', (
+        'tek_generator_interface',
+        'tek_crop_plot_interface',
+        'creature_camera_view',
+        'tek_sensor_interface',
+        'tek_remote_camera',
+        'holo_projector_interface',
+        'megachelon_planter',
+    )),
+    'TekCreatureUI': ('TekElements', 'Tek Creature UI', '#00ccff', 'Class for tek creature UI elements', (
+        'aquatic_tames_oxygen_interface',
+        'astrodelphis_energy',
+        'noglin_brain_jack_interface',
+        'exo_mek_interface',
+        'maewing_baby_milk_meter',
+        'shadowmane_charge_meter',
+        'gacha_crafting_interface',
+        'stryder_interface',
+        'enforcer_interface',
+    )),
+    'TekResources': ('TekElements', 'Tek Resources', '#00ccff', 'Class for tek resource elements', (
+        'tek_element_icon',
+        'tek_element_count',
+        'tek_element_shard_icon',
+        'tek_element_shard_count',
+        'tek_element_dust_icon',
+        'tek_element_dust_count',
+    )),
+    'TekTransmitter': ('TekElements', 'Tek Transmitter', '#00ccff', 'Class for tek transmitter elements', (
+        'tek_transmitter_interface',
+        'tek_transmitter_upload_tab',
+        'tek_transmitter_download_tab',
+        'tek_transmitter_creatures_tab',
+        'tek_transmitter_items_tab',
+        'tek_transmitter_data_tab',
+        'tek_transmitter_upload_timer',
+        'tek_transmitter_download_timer',
+        'tek_transmitter_upload_button',
+        'tek_transmitter_download_button',
+        'tek_transmitter_item_list',
+        'tek_transmitter_creature_list',
+    )),
+    'TekTeleporter': ('TekElements', 'Tek Teleporter', '#00ccff', 'Class for tek teleporter elements', (
+        'tek_teleporter_interface',
+        'tek_teleporter_location_list',
+        'tek_teleporter_location_entry',
+        'tek_teleporter_teleport_button',
+        'tek_teleporter_add_location_button',
+        'tek_teleporter_rename_button',
+        'tek_teleporter_remove_button',
+    )),
+    'TekAdvancedStructures': ('TekElements', 'Advanced Structures', '#00ccff', 'Class for tek advanced structure elements', (
+        'tek_replicator_interface',
+        'tek_replicator_crafting_tab',
+        'tek_replicator_inventory_tab',
+        'tek_replicator_element_slot',
+        'tek_cloning_interface',
+        'tek_cloning_dino_preview',
+        'tek_cloning_progress_bar',
+        'tek_cloning_cost_display',
+        'tek_cloning_start_button',
+        'tek_cloning_cancel_button',
+    )),
+    'TekStorage': ('TekElements', 'Tek Storage', '#00ccff', 'Class for tek storage elements', (
+        'tek_dedicated_storage',
+        'tek_dedicated_storage_type',
+        'tek_dedicated_storage_count',
+        'tek_dedicated_storage_capacity',
+    )),
+    'TekGenerator': ('TekElements', 'Tek Generator', '#00ccff', 'Class for tek generator elements', (
+        'tek_generator_interface',
+        'tek_generator_range_display',
+        'tek_generator_element_level',
+        'tek_generator_power_indicator',
+        'tek_generator_connected_devices',
+    )),
+    'TekShield': ('TekElements', 'Tek Shield', '#00ccff', 'Class for tek shield elements', (
+        'tek_shield_interface',
+        'tek_shield_range_display',
+        'tek_shield_strength_display',
+        'tek_shield_damage_indicator',
+    )),
+    'TekTrough': ('TekElements', 'Tek Trough', '#00ccff', 'Class for tek trough elements', (
+        'tek_trough_interface',
+        'tek_trough_food_list',
+        'tek_trough_range_display',
+        'tek_trough_status_indicator',
+    )),
+    'TekVehicles': ('TekElements', 'Tek Vehicles', '#00ccff', 'Class for tek vehicle elements', (
+        'tek_hover_skiff_controls',
+        'tek_hover_skiff_altitude',
+        'tek_hover_skiff_speed',
+        'tek_hover_skiff_fuel',
+        'tek_hover_skiff_passenger_list',
+    )),
+    'TekSensor': ('TekElements', 'Tek Sensor', '#00ccff', 'Class for tek sensor elements', (
+        'tek_sensor_interface',
+        'tek_sensor_range_setting',
+        'tek_sensor_mode_setting',
+        'tek_sensor_entity_filter',
+        'tek_sensor_alert_setting',
+    )),
+    'TekVisor': ('TekElements', 'Tek Visor', '#00ccff', 'Class for tek visor elements', (
+        'tek_visor_overlay',
+        'tek_visor_mode_selector',
+        'tek_visor_night_vision',
+        'tek_visor_entity_scan',
+        'tek_visor_resource_scan',
+        'tek_visor_stats_display',
+        'tek_visor_range_indicator',
+        'tek_visor_battery_indicator',
+    )),
+    'TekArmor': ('TekElements', 'Tek Armor', '#00ccff', 'Class for tek armor elements', (
+        'tek_gauntlet_punch_charge',
+        'tek_gauntlet_cooldown',
+        'tek_boots_speed_indicator',
+        'tek_boots_jump_indicator',
+        'tek_chestpiece_flight_fuel',
+        'tek_chestpiece_flight_speed',
+        'tek_chestpiece_flight_altitude',
+    )),
+    'TekWeapons': ('TekElements', 'Tek Weapons', '#00ccff', 'Class for tek weapon elements', (
+        'tek_rifle_charge_indicator',
+        'tek_rifle_mode_selector',
+        'tek_rifle_ammo_display',
+        'tek_grenade_launcher_charge',
+    )),
+    'TekCreatures': ('TekElements', 'Tek Creatures', '#00ccff', 'Class for tek creature elements', (
+        'tek_stryder_interface',
+        'tek_stryder_module_slots',
+        'tek_stryder_resource_capacity',
+        'tek_stryder_farming_indicator',
+        'tek_megachelon_platform',
+        'tek_megachelon_planter',
+        'tek_megachelon_greenhouse',
+        'tek_enforce_mode_interface',
+    )),
+    'BossArenaElements': ('UIElement', 'Boss Arena Elements', '#ffffff', None, ()),
+    'BossEntryInterface': ('BossArenaElements', 'Entry Interface', '#ffffff', 'Class for boss entry interface elements', (
+        'boss_arena_entry_interface',
+        'boss_arena_tribute_slots',
+        'boss_arena_artifact_slots',
+        'boss_arena_player_list',
+        'boss_arena_tame_list',
+        'boss_arena_difficulty_selector',
+        'boss_arena_timer_countdown',
+        'boss_arena_start_button',
+        'boss_arena_cancel_button',
+    )),
+    'BossFightElements': ('BossArenaElements', 'Boss Fight', '#ffffff', 'Class for boss fight elements', (
+        'boss_fight_timer',
+        'boss_fight_player_list',
+        'boss_fight_player_entry',
+        'boss_fight_tame_list',
+        'boss_fight_tame_entry',
+        'boss_health_bar',
+        'boss_health_percentage',
+        'boss_name_display',
+        'boss_damage_indicator',
+    )),
+    'BossAttackWarnings': ('BossArenaElements', 'Attack Warnings', '#ffffff', 'Class for boss attack warning elements', (
+        'boss_attack_warning',
+        'boss_special_attack_warning',
+        'boss_minion_spawned_alert',
+        'boss_environment_hazard',
+        'boss_arena_safe_zone',
+        'boss_arena_danger_zone',
+        'boss_phase_transition',
+    )),
+    'BossArenaExit': ('BossArenaElements', 'Arena Exit', '#ffffff', 'Class for boss arena exit elements', (
+        'boss_arena_exit_timer',
+        'boss_arena_teleport_indicator',
+        'boss_arena_item_reward_list',
+        'boss_arena_tekgram_unlocked',
+        'boss_arena_defeat_message',
+        'boss_arena_victory_message',
+        'boss_arena_disconnect_warning',
+        'boss_arena_player_death_marker',
+        'boss_arena_respawn_timer',
+        'boss_arena_spectator_mode',
+        'boss_arena_damage_leaderboard',
+    )),
+    'BossArtifactElements': ('BossArenaElements', 'Artifact Elements', '#ffffff', 'Class for boss artifact elements', (
+        'boss_artifact_collection_notification',
+        'boss_arena_tek_suit_activation',
+        'boss_arena_element_reward',
+        'boss_arena_experience_reward',
+        'boss_arena_ascension_cutscene',
+        'boss_arena_reward_multiplier',
+        'boss_arena_cave_progress',
+        'boss_arena_required_items_list',
+        'boss_arena_missing_items',
+        'boss_arena_element_buffer',
+    )),
+    'BossDifficultyElements': ('BossArenaElements', 'Difficulty Elements', '#ffffff', 'Class for boss difficulty elements', (
+        'boss_arena_difficulty_icon',
+        'boss_arena_previous_record',
+        'boss_arena_tribe_limit',
+        'boss_arena_dino_limit',
+        'boss_arena_dino_type_restriction',
+        'boss_arena_enrage_timer',
+        'boss_arena_cinematic_skip',
+    )),
+    'EventInterfaceElements': ('UIElement', 'Event Interface Elements', '#ffffff', None, ()),
+    'EventBackground': ('EventInterfaceElements', 'Event Background', '#ffffff', 'Class for event background elements', (
+        'event_interface_background',
+        'event_title_header',
+        'event_description_text',
+        'event_timer_countdown',
+        'event_progress_bar',
+    )),
+    'EventObjectives': ('EventInterfaceElements', 'Event Objectives', '#ffffff', 'Class for event objective elements', (
+        'event_objective_list',
+        'event_objective_entry',
+        'event_objective_complete_marker',
+        'event_reward_preview',
+        'event_reward_list',
+        'event_reward_item',
+    )),
+    'EventLeaderboard': ('EventInterfaceElements', 'Event Leaderboard', '#ffffff', 'Class for event leaderboard elements', (
+        'event_leaderboard',
+        'event_leaderboard_entry',
+        'event_participation_count',
+        'event_difficulty_indicator',
+        'event_location_marker',
+    )),
+    'EventControls': ('EventInterfaceElements', 'Event Controls', '#ffffff', 'Class for event control elements', (
+        'event_start_button',
+        'event_cancel_button',
+        'event_restart_button',
+    )),
+    'DeathScreenElements': ('UIElement', 'Death Screen Elements', '#ffffff', None, ()),
+    'DeathScreenBackground': ('DeathScreenElements', 'Death Screen Background', '#ffffff', 'Class for death screen background elements', (
+        'death_screen_background',
+        'death_screen_title',
+        'death_message_display',
+        'death_level_lost_indicator',
+        'death_item_lost_list',
+        'death_item_lost_entry',
+    )),
+    'DeathRespawnElements': ('DeathScreenElements', 'Respawn Elements', '#ffffff', 'Class for death respawn elements', (
+        'death_respawn_timer',
+        'death_location_coordinates',
+        'death_map_marker',
+        'death_respawn_button',
+        'death_harvest_body_indicator',
+        'death_spectate_button',
+        'death_tribe_notify_indicator',
+    )),
+    'DeathRespawnLocations': ('DeathScreenElements', 'Respawn Locations', '#ffffff', 'Class for death respawn location elements', (
+        'death_respawn_location_list',
+        'death_respawn_location_entry',
+        'death_respawn_bed_entry',
+        'death_respawn_sleeping_bag_entry',
+        'death_respawn_random_entry',
+        'death_respawn_location_cooldown',
+        'death_respawn_location_icon',
+        'death_respawn_location_name',
+        'death_respawn_region_selector',
+        'death_respawn_map_view',
+    )),
+    'DeathCorpseElements': ('DeathScreenElements', 'Corpse Elements', '#ffffff', 'Class for death corpse elements', (
+        'death_body_decay_timer',
+        'death_tribe_corpse_marker',
+        'death_tribe_corpse_name',
+        'death_respawn_search_bar',
+        'death_respawn_filter',
+        'death_respawn_sort_button',
+    )),
+    'DeathDetailsElements': ('DeathScreenElements', 'Death Details', '#ffffff', 'Class for death details elements', (
+        'death_obituary_text',
+        'death_killed_by_display',
+        'death_tribe_bed_category',
+        'death_personal_bed_category',
+        'death_public_bed_category',
+        'death_respawn_header',
+        'death_screen_tip',
+    )),
+    'DeathScreenControls': ('DeathScreenElements', 'Death Screen Controls', '#ffffff', 'Class for death screen control elements', (
+        'death_screen_close_button',
+        'death_item_recovery_info',
+        'death_xp_penalty_display',
+        'death_player_level_display',
+        'death_tribe_icon',
+        'death_transfer_warning',
+        'death_retrievable_body_marker',
+        'death_retrievable_body_timer',
+    )),
+    'DeathCauseElements': ('DeathScreenElements', 'Death Cause', '#ffffff', 'Class for death cause elements', (
+        'death_environment_killed',
+        'death_player_killed',
+        'death_creature_killed',
+        'death_suicide_indicator',
+        'death_disconnect_warning',
+        'death_respawn_confirmation',
+        'death_item_protected_tag',
+        'death_reconnect_button',
+        'death_return_to_menu',
+    )),
+    'BreedingInterfaceElements': ('UIElement', 'Breeding Interface Elements', '#ffffff', None, ()),
+    'BreedingBackground': ('BreedingInterfaceElements', 'Breeding Background', '#ffffff', 'Class for breeding background elements', (
+        'breeding_interface_background',
+        'breeding_interface_header',
+        'breeding_male_stats_panel',
+        'breeding_female_stats_panel',
+        'breeding_compatibility_indicator',
+    )),
+    'BreedingControls': ('BreedingInterfaceElements', 'Breeding Controls', '#ffffff', 'Class for breeding control elements', (
+        'breeding_enable_mating_button',
+        'breeding_disable_mating_button',
+        'breeding_mating_progress_bar',
+        'breeding_mating_cooldown_timer',
+        'breeding_gestation_progress_bar',
+        'breeding_gestation_timer',
+    )),
+    'BreedingEggs': ('BreedingInterfaceElements', 'Breeding Eggs', '#ffffff', 'Class for breeding egg elements', (
+        'breeding_egg_incubation_bar',
+        'breeding_egg_incubation_timer',
+        'breeding_egg_temperature_indicator',
+        'breeding_egg_temperature_bar',
+        'breeding_egg_too_hot_warning',
+        'breeding_egg_too_cold_warning',
+        'breeding_egg_health_bar',
+        'breeding_egg_inventory_icon',
+        'breeding_egg_fertility_status',
+        'breeding_egg_claim_button',
+        'breeding_egg_destroy_button',
+        'breeding_egg_pickup_button',
+        'breeding_egg_drop_button',
+        'breeding_egg_spoil_timer',
+    )),
+    'BreedingMutations': ('BreedingInterfaceElements', 'Breeding Mutations', '#ffffff', 'Class for breeding mutation elements', (
+        'breeding_mutation_indicator',
+        'breeding_mutation_counter',
+        'breeding_baby_claim_prompt',
+        'breeding_baby_name_field',
+    )),
+    'BreedingImprinting': ('BreedingInterfaceElements', 'Breeding Imprinting', '#ffffff', 'Class for breeding imprinting elements', (
+        'breeding_baby_imprint_status',
+        'breeding_imprint_progress_bar',
+        'breeding_imprint_quality',
+        'breeding_imprint_timer',
+        'breeding_imprint_action_icon',
+        'breeding_imprint_success_indicator',
+    )),
+    'BreedingMaturation': ('BreedingInterfaceElements', 'Breeding Maturation', '#ffffff', 'Class for breeding maturation elements', (
+        'breeding_maturation_progress_bar',
+        'breeding_maturation_timer',
+        'breeding_food_consumption_rate',
+        'breeding_juvenile_food_warning',
+        'breeding_baby_inventory_button',
+        'breeding_food_trough_link',
+    )),
+    'BreedingAncestry': ('BreedingInterfaceElements', 'Breeding Ancestry', '#ffffff', 'Class for breeding ancestry elements', (
+        'breeding_ancestry_button',
+        'breeding_ancestry_tree',
+        'breeding_ancestry_entry',
+        'breeding_stat_inheritance_display',
+        'breeding_stat_mutation_highlight',
+        'breeding_color_inheritance_display',
+        'breeding_color_region_indicator',
+        'breeding_region_mutation_highlight',
+        'breeding_best_stat_indicator',
+    )),
+    'BreedingStatusInformation': ('BreedingInterfaceElements', 'Status Information', '#ffffff', 'Class for breeding status information elements', (
+        'breeding_mate_boost_indicator',
+        'breeding_creature_gender_icon',
+        'breeding_creature_gender_text',
+        'breeding_growth_phases_display',
+        'breeding_growth_phase_indicator',
+        'breeding_cuddle_button',
+        'breeding_walk_button',
+        'breeding_feed_button',
+    )),
+    'BreedingAdvanced': ('BreedingInterfaceElements', 'Breeding Advanced', '#ffffff', 'Class for breeding advanced elements', (
+        'breeding_cryopod_timer',
+        'breeding_cryosickness_timer',
+        'breeding_clone_vs_parent',
+        'breeding_generation_counter',
+        'breeding_linebreeding_indicator',
+        'breeding_mutation_probability',
+        'breeding_breeding_cooldown',
+        'breeding_wandering_warning',
+    )),
+    'StructureElements': ('UIElement', 'Structure Storage Elements', '#ffffff', None, ()),
+    'StructureBackground': ('StructureElements', 'Structure Background', '#ffffff', 'Class for structure background elements', (
+        'structure_background',
+        'structure_title',
+        'structure_type_icon',
+        'structure_slots_count',
+        'structure_weight_indicator',
+        'structure_weight_bar',
+        'structure_current_weight',
+        'structure_max_weight',
+    )),
+    'StructureSearch': ('StructureElements', 'Structure Search', '#ffffff', 'Class for structure search elements', (
+        'structure_search_bar',
+        'structure_search_icon',
+        'structure_search_results',
+        'structure_close_button',
+        'structure_transfer_all_button',
+        'structure_transfer_one_button',
+        'structure_sort_button',
+    )),
+    'StructureSlots': ('StructureElements', 'Structure Slots', '#ffffff', 'Class for structure slot elements', (
+        'structure_slot_empty',
+        'structure_slot_filled',
+        'structure_item_icon',
+        'structure_item_name',
+        'structure_item_count',
+        'structure_item_durability',
+        'structure_item_quality',
+        'structure_item_spoil_timer',
+        'structure_grid_view',
+        'structure_list_view',
+        'structure_filter_button',
+        'structure_filter_dropdown',
+    )),
+    'StructureScrolling': ('StructureElements', 'Structure Scrolling', '#ffffff', 'Class for structure scrolling elements', (
+        'structure_scroll_bar',
+        'structure_scroll_up_button',
+        'structure_scroll_down_button',
+        'structure_tab_inventory',
+        'structure_tab_contents',
+        'structure_pin_code_field',
+        'structure_locked_indicator',
+        'structure_unlocked_indicator',
+    )),
+    'StructureAccess': ('StructureElements', 'Structure Access', '#ffffff', 'Class for structure access elements', (
+        'structure_tribe_access_icon',
+        'structure_public_access_icon',
+        'structure_remote_access_icon',
+        'structure_auto_sort_toggle',
+        'structure_transfer_mode_toggle',
+        'structure_preserve_multiplier',
+        'structure_powered_indicator',
+        'structure_unpowered_indicator',
+    )),
+    'StructureManagement': ('StructureElements', 'Structure Management', '#ffffff', 'Class for structure management elements', (
+        'structure_rename_button',
+        'structure_destroy_button',
+        'structure_repair_button',
+        'structure_pickup_timer',
+        'structure_demolish_timer',
+        'structure_lock_button',
+        'structure_unlock_button',
+        'structure_tribe_only_toggle',
+        'structure_pin_code_toggle',
+        'structure_unlock_for_all_toggle',
+    )),
+    'StructureFolders': ('StructureElements', 'Structure Folders', '#ffffff', 'Class for structure folder elements', (
+        'structure_folder_create_button',
+        'structure_folder_icon',
+        'structure_folder_name',
+        'structure_category_tabs',
+        'structure_category_icon',
+        'structure_context_menu',
+        'structure_damage_indicator',
+        'structure_health_bar',
+        'structure_transfer_history',
+        'structure_item_tooltip',
+        'structure_attachments_tab',
+        'structure_attachment_slot',
+        'structure_link_indicator',
+        'structure_slots_upgrade',
+    )),
+    'CraftingStationElements': ('UIElement', 'Crafting Station Elements', '#ffffff', None, ()),
+    'CraftingStationBackground': ('CraftingStationElements', 'Crafting Station Background', '#ffffff', 'Class for crafting station background elements', (
+        'crafting_station_background',
+        'crafting_station_title',
+        'crafting_station_type_icon',
+        'crafting_station_level_indicator',
+        'crafting_station_tab_inventory',
+        'crafting_station_tab_crafting',
+        'crafting_station_tab_engrams',
+        'crafting_station_slots_count',
+        'crafting_station_weight_indicator',
+        'crafting_station_weight_bar',
+        'crafting_station_current_weight',
+        'crafting_station_max_weight',
+    )),
+    'CraftingStationSearch': ('CraftingStationElements', 'Crafting Station Search', '#ffffff', 'Class for crafting station search elements', (
+        'crafting_station_search_bar',
+        'crafting_station_search_results',
+        'crafting_station_close_button',
+        'crafting_station_transfer_all_button',
+        'crafting_station_sort_button',
+        'crafting_station_slot_empty',
+        'crafting_station_slot_filled',
+        'crafting_station_item_icon',
+        'crafting_station_item_count',
+        'crafting_station_item_durability',
+    )),
+    'CraftingStationItems': ('CraftingStationElements', 'Crafting Station Items', '#ffffff', 'Class for crafting station item elements', (
+        'crafting_station_crafting_list',
+        'crafting_station_crafting_item',
+        'crafting_station_blueprint_crafting',
+        'crafting_station_materials_required',
+        'crafting_station_materials_available',
+        'crafting_station_materials_missing',
+        'crafting_station_craft_button',
+        'crafting_station_craft_all_button',
+        'crafting_station_craft_amount_selector',
+    )),
+    'CraftingStationQueue': ('CraftingStationElements', 'Crafting Station Queue', '#ffffff', 'Class for crafting station queue elements', (
+        'crafting_station_crafting_queue',
+        'crafting_station_queue_item',
+        'crafting_station_progress_bar',
+        'crafting_station_time_remaining',
+        'crafting_station_speed_multiplier',
+        'crafting_station_fuel_slot',
+        'crafting_station_fuel_icon',
+        'crafting_station_fuel_level',
+        'crafting_station_powered_indicator',
+        'crafting_station_unpowered_indicator',
+    )),
+    'CraftingStationModifiers': ('CraftingStationElements', 'Crafting Station Modifiers', '#ffffff', 'Class for crafting station modifier elements', (
+        'crafting_station_blueprint_modifier',
+        'crafting_station_skill_modifier',
+        'crafting_station_bulk_craft_toggle',
+        'crafting_station_resource_pull_button',
+        'crafting_station_craft_one_button',
+        'crafting_station_pin_recipe_button',
+        'crafting_station_unpinned_recipes',
+        'crafting_station_pinned_recipes',
+        'crafting_station_recipe_pin_icon',
+        'crafting_station_queue_cancel_button',
+        'crafting_station_quick_access_slots',
+    )),
+    'CraftingStationFilters': ('CraftingStationElements', 'Crafting Station Filters', '#ffffff', 'Class for crafting station filter elements', (
+        'crafting_station_filter_button',
+        'crafting_station_filter_dropdown',
+        'crafting_station_recipe_level_requirement',
+        'crafting_station_recipe_station_requirement',
+        'crafting_station_recipe_dlc_requirement',
+        'crafting_station_tek_requirement',
+        'crafting_station_custom_recipe_button',
+        'crafting_station_recipe_slider',
+        'crafting_station_recipe_ingredient_slot',
+        'crafting_station_recipe_name_field',
+        'crafting_station_recipe_save_button',
+        'crafting_station_recipe_load_button',
+        'crafting_station_recipe_delete_button',
+        'crafting_station_recipe_list',
+        'crafting_station_recipe_entry',
+    )),
+    'CraftingStationSlots': ('CraftingStationElements', 'Crafting Station Slots', '#ffffff', 'Class for crafting station slot elements', (
+        'crafting_station_input_slots',
+        'crafting_station_output_slots',
+        'crafting_station_blueprint_slots',
+        'crafting_station_ingredient_tooltip',
+        'crafting_station_craft_amount_field',
+        'crafting_station_learning_progress',
+        'crafting_station_durability_crafting',
+        'crafting_station_upgrade_slot',
+        'crafting_station_augment_slot',
+    )),
+    'PaintingInterfaceElements': ('UIElement', 'Painting Interface Elements', '#ffffff', None, ()),
+    'PaintingBackground': ('PaintingInterfaceElements', 'Painting Background', '#ffffff', 'Class for painting background elements', (
+        'painting_interface_background',
+        'painting_interface_title',
+        'painting_interface_canvas',
+        'painting_interface_color_palette',
+        'painting_interface_color_picker',
+        'painting_interface_color_preview',
+    )),
+    'PaintingColorControls': ('PaintingInterfaceElements', 'Color Controls', '#ffffff', 'Class for painting color control elements', (
+        'painting_interface_rgb_sliders',
+        'painting_interface_red_slider',
+        'painting_interface_green_slider',
+        'painting_interface_blue_slider',
+        'painting_interface_hue_slider',
+        'painting_interface_saturation_slider',
+        'painting_interface_value_slider',
+        'painting_interface_brush_size_slider',
+        'painting_interface_brush_preview',
+        'painting_interface_opacity_slider',
+    )),
+    'PaintingTools': ('PaintingInterfaceElements', 'Painting Tools', '#ffffff', 'Class for painting tool elements', (
+        'painting_interface_tool_selector',
+        'painting_interface_brush_tool',
+        'painting_interface_eraser_tool',
+        'painting_interface_dropper_tool',
+        'painting_interface_fill_tool',
+        'painting_interface_line_tool',
+        'painting_interface_rectangle_tool',
+        'painting_interface_circle_tool',
+        'painting_interface_spray_tool',
+        'painting_interface_text_tool',
+        'painting_interface_mirror_tool',
+    )),
+    'PaintingRegions': ('PaintingInterfaceElements', 'Painting Regions', '#ffffff', 'Class for painting region elements', (
+        'painting_interface_region_selector',
+        'painting_interface_region_1_button',
+        'painting_interface_region_2_button',
+        'painting_interface_region_3_button',
+        'painting_interface_region_4_button',
+        'painting_interface_region_5_button',
+        'painting_interface_region_6_button',
+        'painting_interface_region_indicator',
+    )),
+    'PaintingActions': ('PaintingInterfaceElements', 'Painting Actions', '#ffffff', 'Class for painting action elements', (
+        'painting_interface_save_button',
+        'painting_interface_load_button',
+        'painting_interface_clear_button',
+        'painting_interface_undo_button',
+        'painting_interface_redo_button',
+        'painting_interface_saved_paintings',
+        'painting_interface_painting_entry',
+        'painting_interface_painting_preview',
+        'painting_interface_painting_name',
+        'painting_interface_rename_button',
+        'painting_interface_delete_button',
+        'painting_interface_import_button',
+        'painting_interface_export_button',
+        'painting_interface_copy_button',
+        'painting_interface_paste_button',
+    )),
+    'PaintingCanvasControls': ('PaintingInterfaceElements', 'Canvas Controls', '#ffffff', 'Class for painting canvas control elements', (
+        'painting_interface_grid_toggle',
+        'painting_interface_grid_size_slider',
+        'painting_interface_snap_to_grid_toggle',
+        'painting_interface_canvas_zoom_in',
+        'painting_interface_canvas_zoom_out',
+        'painting_interface_canvas_pan_tool',
+        'painting_interface_canvas_reset_view',
+    )),
+    'PaintingBrushSettings': ('PaintingInterfaceElements', 'Brush Settings', '#ffffff', 'Class for painting brush setting elements', (
+        'painting_interface_brush_style_selector',
+        'painting_interface_brush_hardness_slider',
+        'painting_interface_brush_spacing_slider',
+        'painting_interface_brush_angle_slider',
+        'painting_interface_brush_preview_window',
+        'painting_interface_texture_selector',
+        'painting_interface_texture_preview',
+    )),
+    'PaintingLayers': ('PaintingInterfaceElements', 'Painting Layers', '#ffffff', 'Class for painting layer elements', (
+        'painting_interface_layer_list',
+        'painting_interface_layer_entry',
+        'painting_interface_layer_visibility',
+        'painting_interface_layer_opacity',
+        'painting_interface_add_layer_button',
+        'painting_interface_delete_layer_button',
+        'painting_interface_merge_layers_button',
+        'painting_interface_layer_order_up',
+        'painting_interface_layer_order_down',
+        'painting_interface_layer_name',
+    )),
+    'PaintingText': ('PaintingInterfaceElements', 'Painting Text', '#ffffff', 'Class for painting text elements', (
+        'painting_interface_text_input_field',
+        'painting_interface_font_selector',
+        'painting_interface_font_size_slider',
+        'painting_interface_text_bold_toggle',
+        'painting_interface_text_italic_toggle',
+        'painting_interface_text_underline_toggle',
+        'painting_interface_text_alignment',
+    )),
+    'PaintingTemplates': ('PaintingInterfaceElements', 'Painting Templates', '#ffffff', 'Class for painting template elements', (
+        'painting_interface_tribe_logo_template',
+        'painting_interface_template_selector',
+        'painting_interface_flag_template',
+        'painting_interface_pattern_selector',
+        'painting_interface_apply_template_button',
+        'painting_interface_recent_colors',
+        'painting_interface_custom_colors',
+        'painting_interface_add_to_custom_button',
+    )),
+    'CaveElements': ('UIElement', 'Cave Elements', '#ffffff', None, ()),
+    'CaveEntranceElements': ('CaveElements', 'Cave Entrance', '#ffffff', 'Class for cave entrance elements', (
+        'cave_entrance_marker',
+        'cave_entrance_name_display',
+        'cave_entrance_difficulty_rating',
+        'cave_entrance_level_requirement',
+        'cave_entrance_temperature_warning',
+        'cave_entrance_resource_indicator',
+        'cave_entrance_artifact_indicator',
+        'cave_entrance_gas_warning',
+        'cave_entrance_water_warning',
+        'cave_entrance_dino_restriction',
+        'cave_entrance_coordinates',
+        'cave_entrance_transfer_prompt',
+    )),
+    'CaveHazardElements': ('CaveElements', 'Cave Hazards', '#ffffff', 'Class for cave hazard elements', (
+        'cave_gas_meter',
+        'cave_gas_warning_icon',
+        'cave_gas_mask_indicator',
+        'cave_radiation_meter',
+        'cave_radiation_warning_icon',
+        'cave_radiation_suit_indicator',
+        'cave_temperature_extreme_indicator',
+        'cave_hazard_warning_icon',
+    )),
+    'CaveArtifactElements': ('CaveElements', 'Cave Artifacts', '#ffffff', 'Class for cave artifact elements', (
+        'cave_artifact_glow',
+        'cave_artifact_container',
+        'cave_artifact_name',
+        'cave_artifact_description',
+        'cave_artifact_collect_prompt',
+        'cave_artifact_collect_button',
+        'cave_artifact_cooldown_timer',
+        'cave_artifact_inventory_icon',
+    )),
+    'CaveNavigationElements': ('CaveElements', 'Cave Navigation', '#ffffff', 'Class for cave navigation elements', (
+        'cave_exit_marker',
+        'cave_exit_distance',
+        'cave_loot_crate_marker',
+        'cave_loot_crate_timer',
+        'cave_map_overlay',
+        'cave_map_corridor',
+        'cave_map_chamber',
+        'cave_map_water_area',
+        'cave_map_hazard_area',
+        'cave_depth_indicator',
+        'cave_altitude_indicator',
+    )),
+    'CaveStructuralElements': ('CaveElements', 'Cave Structure', '#ffffff', 'Class for cave structural elements', (
+        'cave_structural_integrity',
+        'cave_ceiling_collapse_warning',
+        'cave_stalactite_warning',
+        'cave_floor_collapse_warning',
+        'cave_enemy_spawner_marker',
+        'cave_enemy_spawner_active',
+        'cave_enemy_spawner_cooldown',
+    )),
+    'CaveBossElements': ('CaveElements', 'Cave Boss', '#ffffff', 'Class for cave boss elements', (
+        'cave_boss_arena_entrance',
+        'cave_boss_arena_requirements',
+        'cave_boss_tribute_terminal',
+        'cave_boss_tribute_slots',
+        'cave_boss_activate_button',
+        'cave_boss_entry_countdown',
+        'cave_artifact_slot',
+        'cave_tribute_slot',
+        'cave_tribute_required_count',
+    )),
+    'CaveWaterElements': ('CaveElements', 'Cave Water', '#ffffff', 'Class for cave water elements', (
+        'cave_water_depth_indicator',
+        'cave_water_current_indicator',
+        'cave_swim_stamina_indicator',
+        'cave_oxygen_depletion_warning',
+    )),
+    'CaveTekElements': ('CaveElements', 'Cave Tek', '#ffffff', 'Class for cave tek elements', (
+        'cave_tek_door_interface',
+        'cave_tek_door_unlock_requirements',
+        'cave_note_discovery',
+        'cave_note_content',
+        'cave_note_reward',
+        'cave_note_collection_progress',
+    )),
+    'CaveClimbingElements': ('CaveElements', 'Cave Climbing', '#ffffff', 'Class for cave climbing elements', (
+        'cave_grapple_point_marker',
+        'cave_climbing_pick_point',
+        'cave_zipline_anchor_point',
+        'cave_zipline_active',
+        'cave_swinging_vine_marker',
+    )),
+    'CavePuzzleElements': ('CaveElements', 'Cave Puzzles', '#ffffff', 'Class for cave puzzle elements', (
+        'cave_puzzle_interface',
+        'cave_puzzle_clue',
+        'cave_puzzle_interact_prompt',
+        'cave_puzzle_solution_input',
+        'cave_puzzle_success_indicator',
+        'cave_puzzle_failure_indicator',
+        'cave_puzzle_reset_button',
+        'cave_reward_chest_marker',
+    )),
+    'CaveCompletionElements': ('CaveElements', 'Cave Completion', '#ffffff', 'Class for cave completion elements', (
+        'cave_completion_reward',
+        'cave_completion_timer',
+        'cave_record_time',
+        'cave_checkpoint_marker',
+        'cave_checkpoint_activated',
+    )),
+    'CreatureRidingElements': ('UIElement', 'Creature Riding Elements', '#ffffff', None, ()),
+    'CreatureRidingControls': ('CreatureRidingElements', 'Riding Controls', '#ffffff', 'Class for creature riding control elements', (
+        'creature_riding_controls_overlay',
+        'creature_riding_health_bar',
+        'creature_riding_stamina_bar',
+        'creature_riding_food_bar',
+        'creature_riding_oxygen_bar',
+        'creature_riding_weight_bar',
+        'creature_riding_xp_bar',
+        'creature_riding_name_display',
+        'creature_riding_level_display',
+    )),
+    'CreatureRidingAbilities': ('CreatureRidingElements', 'Riding Abilities', '#ffffff', 'Class for creature riding ability elements', (
+        'creature_riding_special_ability_icon',
+        'creature_riding_special_ability_cooldown',
+        'creature_riding_special_ability_active',
+        'creature_riding_special_ability_hotkey',
+        'creature_riding_attack_indicator',
+        'creature_riding_secondary_attack_indicator',
+        'creature_riding_tertiary_attack_indicator',
+    )),
+    'CreatureRidingMovement': ('CreatureRidingElements', 'Riding Movement', '#ffffff', 'Class for creature riding movement elements', (
+        'creature_riding_movement_controls',
+        'creature_riding_jump_indicator',
+        'creature_riding_sprint_indicator',
+        'creature_riding_land_indicator',
+        'creature_riding_dismount_indicator',
+        'creature_riding_control_scheme',
+        'creature_riding_camera_mode',
+        'creature_riding_first_person_view',
+        'creature_riding_third_person_view',
+    )),
+    'CreatureRidingMeters': ('CreatureRidingElements', 'Riding Meters', '#ffffff', 'Class for creature riding meter elements', (
+        'creature_riding_speed_indicator',
+        'creature_riding_altitude_indicator',
+        'creature_riding_depth_indicator',
+        'creature_riding_barrel_roll_indicator',
+        'creature_riding_spin_indicator',
+        'creature_riding_roar_indicator',
+        'creature_riding_bite_indicator',
+        'creature_riding_harvest_indicator',
+        'creature_riding_charge_indicator',
+        'creature_riding_breath_attack_indicator',
+    )),
+    'CreatureRidingAttacks': ('CreatureRidingElements', 'Riding Attacks', '#ffffff', 'Class for creature riding attack elements', (
+        'creature_riding_flame_indicator',
+        'creature_riding_poison_indicator',
+        'creature_riding_lightning_indicator',
+        'creature_riding_tek_saddle_element',
+        'creature_riding_tek_saddle_shield',
+        'creature_riding_tek_saddle_laser',
+        'creature_riding_tek_saddle_dash',
+        'creature_riding_turret_mode_indicator',
+        'creature_riding_turret_ammo_counter',
+    )),
+    'CreatureRidingPassengers': ('CreatureRidingElements', 'Riding Passengers', '#ffffff', 'Class for creature riding passenger elements', (
+        'creature_riding_passenger_indicator',
+        'creature_riding_passenger_count',
+        'creature_riding_passenger_list',
+        'creature_riding_passenger_name',
+        'creature_riding_switch_seat_indicator',
+        'creature_riding_platform_structure_count',
+        'creature_riding_platform_weight',
+    )),
+    'CreatureRidingStatusEffects': ('CreatureRidingElements', 'Riding Status Effects', '#ffffff', 'Class for creature riding status effect elements', (
+        'creature_riding_damage_indicator',
+        'creature_riding_creature_buff_icon',
+        'creature_riding_pack_bonus_icon',
+        'creature_riding_mate_boost_icon',
+        'creature_riding_imprint_bonus_icon',
+        'creature_riding_fall_damage_warning',
+        'creature_riding_torpor_warning',
+        'creature_riding_starving_warning',
+        'creature_riding_exhaustion_warning',
+        'creature_riding_encumbered_warning',
+        'creature_riding_injured_warning',
+        'creature_riding_drowning_warning',
+        'creature_riding_temperature_warning',
+        'creature_riding_territory_warning',
+    )),
+    'CreatureRidingAdditionalInfo': ('CreatureRidingElements', 'Additional Info', '#ffffff', 'Class for creature riding additional info elements', (
+        'creature_riding_attack_cooldown',
+        'creature_riding_gathering_efficiency',
+        'creature_riding_resource_gathered_popup',
+        'creature_riding_experience_gained_popup',
+        'creature_riding_whistlewheel_indicator',
+        'creature_riding_behavior_indicator',
+        'creature_riding_follow_distance_indicator',
+        'creature_riding_inventory_access_indicator',
+    )),
+    'LootCrateElements': ('UIElement', 'Loot Crate Elements', '#ffffff', None, ()),
+    'LootCrateBackground': ('LootCrateElements', 'Loot Crate Background', '#ffffff', 'Class for loot crate background elements', (
+        'loot_crate_background',
+        'loot_crate_title',
+        'loot_crate_color_indicator',
+        'loot_crate_timer',
+        'loot_crate_slot_empty',
+        'loot_crate_slot_filled',
+        'loot_crate_item_icon',
+        'loot_crate_item_name',
+        'loot_crate_item_count',
+        'loot_crate_item_quality',
+        'loot_crate_item_blueprint_icon',
+    )),
+    'LootCrateControls': ('LootCrateElements', 'Loot Crate Controls', '#ffffff', 'Class for loot crate control elements', (
+        'loot_crate_close_button',
+        'loot_crate_take_all_button',
+        'loot_crate_transfer_all_button',
+        'loot_crate_sort_button',
+        'loot_crate_filter_button',
+        'loot_crate_search_bar',
+    )),
+    'LootCrateRarity': ('LootCrateElements', 'Loot Crate Rarity', '#ffffff', 'Class for loot crate rarity elements', (
+        'loot_crate_rarity_white',
+        'loot_crate_rarity_green',
+        'loot_crate_rarity_blue',
+        'loot_crate_rarity_purple',
+        'loot_crate_rarity_yellow',
+        'loot_crate_rarity_red',
+    )),
+    'LootCrateUnlock': ('LootCrateElements', 'Loot Crate Unlock', '#ffffff', 'Class for loot crate unlock elements', (
+        'loot_crate_locked_indicator',
+        'loot_crate_unlock_prompt',
+        'loot_crate_pin_code_field',
+        'loot_crate_unlock_button',
+        'loot_crate_tribute_required',
+        'loot_crate_tribute_slot',
+        'loot_crate_tribute_item',
+        'loot_crate_tribute_count',
+    )),
+    'LootCrateEffects': ('LootCrateElements', 'Loot Crate Effects', '#ffffff', 'Class for loot crate effect elements', (
+        'loot_crate_beacon_light',
+        'loot_crate_beacon_ring',
+        'loot_crate_drop_location',
+        'loot_crate_drop_altitude',
+        'loot_crate_landing_countdown',
+        'loot_crate_available_notification',
+        'loot_crate_map_marker',
+        'loot_crate_coordinates_display',
+    )),
+    'LootCrateInfo': ('LootCrateElements', 'Loot Crate Info', '#ffffff', 'Class for loot crate info elements', (
+        'loot_crate_contents_preview',
+        'loot_crate_level_requirement',
+        'loot_crate_tribe_access_indicator',
+        'loot_crate_first_open_bonus',
+        'loot_crate_item_glow_effect',
+        'loot_crate_mission_reward',
+        'loot_crate_mission_tier',
+        'loot_crate_tribe_lock_timer',
+        'loot_crate_unlock_reward',
+    )),
+    'LootCrateSpecial': ('LootCrateElements', 'Loot Crate Special', '#ffffff', 'Class for loot crate special elements', (
+        'loot_crate_special_event_indicator',
+        'loot_crate_holiday_theme',
+        'loot_crate_tek_variant',
+        'loot_crate_genesis_variant',
+        'loot_crate_cave_variant',
+        'loot_crate_underwater_variant',
+        'loot_crate_artifact_container',
+        'loot_crate_orbital_supply_drop',
+        'loot_crate_gacha_crystal',
+        'loot_crate_already_looted',
+    )),
+    'LootCrateWaveDefense': ('LootCrateElements', 'Wave Defense', '#ffffff', 'Class for loot crate wave defense elements', (
+        'loot_crate_nearby_enemy_warning',
+        'loot_crate_nearby_allies',
+        'loot_crate_wave_defense_status',
+        'loot_crate_wave_countdown',
+        'loot_crate_defense_success_bar',
+        'loot_crate_wave_counter',
+        'loot_crate_remaining_enemies',
+        'loot_crate_deploy_shield_button',
+        'loot_crate_repair_shield_button',
+        'loot_crate_shield_health',
+        'loot_crate_terminal_health',
+        'loot_crate_element_reward',
+    )),
+    'LootCrateRewards': ('LootCrateElements', 'Loot Crate Rewards', '#ffffff', 'Class for loot crate reward elements', (
+        'loot_crate_duplicate_item_notification',
+        'loot_crate_item_compare',
+        'loot_crate_claim_button',
+        'loot_crate_discard_button',
+        'loot_crate_item_tooltip',
+    )),
+}
+
+# Table key -> class __name__, for the classes whose key differs from it
+# (keys starting with "_" are kept out of the module namespace)
+CLASS_NAMES = {
+    '_InventoryTerminalTabs': 'TerminalTabs',
+    '_StructureInteractionElements': 'StructureElements',
+}
+
+# Element name -> name of the class declaring it (the first one if several do)
+ELEMENT_OWNERS = {
+    'hud_healthbar': 'HUDHealthIndicators',
+    'hud_healthbar_full': 'HUDHealthIndicators',
+    'hud_healthbar_medium': 'HUDHealthIndicators',
+    'hud_healthbar_low': 'HUDHealthIndicators',
+    'hud_staminabar': 'HUDStaminaIndicators',
+    'hud_staminabar_full': 'HUDStaminaIndicators',
+    'hud_staminabar_medium': 'HUDStaminaIndicators',
+    'hud_staminabar_low': 'HUDStaminaIndicators',
+    'hud_foodbar': 'HUDFoodIndicators',
+    'hud_foodbar_full': 'HUDFoodIndicators',
+    'hud_foodbar_medium': 'HUDFoodIndicators',
+    'hud_foodbar_low': 'HUDFoodIndicators',
+    'hud_waterbar': 'HUDWaterIndicators',
+    'hud_waterbar_full': 'HUDWaterIndicators',
+    'hud_waterbar_medium': 'HUDWaterIndicators',
+    'hud_waterbar_low': 'HUDWaterIndicators',
+    'hud_oxygenbar': 'HUDOxygenIndicators',
+    'hud_oxygenbar_full': 'HUDOxygenIndicators',
+    'hud_oxygenbar_medium': 'HUDOxygenIndicators',
+    'hud_oxygenbar_low': 'HUDOxygenIndicators',
+    'hud_weightbar': 'HUDWeightIndicators',
+    'hud_weightbar_light': 'HUDWeightIndicators',
+    'hud_weightbar_medium': 'HUDWeightIndicators',
+    'hud_weightbar_heavy': 'HUDWeightIndicators',
+    'hud_weightbar_overweight': 'HUDWeightIndicators',
+    'hud_torpiditybar': 'HUDTorpidityIndicators',
+    'hud_torpiditybar_low': 'HUDTorpidityIndicators',
+    'hud_torpiditybar_medium': 'HUDTorpidityIndicators',
+    'hud_torpiditybar_high': 'HUDTorpidityIndicators',
+    'hud_xp_bar': 'HUDExperienceIndicators',
+    'hud_levelup_alert': 'HUDExperienceIndicators',
+    'hud_xp_notification': 'HUDExperienceIndicators',
+    'hud_compass': 'HUDCompassElements',
+    'hud_compass_north': 'HUDCompassElements',
+    'hud_compass_east': 'HUDCompassElements',
+    'hud_compass_south': 'HUDCompassElements',
+    'hud_compass_west': 'HUDCompassElements',
+    'hud_compass_degrees': 'HUDCompassElements',
+    'hud_compass_direction': 'HUDCompassElements',
+    'hud_gps_coordinates': 'HUDCompassElements',
+    'hud_altitude_indicator': 'HUDCompassElements',
+    'hud_depth_indicator': 'HUDCompassElements',
+    'hud_temperature_indicator': 'HUDTemperatureIndicators',
+    'hud_temperature_hot': 'HUDTemperatureIndicators',
+    'hud_temperature_comfortable': 'HUDTemperatureIndicators',
+    'hud_temperature_cold': 'HUDTemperatureIndicators',
+    'hud_buff_icon': 'HUDBuffIndicators',
+    'hud_buff_icon_generalized': 'HUDBuffIndicators',
+    'hud_buff_icon_food': 'HUDBuffIndicators',
+    'hud_buff_icon_water': 'HUDBuffIndicators',
+    'hud_buff_icon_shelter': 'HUDBuffIndicators',
+    'hud_buff_icon_mating': 'HUDBuffIndicators',
+    'hud_debuff_icon': 'HUDDebuffIndicators',
+    'hud_buff_icon_encumbered': 'HUDDebuffIndicators',
+    'hud_buff_icon_hypothermia': 'HUDDebuffIndicators',
+    'hud_buff_icon_hyperthermia': 'HUDDebuffIndicators',
+    'hud_buff_icon_poisoned': 'HUDDebuffIndicators',
+    'hud_buff_icon_diseased': 'HUDDebuffIndicators',
+    'hud_buff_icon_broken_bone': 'HUDDebuffIndicators',
+    'hud_chat_window': 'HUDChatElements',
+    'hud_chat_input': 'HUDChatElements',
+    'hud_chat_global_tab': 'HUDChatElements',
+    'hud_chat_local_tab': 'HUDChatElements',
+    'hud_chat_tribe_tab': 'HUDChatElements',
+    'hud_chat_alliance_tab': 'HUDChatElements',
+    'hud_tribe_log': 'HUDChatElements',
+    'hud_tribe_log_entry': 'HUDChatElements',
+    'hud_death_message': 'HUDChatElements',
+    'hud_taming_notification': 'HUDChatElements',
+    'hud_server_message': 'HUDChatElements',
+    'hud_crosshair_default': 'HUDCrosshairElements',
+    'hud_crosshair_harvesting': 'HUDCrosshairElements',
+    'hud_crosshair_ranged': 'HUDCrosshairElements',
+    'hud_crosshair_spyglass': 'HUDCrosshairElements',
+    'hud_interaction_prompt': 'HUDInteractionPrompts',
+    'hud_pickup_prompt': 'HUDInteractionPrompts',
+    'hud_mount_prompt': 'HUDInteractionPrompts',
+    'hud_access_prompt': 'HUDInteractionPrompts',
+    'hud_whistle_wheel': 'HUDWheelMenus',
+    'hud_emote_wheel': 'HUDWheelMenus',
+    'hud_quickchat_wheel': 'HUDWheelMenus',
+    'hud_waypoint_marker': 'HUDWaypointElements',
+    'hud_waypoint_distance': 'HUDWaypointElements',
+    'hud_objective_marker': 'HUDWaypointElements',
+    'hud_mission_timer': 'HUDWaypointElements',
+    'hud_boss_arena_timer': 'HUDWaypointElements',
+    'hud_player_name_tag': 'HUDNameTags',
+    'hud_tamed_dino_name_tag': 'HUDNameTags',
+    'hud_wild_dino_name_tag': 'HUDNameTags',
+    'hud_structure_name_tag': 'HUDNameTags',
+    'hud_tribe_name_tag': 'HUDNameTags',
+    'hud_ally_indicator': 'HUDNameTags',
+    'hud_enemy_indicator': 'HUDNameTags',
+    'hud_neutral_indicator': 'HUDNameTags',
+    'hud_hlna_icon': 'HUDMarkerElements',
+    'hud_hlna_message': 'HUDMarkerElements',
+    'hud_resource_node_marker': 'HUDMarkerElements',
+    'hud_explorer_note_marker': 'HUDMarkerElements',
+    'hud_supply_drop_marker': 'HUDMarkerElements',
+    'hud_beaver_dam_marker': 'HUDMarkerElements',
+    'hud_artifact_marker': 'HUDMarkerElements',
+    'hud_radiation_warning': 'HUDWarningElements',
+    'hud_gas_warning': 'HUDWarningElements',
+    'hud_element_warning': 'HUDWarningElements',
+    'hud_tek_visor_overlay': 'HUDTekElements',
+    'hud_tek_visor_target': 'HUDTekElements',
+    'hud_tek_visor_stats': 'HUDTekElements',
+    'hud_tek_punch_charge': 'HUDTekElements',
+    'hud_spyglass_overlay': 'HUDOverlayElements',
+    'hud_spyglass_info': 'HUDOverlayElements',
+    'hud_taxidermy_camera': 'HUDOverlayElements',
+    'hud_paintbrush_color_picker': 'HUDOverlayElements',
+    'hud_paintbrush_brush_size': 'HUDOverlayElements',
+    'hud_creature_stats_overlay': 'HUDOverlayElements',
+    'hud_structure_health_overlay': 'HUDOverlayElements',
+    'hud_resource_yields_popup': 'HUDOverlayElements',
+    'quickbar_background': 'QuickbarSlots',
+    'quickbar_slot_1': 'QuickbarSlots',
+    'quickbar_slot_2': 'QuickbarSlots',
+    'quickbar_slot_3': 'QuickbarSlots',
+    'quickbar_slot_4': 'QuickbarSlots',
+    'quickbar_slot_5': 'QuickbarSlots',
+    'quickbar_slot_6': 'QuickbarSlots',
+    'quickbar_slot_7': 'QuickbarSlots',
+    'quickbar_slot_8': 'QuickbarSlots',
+    'quickbar_slot_9': 'QuickbarSlots',
+    'quickbar_slot_0': 'QuickbarSlots',
+    'quickbar_slot_filled': 'QuickbarSlots',
+    'quickbar_slot_empty': 'QuickbarSlots',
+    'quickbar_slot_selected': 'QuickbarSlots',
+    'quickbar_selector': 'QuickbarIndicators',
+    'quickbar_item_name': 'QuickbarIndicators',
+    'quickbar_item_count': 'QuickbarIndicators',
+    'quickbar_item_durability_high': 'QuickbarIndicators',
+    'quickbar_item_durability_medium': 'QuickbarIndicators',
+    'quickbar_item_durability_low': 'QuickbarIndicators',
+    'quickbar_weapon_ammo_count': 'QuickbarIndicators',
+    'quickbar_weapon_reload_prompt': 'QuickbarIndicators',
+    'quickbar_item_cooldown': 'QuickbarIndicators',
+    'quickbar_item_keybind': 'QuickbarIndicators',
+    'quickbar_item_equip_animation': 'QuickbarIndicators',
+    'quickbar_contextual_action': 'QuickbarIndicators',
+    'quickbar_hotkey_1': 'QuickbarHotkeys',
+    'quickbar_hotkey_2': 'QuickbarHotkeys',
+    'quickbar_hotkey_3': 'QuickbarHotkeys',
+    'quickbar_hotkey_4': 'QuickbarHotkeys',
+    'quickbar_hotkey_5': 'QuickbarHotkeys',
+    'quickbar_hotkey_6': 'QuickbarHotkeys',
+    'quickbar_hotkey_7': 'QuickbarHotkeys',
+    'quickbar_hotkey_8': 'QuickbarHotkeys',
+    'quickbar_hotkey_9': 'QuickbarHotkeys',
+    'quickbar_hotkey_0': 'QuickbarHotkeys',
+    'inventory_background': 'InventoryPanels',
+    'inventory_player_region': 'InventoryPanels',
+    'inventory_entity_region': 'InventoryPanels',
+    'inventory_player_model': 'InventoryPanels',
+    'inventory_player_stats': 'InventoryPanels',
+    'inventory_toolbar': 'InventoryPanels',
+    'inventory_close_button': 'InventoryPanels',
+    'inventory_player_slot_empty': 'InventorySlots',
+    'inventory_player_slot_filled': 'InventorySlots',
+    'inventory_item_icon': 'InventorySlots',
+    'inventory_item_stack_count': 'InventorySlots',
+    'inventory_item_durability_high': 'InventorySlots',
+    'inventory_item_durability_medium': 'InventorySlots',
+    'inventory_item_durability_low': 'InventorySlots',
+    'inventory_item_broken_indicator': 'InventorySlots',
+    'inventory_item_quality_primitive': 'InventoryQualityIndicators',
+    'inventory_item_quality_ramshackle': 'InventoryQualityIndicators',
+    'inventory_item_quality_apprentice': 'InventoryQualityIndicators',
+    'inventory_item_quality_journeyman': 'InventoryQualityIndicators',
+    'inventory_item_quality_mastercraft': 'InventoryQualityIndicators',
+    'inventory_item_quality_ascendant': 'InventoryQualityIndicators',
+    'inventory_item_blueprint_icon': 'InventoryItemSpecials',
+    'inventory_item_blueprint_text': 'InventoryItemSpecials',
+    'inventory_item_equipped_marker': 'InventoryItemSpecials',
+    'inventory_item_favorite_marker': 'InventoryItemSpecials',
+    'inventory_item_spoil_timer': 'InventoryItemSpecials',
+    'inventory_item_repair_cost': 'InventoryItemSpecials',
+    'inventory_search_bar': 'InventoryControls',
+    'inventory_search_icon': 'InventoryControls',
+    'inventory_search_results': 'InventoryControls',
+    'inventory_transfer_right_button': 'InventoryControls',
+    'inventory_transfer_left_button': 'InventoryControls',
+    'inventory_transfer_item_button': 'InventoryControls',
+    'inventory_weight_current': 'InventoryControls',
+    'inventory_weight_max': 'InventoryControls',
+    'inventory_weight_percentage': 'InventoryControls',
+    'inventory_weight_progress_bar': 'InventoryControls',
+    'inventory_sort_button': 'InventoryControls',
+    'inventory_drop_button': 'InventoryControls',
+    'inventory_drop_all_button': 'InventoryControls',
+    'inventory_split_stack_slider': 'InventoryControls',
+    'inventory_remote_use_button': 'InventoryControls',
+    'inventory_armor_slot_head': 'InventoryArmorSlots',
+    'inventory_armor_slot_chest': 'InventoryArmorSlots',
+    'inventory_armor_slot_hands': 'InventoryArmorSlots',
+    'inventory_armor_slot_legs': 'InventoryArmorSlots',
+    'inventory_armor_slot_feet': 'InventoryArmorSlots',
+    'inventory_armor_slot_shield': 'InventoryArmorSlots',
+    'inventory_item_tooltip': 'InventoryTooltips',
+    'inventory_item_tooltip_title': 'InventoryTooltips',
+    'inventory_item_tooltip_description': 'InventoryTooltips',
+    'inventory_item_tooltip_weight': 'InventoryTooltips',
+    'inventory_item_tooltip_stats': 'InventoryTooltips',
+    'inventory_item_tooltip_durability': 'InventoryTooltips',
+    'inventory_item_tooltip_effects': 'InventoryTooltips',
+    'inventory_item_context_menu': 'InventoryContextMenu',
+    'inventory_item_context_option_equip': 'InventoryContextMenu',
+    'inventory_item_context_option_drop': 'InventoryContextMenu',
+    'inventory_item_context_option_drop_all': 'InventoryContextMenu',
+    'inventory_item_context_option_transfer': 'InventoryContextMenu',
+    'inventory_item_context_option_transfer_all': 'InventoryContextMenu',
+    'inventory_item_context_option_split': 'InventoryContextMenu',
+    'inventory_item_context_option_consume': 'InventoryContextMenu',
+    'inventory_item_context_option_examine': 'InventoryContextMenu',
+    'inventory_item_context_option_rename': 'InventoryContextMenu',
+    'inventory_item_context_option_repair': 'InventoryContextMenu',
+    'inventory_folder_tab': 'InventoryFolders',
+    'inventory_folder_icon': 'InventoryFolders',
+    'inventory_folder_name': 'InventoryFolders',
+    'inventory_folder_item_count': 'InventoryFolders',
+    'inventory_scroll_bar': 'InventoryFolders',
+    'inventory_scroll_up_button': 'InventoryFolders',
+    'inventory_scroll_down_button': 'InventoryFolders',
+    'inventory_entity_slot_empty': 'EntityInventoryElements',
+    'inventory_entity_slot_filled': 'EntityInventoryElements',
+    'inventory_entity_name': 'EntityInventoryElements',
+    'inventory_structure_type': 'EntityInventoryElements',
+    'inventory_entity_level': 'EntityInventoryElements',
+    'inventory_entity_model': 'EntityInventoryElements',
+    'inventory_entity_inventory_slots_count': 'EntityInventoryElements',
+    'inventory_beacon_countdown': 'SpecialInventoryElements',
+    'inventory_tek_transmitter_interface': 'SpecialInventoryElements',
+    'inventory_obelisk_interface': 'SpecialInventoryElements',
+    'inventory_genesis_mission_interface': 'SpecialInventoryElements',
+    'inventory_cryopod_contents': 'SpecialInventoryElements',
+    'inventory_artifact_slot': 'SpecialInventoryElements',
+    'inventory_boss_tribute_slot': 'SpecialInventoryElements',
+    'inventory_tek_element_count': 'SpecialInventoryElements',
+    'inventory_terminal_download_tab': '_InventoryTerminalTabs',
+    'inventory_terminal_upload_tab': '_InventoryTerminalTabs',
+    'inventory_terminal_creature_tab': '_InventoryTerminalTabs',
+    'inventory_terminal_data_tab': '_InventoryTerminalTabs',
+    'tab_inventory_active': 'InventoryTabs',
+    'tab_inventory_inactive': 'InventoryTabs',
+    'tab_crafting_active': 'InventoryTabs',
+    'tab_crafting_inactive': 'InventoryTabs',
+    'tab_engrams_active': 'InventoryTabs',
+    'tab_engrams_inactive': 'InventoryTabs',
+    'tab_tribe_active': 'CharacterTabs',
+    'tab_tribe_inactive': 'CharacterTabs',
+    'tab_stats_active': 'CharacterTabs',
+    'tab_stats_inactive': 'CharacterTabs',
+    'tab_notes_active': 'CharacterTabs',
+    'tab_notes_inactive': 'CharacterTabs',
+    'tab_map_active': 'CharacterTabs',
+    'tab_map_inactive': 'CharacterTabs',
+    'tab_dino_stats_active': 'DinoTabs',
+    'tab_dino_stats_inactive': 'DinoTabs',
+    'tab_dino_inventory_active': 'DinoTabs',
+    'tab_dino_inventory_inactive': 'DinoTabs',
+    'tab_dino_behavior_active': 'DinoTabs',
+    'tab_dino_behavior_inactive': 'DinoTabs',
+    'tab_spawn_selection_active': 'TerminalTabs',
+    'tab_spawn_selection_inactive': 'TerminalTabs',
+    'tab_tribute_active': 'TerminalTabs',
+    'tab_tribute_inactive': 'TerminalTabs',
+    'tab_upload_active': 'TerminalTabs',
+    'tab_upload_inactive': 'TerminalTabs',
+    'tab_download_active': 'TerminalTabs',
+    'tab_download_inactive': 'TerminalTabs',
+    'tab_recipes_active': 'TerminalTabs',
+    'tab_recipes_inactive': 'TerminalTabs',
+    'tab_cluster_active': 'TerminalTabs',
+    'tab_cluster_inactive': 'TerminalTabs',
+    'tab_missions_active': 'TerminalTabs',
+    'tab_missions_inactive': 'TerminalTabs',
+    'tab_genesis_biomes_active': 'TerminalTabs',
+    'tab_genesis_biomes_inactive': 'TerminalTabs',
+    'crafting_item_panel': 'CraftingPanels',
+    'crafting_item_icon': 'CraftingPanels',
+    'crafting_item_name': 'CraftingPanels',
+    'crafting_item_description': 'CraftingPanels',
+    'crafting_materials_header': 'CraftingPanels',
+    'crafting_materials_required': 'CraftingPanels',
+    'crafting_materials_sufficient': 'CraftingPanels',
+    'crafting_materials_insufficient': 'CraftingPanels',
+    'crafting_button_active': 'CraftingPanels',
+    'crafting_button_inactive': 'CraftingPanels',
+    'crafting_blueprint_header': 'CraftingControls',
+    'crafting_button_craft_one': 'CraftingControls',
+    'crafting_button_craft_all': 'CraftingControls',
+    'crafting_button_craft_custom': 'CraftingControls',
+    'crafting_amount_selector': 'CraftingControls',
+    'crafting_checkbox_craftall': 'CraftingControls',
+    'crafting_time_estimate': 'CraftingControls',
+    'crafting_queue_header': 'CraftingQueue',
+    'crafting_queue_slot': 'CraftingQueue',
+    'crafting_queue_slot_empty': 'CraftingQueue',
+    'crafting_queue_slot_occupied': 'CraftingQueue',
+    'crafting_queue_item_name': 'CraftingQueue',
+    'crafting_queue_item_icon': 'CraftingQueue',
+    'crafting_queue_progress_text': 'CraftingQueue',
+    'crafting_queue_cancel_button': 'CraftingQueue',
+    'crafting_progress_bar_inactive': 'CraftingQueue',
+    'crafting_progress_bar_active': 'CraftingQueue',
+    'crafting_station_icon': 'CraftingStationInfo',
+    'crafting_station_name': 'CraftingStationInfo',
+    'crafting_station_level': 'CraftingStationInfo',
+    'crafting_search_bar': 'CraftingFilters',
+    'crafting_search_icon': 'CraftingFilters',
+    'crafting_filter_button': 'CraftingFilters',
+    'crafting_filter_dropdown': 'CraftingFilters',
+    'crafting_filter_option_all': 'CraftingFilters',
+    'crafting_filter_option_armor': 'CraftingFilters',
+    'crafting_filter_option_weapons': 'CraftingFilters',
+    'crafting_filter_option_Structure': 'CraftingFilters',
+    'crafting_filter_option_consumables': 'CraftingFilters',
+    'crafting_filter_option_resources': 'CraftingFilters',
+    'crafting_filter_option_tools': 'CraftingFilters',
+    'crafting_sort_button': 'CraftingSorting',
+    'crafting_sort_dropdown': 'CraftingSorting',
+    'crafting_sort_option_alphabetical': 'CraftingSorting',
+    'crafting_sort_option_level': 'CraftingSorting',
+    'crafting_sort_option_craftable': 'CraftingSorting',
+    'crafting_category_header': 'CraftingSorting',
+    'crafting_skill_boost_indicator': 'CraftingBoosts',
+    'crafting_speed_multiplier': 'CraftingBoosts',
+    'crafting_blueprint_quality_indicator': 'CraftingBoosts',
+    'crafting_blueprint_bonus_text': 'CraftingBoosts',
+    'crafting_mindwipe_reminder': 'CraftingBoosts',
+    'crafting_engram_points_cost': 'CraftingRequirements',
+    'crafting_level_requirement': 'CraftingRequirements',
+    'crafting_tek_element_cost': 'CraftingRequirements',
+    'crafting_crystal_cost': 'CraftingResourceCosts',
+    'crafting_metal_cost': 'CraftingResourceCosts',
+    'crafting_wood_cost': 'CraftingResourceCosts',
+    'crafting_thatch_cost': 'CraftingResourceCosts',
+    'crafting_stone_cost': 'CraftingResourceCosts',
+    'crafting_hide_cost': 'CraftingResourceCosts',
+    'crafting_fiber_cost': 'CraftingResourceCosts',
+    'crafting_chitin_cost': 'CraftingResourceCosts',
+    'crafting_keratin_cost': 'CraftingResourceCosts',
+    'crafting_obsidian_cost': 'CraftingResourceCosts',
+    'crafting_polymer_cost': 'CraftingResourceCosts',
+    'crafting_electronics_cost': 'CraftingResourceCosts',
+    'crafting_cementing_paste_cost': 'CraftingResourceCosts',
+    'crafting_silica_pearls_cost': 'CraftingResourceCosts',
+    'crafting_oil_cost': 'CraftingResourceCosts',
+    'crafting_pelt_cost': 'CraftingResourceCosts',
+    'crafting_black_pearl_cost': 'CraftingResourceCosts',
+    'crafting_narcotics_cost': 'CraftingResourceCosts',
+    'crafting_stimulant_cost': 'CraftingResourceCosts',
+    'crafting_biotoxin_cost': 'CraftingResourceCosts',
+    'crafting_congealed_gas_cost': 'CraftingResourceCosts',
+    'crafting_element_shard_cost': 'CraftingResourceCosts',
+    'crafting_element_dust_cost': 'CraftingResourceCosts',
+    'crafting_mutagel_cost': 'CraftingResourceCosts',
+    'crafting_ammunition_cost': 'CraftingResourceCosts',
+    'engram_icon_available': 'EngramIcons',
+    'engram_icon_learned': 'EngramIcons',
+    'engram_icon_locked': 'EngramIcons',
+    'engram_icon_dlc_locked': 'EngramIcons',
+    'engram_highlight_new': 'EngramIcons',
+    'engram_points_display': 'EngramPoints',
+    'engram_points_total': 'EngramPoints',
+    'engram_points_spent': 'EngramPoints',
+    'engram_points_available': 'EngramPoints',
+    'engram_level_requirement': 'EngramPoints',
+    'engram_learn_button_active': 'EngramControls',
+    'engram_learn_button_inactive': 'EngramControls',
+    'engram_learn_multiple_button': 'EngramControls',
+    'engram_auto_unlock_checkbox': 'EngramControls',
+    'engram_prerequisite_warning': 'EngramControls',
+    'engram_item_icon': 'EngramItems',
+    'engram_item_name': 'EngramItems',
+    'engram_item_description': 'EngramItems',
+    'engram_search_bar': 'EngramSearch',
+    'engram_search_icon': 'EngramSearch',
+    'engram_search_results': 'EngramSearch',
+    'engram_point_cost': 'EngramSearch',
+    'engram_category_tab': 'EngramCategories',
+    'engram_category_icon': 'EngramCategories',
+    'engram_category_name': 'EngramCategories',
+    'engram_category_progress': 'EngramCategories',
+    'engram_show_unlocked_toggle': 'EngramCategories',
+    'engram_hide_locked_toggle': 'EngramCategories',
+    'engram_tooltip': 'EngramTooltips',
+    'engram_tooltip_name': 'EngramTooltips',
+    'engram_tooltip_description': 'EngramTooltips',
+    'engram_tooltip_level': 'EngramTooltips',
+    'engram_tooltip_cost': 'EngramTooltips',
+    'engram_dlc_icon': 'EngramDLCIcons',
+    'engram_tek_icon': 'EngramDLCIcons',
+    'engram_genesis_icon': 'EngramDLCIcons',
+    'engram_aberration_icon': 'EngramDLCIcons',
+    'engram_scorched_earth_icon': 'EngramDLCIcons',
+    'engram_extinction_icon': 'EngramDLCIcons',
+    'engram_fjordur_icon': 'EngramDLCIcons',
+    'engram_valguero_icon': 'EngramDLCIcons',
+    'engram_crystal_isles_icon': 'EngramDLCIcons',
+    'engram_lost_island_icon': 'EngramDLCIcons',
+    'engram_gen1_icon': 'EngramDLCIcons',
+    'engram_gen2_icon': 'EngramDLCIcons',
+    'engram_primitive_plus_icon': 'EngramDLCIcons',
+    'engram_boss_unlock_icon': 'EngramDLCIcons',
+    'engram_mission_unlock_icon': 'EngramDLCIcons',
+    'engram_scroll_bar': 'EngramNavigation',
+    'engram_scroll_up_button': 'EngramNavigation',
+    'engram_scroll_down_button': 'EngramNavigation',
+    'engram_tech_tier_marker': 'EngramNavigation',
+    'engram_level_marker': 'EngramNavigation',
+    'dino_inventory_name': 'DinoInventory',
+    'dino_inventory_level': 'DinoInventory',
+    'dino_health_bar': 'DinoInventory',
+    'dino_stamina_bar': 'DinoInventory',
+    'dino_food_bar': 'DinoInventory',
+    'dino_torpidity_bar': 'DinoInventory',
+    'dino_weight_bar': 'DinoInventory',
+    'dino_options_button': 'DinoInventory',
+    'dino_follow_setting': 'DinoInventory',
+    'dino_behavior_setting': 'DinoInventory',
+    'dino_saddle_slot': 'DinoInventory',
+    'dino_stats_increase_button': 'DinoInventory',
+    'dino_behavior_aggressive': 'DinoBehavior',
+    'dino_behavior_neutral': 'DinoBehavior',
+    'dino_behavior_passive': 'DinoBehavior',
+    'dino_behavior_passive_flee': 'DinoBehavior',
+    'dino_follow_distance_close': 'DinoBehavior',
+    'dino_follow_distance_medium': 'DinoBehavior',
+    'dino_follow_distance_far': 'DinoBehavior',
+    'dino_follow_distance_furthest': 'DinoBehavior',
+    'dino_targeting_setting': 'DinoTargeting',
+    'dino_targeting_low_hp': 'DinoTargeting',
+    'dino_targeting_high_dmg': 'DinoTargeting',
+    'dino_mating_toggle': 'DinoTargeting',
+    'dino_wandering_toggle': 'DinoTargeting',
+    'dino_turret_mode_toggle': 'DinoTargeting',
+    'dino_harvest_setting': 'DinoTargeting',
+    'dino_enable_ally_looking': 'DinoTargeting',
+    'dino_victim_item_collection': 'DinoTargeting',
+    'dino_stats_background': 'DinoStats',
+    'dino_stats_header': 'DinoStats',
+    'dino_stats_species': 'DinoStats',
+    'dino_stats_level': 'DinoStats',
+    'dino_stats_xp_bar': 'DinoStats',
+    'dino_stats_xp_to_next_level': 'DinoStats',
+    'dino_stat_health': 'DinoStats',
+    'dino_stat_health_value': 'DinoStats',
+    'dino_stat_health_increase_button': 'DinoStats',
+    'dino_stat_stamina': 'DinoStats',
+    'dino_stat_stamina_value': 'DinoStats',
+    'dino_stat_stamina_increase_button': 'DinoStats',
+    'dino_stat_oxygen': 'DinoStats',
+    'dino_stat_oxygen_value': 'DinoStats',
+    'dino_stat_oxygen_increase_button': 'DinoStats',
+    'dino_stat_food': 'DinoStats',
+    'dino_stat_food_value': 'DinoStats',
+    'dino_stat_food_increase_button': 'DinoStats',
+    'dino_stat_weight': 'DinoStats',
+    'dino_stat_weight_value': 'DinoStats',
+    'dino_stat_weight_increase_button': 'DinoStats',
+    'dino_stat_melee': 'DinoStats',
+    'dino_stat_melee_value': 'DinoStats',
+    'dino_stat_melee_increase_button': 'DinoStats',
+    'dino_stat_speed': 'DinoStats',
+    'dino_stat_speed_value': 'DinoStats',
+    'dino_stat_speed_increase_button': 'DinoStats',
+    'dino_stat_torpor': 'DinoStats',
+    'dino_stat_torpor_value': 'DinoStats',
+    'dino_imprinting_status': 'DinoImprinting',
+    'dino_imprinting_quality': 'DinoImprinting',
+    'dino_imprinting_progress': 'DinoImprinting',
+    'dino_imprinting_timer': 'DinoImprinting',
+    'dino_unclaim_button': 'DinoImprinting',
+    'dino_rename_button': 'DinoImprinting',
+    'dino_color_regions': 'DinoImprinting',
+    'dino_mutation_counter_paternal': 'DinoImprinting',
+    'dino_mutation_counter_maternal': 'DinoImprinting',
+    'dino_ancestry_button': 'DinoImprinting',
+    'dino_gender_indicator': 'DinoImprinting',
+    'dino_special_ability_cooldown': 'DinoAbilities',
+    'dino_special_ability_button': 'DinoAbilities',
+    'dino_pack_buff_indicator': 'DinoAbilities',
+    'dino_mate_boost_indicator': 'DinoAbilities',
+    'dino_wild_stats': 'DinoAbilities',
+    'dino_tamed_bonus': 'DinoAbilities',
+    'dino_imprint_bonus': 'DinoAbilities',
+    'taming_effectiveness_bar': 'TamingElements',
+    'taming_progress_bar': 'TamingElements',
+    'taming_food_timer': 'TamingElements',
+    'taming_torpor_bar': 'TamingElements',
+    'taming_progress_bar_empty': 'TamingElements',
+    'taming_progress_bar_partial': 'TamingElements',
+    'taming_progress_bar_full': 'TamingElements',
+    'taming_effectiveness_high': 'TamingElements',
+    'taming_effectiveness_medium': 'TamingElements',
+    'taming_effectiveness_low': 'TamingElements',
+    'structure_name_label': 'StructureInfo',
+    'structure_inventory_button': 'StructureInfo',
+    'structure_options_button': 'StructureInfo',
+    'structure_power_indicator': 'StructureInfo',
+    'structure_fuel_level': 'StructureInfo',
+    'structure_pin_code_input': 'StructureInfo',
+    'structure_demolish_timer': 'StructureInfo',
+    'structure_health_bar': 'StructureInfo',
+    'structure_shield_bar': 'StructureInfo',
+    'structure_transfer_button': 'StructureInfo',
+    'structure_options_menu': 'StructureOptions',
+    'structure_demolish_option': 'StructureOptions',
+    'structure_pickup_option': 'StructureOptions',
+    'structure_paint_option': 'StructureOptions',
+    'structure_change_pin_option': 'StructureOptions',
+    'structure_snap_points': 'StructurePlacement',
+    'structure_placement_valid': 'StructurePlacement',
+    'structure_placement_invalid': 'StructurePlacement',
+    'structure_placement_preview': 'StructurePlacement',
+    'structure_placement_obstruction': 'StructurePlacement',
+    'structure_placement_foundation_required': 'StructurePlacement',
+    'structure_placement_support_required': 'StructurePlacement',
+    'structure_placement_enemy_foundation': 'StructurePlacement',
+    'structure_placement_enemy_territory': 'StructurePlacement',
+    'structure_placement_snap_point': 'StructurePlacement',
+    'structure_placement_snap_preview': 'StructurePlacement',
+    'structure_powered_indicator': 'StructurePower',
+    'structure_unpowered_indicator': 'StructurePower',
+    'generator_fuel_level': 'StructurePower',
+    'electrical_wire_connection': 'StructurePower',
+    'water_pipe_connection': 'StructurePower',
+    'gas_pipe_connection': 'StructurePower',
+    'storage_capacity_indicator': 'StructurePower',
+    'auto_turret_ammo_indicator': 'StructurePower',
+    'map_background': 'MapBackground',
+    'map_background_terrain': 'MapBackground',
+    'map_background_ocean': 'MapBackground',
+    'map_grid_lines': 'MapBackground',
+    'map_grid_labels': 'MapBackground',
+    'map_biome_boundaries': 'MapBackground',
+    'map_biome_name_label': 'MapBackground',
+    'map_player_marker': 'MapMarkers',
+    'map_player_marker_direction': 'MapMarkers',
+    'map_player_text_label': 'MapMarkers',
+    'map_tribe_member_marker': 'MapMarkers',
+    'map_tribe_member_text_label': 'MapMarkers',
+    'map_tamed_dino_marker': 'MapMarkers',
+    'map_tamed_dino_text_label': 'MapMarkers',
+    'map_tamed_dino_type_icon': 'MapMarkers',
+    'map_bed_marker': 'MapMarkers',
+    'map_bed_text_label': 'MapMarkers',
+    'map_base_marker': 'MapBaseMarkers',
+    'map_base_text_label': 'MapBaseMarkers',
+    'map_waypoint_marker': 'MapBaseMarkers',
+    'map_waypoint_text_label': 'MapBaseMarkers',
+    'map_waypoint_distance': 'MapBaseMarkers',
+    'map_obelisk_marker_red': 'MapObeliskMarkers',
+    'map_obelisk_marker_blue': 'MapObeliskMarkers',
+    'map_obelisk_marker_green': 'MapObeliskMarkers',
+    'map_terminal_marker': 'MapObeliskMarkers',
+    'map_cave_entrance_marker': 'MapObeliskMarkers',
+    'map_underwater_cave_marker': 'MapObeliskMarkers',
+    'map_beacon_marker_white': 'MapBeaconMarkers',
+    'map_beacon_marker_green': 'MapBeaconMarkers',
+    'map_beacon_marker_blue': 'MapBeaconMarkers',
+    'map_beacon_marker_purple': 'MapBeaconMarkers',
+    'map_beacon_marker_yellow': 'MapBeaconMarkers',
+    'map_beacon_marker_red': 'MapBeaconMarkers',
+    'map_mission_marker': 'MapSpecialMarkers',
+    'map_boss_terminal_marker': 'MapSpecialMarkers',
+    'map_supply_drop_marker': 'MapSpecialMarkers',
+    'map_explorer_note_marker': 'MapSpecialMarkers',
+    'map_glitch_marker': 'MapSpecialMarkers',
+    'map_resource_node_marker': 'MapSpecialMarkers',
+    'map_charging_station_marker': 'MapSpecialMarkers',
+    'map_ocean_depth_indicator': 'MapWaterElements',
+    'map_shallow_water_indicator': 'MapWaterElements',
+    'map_deep_water_indicator': 'MapWaterElements',
+    'map_danger_zone_indicator': 'MapWaterElements',
+    'map_radiation_zone': 'MapWaterElements',
+    'map_snow_biome_indicator': 'MapBiomeIndicators',
+    'map_desert_biome_indicator': 'MapBiomeIndicators',
+    'map_redwood_biome_indicator': 'MapBiomeIndicators',
+    'map_swamp_biome_indicator': 'MapBiomeIndicators',
+    'map_coordinates_display': 'MapCoordinates',
+    'map_latitude_display': 'MapCoordinates',
+    'map_longitude_display': 'MapCoordinates',
+    'map_altitude_display': 'MapCoordinates',
+    'map_zoom_in_button': 'MapControls',
+    'map_zoom_out_button': 'MapControls',
+    'map_zoom_level_indicator': 'MapControls',
+    'map_filter_button': 'MapControls',
+    'map_filter_panel': 'MapControls',
+    'map_place_waypoint_button': 'MapControls',
+    'map_clear_waypoint_button': 'MapControls',
+    'map_fast_travel_button': 'MapControls',
+    'map_region_name_text': 'MapAdditionalInfo',
+    'map_weather_indicator': 'MapAdditionalInfo',
+    'map_fog_of_war': 'MapAdditionalInfo',
+    'map_discovered_area': 'MapAdditionalInfo',
+    'map_genesis_mission_zones': 'MapAdditionalInfo',
+    'map_genesis_teleport_points': 'MapAdditionalInfo',
+    'map_server_border': 'MapAdditionalInfo',
+    'map_minimap_frame': 'MinimapElements',
+    'map_minimap_terrain': 'MinimapElements',
+    'map_minimap_player_marker': 'MinimapElements',
+    'map_minimap_north_indicator': 'MinimapElements',
+    'alert_starvation': 'HealthAlerts',
+    'alert_dehydration': 'HealthAlerts',
+    'alert_encumbered': 'HealthAlerts',
+    'alert_too_hot': 'HealthAlerts',
+    'alert_too_cold': 'HealthAlerts',
+    'alert_level_up': 'NotificationAlerts',
+    'alert_tribe_message': 'NotificationAlerts',
+    'alert_death_message': 'NotificationAlerts',
+    'alert_taming_complete': 'NotificationAlerts',
+    'alert_insufficient_engrams': 'NotificationAlerts',
+    'alert_structure_blocked': 'NotificationAlerts',
+    'alert_enemy_player_nearby': 'NotificationAlerts',
+    'alert_server_message': 'NotificationAlerts',
+    'alert_disconnection_warning': 'NotificationAlerts',
+    'alert_item_broken': 'WarningAlerts',
+    'alert_creature_starving': 'WarningAlerts',
+    'alert_creature_dying': 'WarningAlerts',
+    'alert_imprint_available': 'WarningAlerts',
+    'alert_gasoline_low': 'WarningAlerts',
+    'alert_element_low': 'WarningAlerts',
+    'alert_enemy_nearby': 'WarningAlerts',
+    'player_stats_background': 'PlayerStatsPanels',
+    'player_stats_header': 'PlayerStatsPanels',
+    'player_stat_health': 'PlayerHealthStats',
+    'player_stat_health_value': 'PlayerHealthStats',
+    'player_stat_health_increase_button': 'PlayerHealthStats',
+    'player_stat_stamina': 'PlayerStaminaStats',
+    'player_stat_stamina_value': 'PlayerStaminaStats',
+    'player_stat_stamina_increase_button': 'PlayerStaminaStats',
+    'player_stat_oxygen': 'PlayerOxygenStats',
+    'player_stat_oxygen_value': 'PlayerOxygenStats',
+    'player_stat_oxygen_increase_button': 'PlayerOxygenStats',
+    'player_stat_food': 'PlayerFoodStats',
+    'player_stat_food_value': 'PlayerFoodStats',
+    'player_stat_food_increase_button': 'PlayerFoodStats',
+    'player_stat_water': 'PlayerWaterStats',
+    'player_stat_water_value': 'PlayerWaterStats',
+    'player_stat_water_increase_button': 'PlayerWaterStats',
+    'player_stat_weight': 'PlayerWeightStats',
+    'player_stat_weight_value': 'PlayerWeightStats',
+    'player_stat_weight_increase_button': 'PlayerWeightStats',
+    'player_stat_melee': 'PlayerMeleeStats',
+    'player_stat_melee_value': 'PlayerMeleeStats',
+    'player_stat_melee_increase_button': 'PlayerMeleeStats',
+    'player_stat_speed': 'PlayerSpeedStats',
+    'player_stat_speed_value': 'PlayerSpeedStats',
+    'player_stat_speed_increase_button': 'PlayerSpeedStats',
+    'player_stat_fortitude': 'PlayerFortitudeStats',
+    'player_stat_fortitude_value': 'PlayerFortitudeStats',
+    'player_stat_fortitude_increase_button': 'PlayerFortitudeStats',
+    'player_stat_crafting': 'PlayerCraftingStats',
+    'player_stat_crafting_value': 'PlayerCraftingStats',
+    'player_stat_crafting_increase_button': 'PlayerCraftingStats',
+    'player_level_display': 'PlayerLevelElements',
+    'player_xp_bar': 'PlayerLevelElements',
+    'player_xp_to_next_level': 'PlayerLevelElements',
+    'player_levelup_points': 'PlayerLevelElements',
+    'player_total_levels_applied': 'PlayerLevelElements',
+    'player_max_level_warning': 'PlayerLevelElements',
+    'player_stat_tooltip': 'PlayerLevelElements',
+    'player_stat_percentage_bonus': 'PlayerLevelElements',
+    'player_ascension_level': 'PlayerLevelElements',
+    'player_mindwipe_button': 'PlayerLevelElements',
+    'player_tek_implant_status': 'PlayerSpecialStats',
+    'player_mutation_counter': 'PlayerSpecialStats',
+    'player_pheromone_status': 'PlayerSpecialStats',
+    'player_reset_stats_button': 'PlayerSpecialStats',
+    'player_stat_wild_value': 'PlayerSpecialStats',
+    'player_stat_tamed_bonus': 'PlayerSpecialStats',
+    'player_stat_level_contribution': 'PlayerSpecialStats',
+    'tribe_management_background': 'TribeManagementPanels',
+    'tribe_management_header': 'TribeManagementPanels',
+    'tribe_name_display': 'TribeManagementPanels',
+    'tribe_owner_indicator': 'TribeManagementPanels',
+    'tribe_rank_display': 'TribeManagementPanels',
+    'tribe_member_list': 'TribeMembers',
+    'tribe_member_entry': 'TribeMembers',
+    'tribe_member_name': 'TribeMembers',
+    'tribe_member_rank': 'TribeMembers',
+    'tribe_member_level': 'TribeMembers',
+    'tribe_member_online_status': 'TribeMembers',
+    'tribe_member_online': 'TribeMembers',
+    'tribe_member_offline': 'TribeMembers',
+    'tribe_member_last_online': 'TribeMembers',
+    'tribe_log_tab': 'TribeLog',
+    'tribe_log_container': 'TribeLog',
+    'tribe_log_entry': 'TribeLog',
+    'tribe_log_timestamp': 'TribeLog',
+    'tribe_log_filter': 'TribeLog',
+    'tribe_log_clear_button': 'TribeLog',
+    'tribe_alliance_tab': 'TribeAlliances',
+    'tribe_alliance_list': 'TribeAlliances',
+    'tribe_alliance_entry': 'TribeAlliances',
+    'tribe_alliance_request_button': 'TribeAlliances',
+    'tribe_alliance_accept_button': 'TribeAlliances',
+    'tribe_alliance_reject_button': 'TribeAlliances',
+    'tribe_governance_tab': 'TribeGovernance',
+    'tribe_governance_settings': 'TribeGovernance',
+    'tribe_rank_management': 'TribeGovernance',
+    'tribe_rank_entry': 'TribeGovernance',
+    'tribe_rank_name': 'TribeGovernance',
+    'tribe_rank_permissions': 'TribeGovernance',
+    'tribe_permissions_setting': 'TribeGovernance',
+    'tribe_permission_Structure': 'TribePermissions',
+    'tribe_permission_access': 'TribePermissions',
+    'tribe_permission_dinos': 'TribePermissions',
+    'tribe_permission_inventories': 'TribePermissions',
+    'tribe_permission_unclaim': 'TribePermissions',
+    'tribe_permission_invite': 'TribePermissions',
+    'tribe_permission_promote': 'TribePermissions',
+    'tribe_permission_demote': 'TribePermissions',
+    'tribe_permission_kick': 'TribePermissions',
+    'tribe_pincode_setting': 'TribeSettings',
+    'tribe_pincode_toggle': 'TribeSettings',
+    'tribe_tame_claim_setting': 'TribeSettings',
+    'tribe_structure_ownership': 'TribeSettings',
+    'tribe_invitation_button': 'TribeSettings',
+    'tribe_invitation_field': 'TribeSettings',
+    'tribe_kick_button': 'TribeSettings',
+    'tribe_promote_button': 'TribeSettings',
+    'tribe_demote_button': 'TribeSettings',
+    'tribe_leave_button': 'TribeSettings',
+    'tribe_disband_button': 'TribeSettings',
+    'tribe_taxes_setting': 'TribeAdvancedSettings',
+    'tribe_stats_panel': 'TribeAdvancedSettings',
+    'tribe_territory_map': 'TribeAdvancedSettings',
+    'tribe_member_notes': 'TribeAdvancedSettings',
+    'tribe_message_of_the_day': 'TribeAdvancedSettings',
+    'tribe_government_type': 'TribeAdvancedSettings',
+    'structure_placement_distance_indicator': 'PlacementValidation',
+    'structure_placement_angle_indicator': 'PlacementValidation',
+    'structure_placement_align_indicator': 'PlacementValidation',
+    'structure_placement_underwater_indicator': 'PlacementValidation',
+    'structure_placement_no_underwater': 'PlacementValidation',
+    'structure_placement_rotation_controls': 'PlacementControls',
+    'structure_placement_radius_indicator': 'PlacementControls',
+    'structure_placement_ceiling_height': 'PlacementControls',
+    'structure_placement_wall_height': 'PlacementControls',
+    'structure_placement_water_pipe_connection': 'PlacementControls',
+    'structure_placement_electrical_connection': 'PlacementControls',
+    'structure_placement_level_indicator': 'PlacementControls',
+    'structure_placement_resource_costs': 'PlacementResources',
+    'structure_placement_insufficient_resources': 'PlacementResources',
+    'structure_placement_structure_limit': 'PlacementResources',
+    'structure_placement_platform_limit': 'PlacementResources',
+    'structure_placement_platform_restriction': 'PlacementResources',
+    'structure_placement_tek_requirement': 'PlacementResources',
+    'structure_placement_dlc_requirement': 'PlacementResources',
+    'structure_placement_boss_unlock_required': 'PlacementResources',
+    'structure_placement_pickup_timer': 'PlacementTimers',
+    'structure_placement_demolish_refund': 'PlacementTimers',
+    'structure_placement_element_range': 'PlacementTimers',
+    'structure_placement_tek_shield_range': 'PlacementTimers',
+    'structure_placement_turret_range': 'PlacementTimers',
+    'structure_placement_greenhouse_effect': 'PlacementEnvironment',
+    'structure_placement_crop_plot_fertility': 'PlacementEnvironment',
+    'structure_placement_temperature_effect': 'PlacementEnvironment',
+    'structure_placement_air_conditioner_range': 'PlacementEnvironment',
+    'structure_placement_generator_range': 'PlacementEnvironment',
+    'structure_placement_hatchery_range': 'PlacementEnvironment',
+    'structure_placement_trap_trigger_range': 'PlacementEnvironment',
+    'structure_placement_dino_gate_clearance': 'PlacementSpecials',
+    'structure_placement_ceiling_stability': 'PlacementSpecials',
+    'structure_placement_foundation_stability': 'PlacementSpecials',
+    'structure_placement_pvp_restriction': 'PlacementSpecials',
+    'structure_placement_foundation_depth': 'PlacementSpecials',
+    'structure_placement_terrain_flatten': 'PlacementSpecials',
+    'structure_placement_dedi_storage_selection': 'PlacementSpecials',
+    'structure_placement_pipe_intersection': 'PlacementSpecials',
+    'structure_placement_irrigation_status': 'PlacementSpecials',
+    'structure_placement_wind_turbine_efficiency': 'PlacementSpecials',
+    'structure_placement_no_build_zone': 'PlacementSpecials',
+    'electrical_system_background': 'ElectricalInterface',
+    'electrical_system_title': 'ElectricalInterface',
+    'electrical_system_powered_indicator': 'ElectricalInterface',
+    'electrical_system_unpowered_indicator': 'ElectricalInterface',
+    'electrical_system_consumption_display': 'ElectricalInterface',
+    'electrical_system_generation_display': 'ElectricalInterface',
+    'electrical_system_range_indicator': 'ElectricalInterface',
+    'electrical_system_connection_points': 'ElectricalInterface',
+    'electrical_system_cable_indicator': 'ElectricalInterface',
+    'electrical_system_device_list': 'ElectricalDevices',
+    'electrical_system_device_entry': 'ElectricalDevices',
+    'electrical_system_device_name': 'ElectricalDevices',
+    'electrical_system_device_power_draw': 'ElectricalDevices',
+    'electrical_system_device_status': 'ElectricalDevices',
+    'electrical_system_device_range': 'ElectricalDevices',
+    'electrical_system_device_toggle': 'ElectricalDevices',
+    'electrical_system_circuit_group': 'ElectricalCircuits',
+    'electrical_system_circuit_selector': 'ElectricalCircuits',
+    'electrical_system_junction_status': 'ElectricalCircuits',
+    'electrical_system_add_connection_button': 'ElectricalCircuits',
+    'electrical_system_remove_connection_button': 'ElectricalCircuits',
+    'electrical_system_generator_fuel_level': 'ElectricalGenerators',
+    'electrical_system_generator_fuel_slot': 'ElectricalGenerators',
+    'electrical_system_generator_efficiency': 'ElectricalGenerators',
+    'electrical_system_generator_output': 'ElectricalGenerators',
+    'electrical_system_battery_charge': 'ElectricalGenerators',
+    'electrical_system_battery_duration': 'ElectricalGenerators',
+    'electrical_system_battery_charging_indicator': 'ElectricalGenerators',
+    'electrical_system_battery_discharging_indicator': 'ElectricalGenerators',
+    'electrical_system_solar_panel_efficiency': 'ElectricalGenerators',
+    'electrical_system_wind_turbine_efficiency': 'ElectricalGenerators',
+    'electrical_system_auto_power_toggle': 'ElectricalSettings',
+    'electrical_system_timer_setting': 'ElectricalSettings',
+    'electrical_system_schedule_button': 'ElectricalSettings',
+    'electrical_system_schedule_entry': 'ElectricalSettings',
+    'electrical_system_on_time_selector': 'ElectricalSettings',
+    'electrical_system_off_time_selector': 'ElectricalSettings',
+    'electrical_system_day_selector': 'ElectricalSettings',
+    'electrical_system_pin_code_field': 'ElectricalSettings',
+    'electrical_system_lock_button': 'ElectricalSettings',
+    'electrical_system_unlock_button': 'ElectricalSettings',
+    'electrical_system_tribe_access_toggle': 'ElectricalSettings',
+    'electrical_system_public_access_toggle': 'ElectricalSettings',
+    'electrical_system_power_grid_map': 'ElectricalGrid',
+    'electrical_system_grid_segment': 'ElectricalGrid',
+    'electrical_system_redundancy_indicator': 'ElectricalGrid',
+    'electrical_system_overload_warning': 'ElectricalGrid',
+    'electrical_system_short_circuit_warning': 'ElectricalGrid',
+    'electrical_system_gasoline_efficiency': 'ElectricalGrid',
+    'electrical_system_tek_generator_element': 'ElectricalGrid',
+    'electrical_system_tek_generator_range': 'ElectricalGrid',
+    'electrical_system_tek_generator_devices': 'ElectricalGrid',
+    'electrical_system_device_priority': 'ElectricalAdvanced',
+    'electrical_system_unconnected_warning': 'ElectricalAdvanced',
+    'electrical_system_device_hover_info': 'ElectricalAdvanced',
+    'electrical_system_cable_management': 'ElectricalAdvanced',
+    'electrical_system_cable_color_selector': 'ElectricalAdvanced',
+    'electrical_system_cable_visibility_toggle': 'ElectricalAdvanced',
+    'electrical_system_wireless_connection': 'ElectricalAdvanced',
+    'electrical_system_transmitter_status': 'ElectricalAdvanced',
+    'electrical_system_receiver_status': 'ElectricalAdvanced',
+    'electrical_system_frequency_selector': 'ElectricalAdvanced',
+    'electrical_system_energy_consumption_graph': 'ElectricalMonitoring',
+    'electrical_system_peak_usage_display': 'ElectricalMonitoring',
+    'electrical_system_power_fluctuation': 'ElectricalMonitoring',
+    'electrical_system_backup_power_status': 'ElectricalMonitoring',
+    'electrical_system_alarm_system_button': 'ElectricalMonitoring',
+    'electrical_system_alarm_notification': 'ElectricalMonitoring',
+    'electrical_system_remote_power_button': 'ElectricalMonitoring',
+    'electrical_system_disconnect_button': 'ElectricalMonitoring',
+    'electrical_system_reconnect_button': 'ElectricalMonitoring',
+    'electrical_system_rename_device_button': 'ElectricalMonitoring',
+    'electrical_system_signal_indicator': 'ElectricalMonitoring',
+    'transfer_interface_background': 'TransferBackground',
+    'transfer_interface_title': 'TransferBackground',
+    'transfer_interface_server_list': 'TransferServerList',
+    'transfer_interface_server_entry': 'TransferServerList',
+    'transfer_interface_server_name': 'TransferServerList',
+    'transfer_interface_server_type': 'TransferServerList',
+    'transfer_interface_server_population': 'TransferServerList',
+    'transfer_interface_server_ping': 'TransferServerList',
+    'transfer_interface_server_version': 'TransferServerList',
+    'transfer_interface_server_official': 'TransferServerList',
+    'transfer_interface_server_unofficial': 'TransferServerList',
+    'transfer_interface_server_modded': 'TransferServerList',
+    'transfer_interface_server_cluster': 'TransferServerList',
+    'transfer_interface_server_favorite': 'TransferServerList',
+    'transfer_interface_server_recent': 'TransferServerList',
+    'transfer_interface_server_password': 'TransferServerList',
+    'transfer_interface_server_filter': 'TransferSearch',
+    'transfer_interface_search_bar': 'TransferSearch',
+    'transfer_interface_search_icon': 'TransferSearch',
+    'transfer_interface_sort_button': 'TransferSearch',
+    'transfer_interface_sort_options': 'TransferSearch',
+    'transfer_interface_refresh_button': 'TransferSearch',
+    'transfer_interface_join_button': 'TransferButtons',
+    'transfer_interface_cancel_button': 'TransferButtons',
+    'transfer_interface_select_button': 'TransferButtons',
+    'transfer_interface_player_tab': 'TransferTabs',
+    'transfer_interface_item_tab': 'TransferTabs',
+    'transfer_interface_dino_tab': 'TransferTabs',
+    'transfer_interface_player_select': 'TransferPlayers',
+    'transfer_interface_player_entry': 'TransferPlayers',
+    'transfer_interface_player_name': 'TransferPlayers',
+    'transfer_interface_player_level': 'TransferPlayers',
+    'transfer_interface_player_tribe': 'TransferPlayers',
+    'transfer_interface_player_server': 'TransferPlayers',
+    'transfer_interface_player_preview': 'TransferPlayers',
+    'transfer_interface_player_last_played': 'TransferPlayers',
+    'transfer_interface_download_player_button': 'TransferPlayers',
+    'transfer_interface_upload_player_button': 'TransferPlayers',
+    'transfer_interface_create_player_button': 'TransferPlayers',
+    'transfer_interface_item_storage': 'TransferItems',
+    'transfer_interface_item_slot': 'TransferItems',
+    'transfer_interface_item_icon': 'TransferItems',
+    'transfer_interface_item_name': 'TransferItems',
+    'transfer_interface_item_count': 'TransferItems',
+    'transfer_interface_item_tooltip': 'TransferItems',
+    'transfer_interface_download_item_button': 'TransferItems',
+    'transfer_interface_upload_item_button': 'TransferItems',
+    'transfer_interface_dino_storage': 'TransferDinos',
+    'transfer_interface_dino_entry': 'TransferDinos',
+    'transfer_interface_dino_icon': 'TransferDinos',
+    'transfer_interface_dino_name': 'TransferDinos',
+    'transfer_interface_dino_level': 'TransferDinos',
+    'transfer_interface_dino_gender': 'TransferDinos',
+    'transfer_interface_dino_stats': 'TransferDinos',
+    'transfer_interface_dino_preview': 'TransferDinos',
+    'transfer_interface_download_dino_button': 'TransferDinos',
+    'transfer_interface_upload_dino_button': 'TransferDinos',
+    'transfer_interface_transfer_cooldown': 'TransferStatus',
+    'transfer_interface_cooldown_icon': 'TransferStatus',
+    'transfer_interface_storage_slots': 'TransferStatus',
+    'transfer_interface_storage_used': 'TransferStatus',
+    'transfer_interface_storage_total': 'TransferStatus',
+    'transfer_interface_weight_indicator': 'TransferStatus',
+    'transfer_interface_weight_limit': 'TransferStatus',
+    'transfer_interface_weight_warning': 'TransferStatus',
+    'transfer_interface_timer_countdown': 'TransferStatus',
+    'transfer_interface_transfer_rules': 'TransferStatus',
+    'transfer_interface_prohibited_items': 'TransferStatus',
+    'transfer_interface_prohibited_dinos': 'TransferStatus',
+    'transfer_interface_event_warning': 'TransferStatus',
+    'transfer_interface_tek_warning': 'TransferStatus',
+    'transfer_interface_element_warning': 'TransferStatus',
+    'transfer_interface_connection_status': 'TransferConfirmation',
+    'transfer_interface_transfer_progress': 'TransferConfirmation',
+    'transfer_interface_transfer_error': 'TransferConfirmation',
+    'transfer_interface_confirmation_prompt': 'TransferConfirmation',
+    'transfer_interface_confirm_button': 'TransferConfirmation',
+    'transfer_interface_decline_button': 'TransferConfirmation',
+    'transfer_interface_password_field': 'TransferConfirmation',
+    'transfer_interface_cluster_filter': 'TransferFilters',
+    'transfer_interface_official_filter': 'TransferFilters',
+    'transfer_interface_unofficial_filter': 'TransferFilters',
+    'transfer_interface_favorites_filter': 'TransferFilters',
+    'transfer_interface_recent_filter': 'TransferFilters',
+    'transfer_interface_history_button': 'TransferFilters',
+    'transfer_interface_history_list': 'TransferFilters',
+    'transfer_interface_history_entry': 'TransferFilters',
+    'transfer_interface_server_info_panel': 'TransferServerInfo',
+    'transfer_interface_map_indicator': 'TransferServerInfo',
+    'transfer_interface_rates_display': 'TransferServerInfo',
+    'transfer_interface_event_display': 'TransferServerInfo',
+    'transfer_interface_server_rules': 'TransferServerInfo',
+    'transfer_interface_server_mods': 'TransferServerInfo',
+    'transfer_interface_mod_entry': 'TransferServerInfo',
+    'transfer_interface_tribute_requirements': 'TransferServerInfo',
+    'transfer_interface_tribute_slot': 'TransferServerInfo',
+    'settings_menu_background': 'SettingsBackground',
+    'settings_menu_title': 'SettingsBackground',
+    'settings_category_tabs': 'SettingsTabs',
+    'settings_tab_general': 'SettingsTabs',
+    'settings_tab_graphics': 'SettingsTabs',
+    'settings_tab_audio': 'SettingsTabs',
+    'settings_tab_controls': 'SettingsTabs',
+    'settings_tab_game': 'SettingsTabs',
+    'settings_tab_server': 'SettingsTabs',
+    'settings_tab_interface': 'SettingsTabs',
+    'settings_tab_advanced': 'SettingsTabs',
+    'settings_section_header': 'SettingsSections',
+    'settings_option_row': 'SettingsSections',
+    'settings_option_name': 'SettingsSections',
+    'settings_option_description': 'SettingsSections',
+    'settings_option_value': 'SettingsSections',
+    'settings_slider_control': 'SettingsControls',
+    'settings_slider_value': 'SettingsControls',
+    'settings_dropdown_control': 'SettingsControls',
+    'settings_dropdown_option': 'SettingsControls',
+    'settings_checkbox_control': 'SettingsControls',
+    'settings_checkbox_checked': 'SettingsControls',
+    'settings_checkbox_unchecked': 'SettingsControls',
+    'settings_radio_button': 'SettingsControls',
+    'settings_radio_selected': 'SettingsControls',
+    'settings_radio_unselected': 'SettingsControls',
+    'settings_input_field': 'SettingsControls',
+    'settings_input_value': 'SettingsControls',
+    'settings_button_control': 'SettingsControls',
+    'settings_reset_button': 'SettingsActions',
+    'settings_apply_button': 'SettingsActions',
+    'settings_save_button': 'SettingsActions',
+    'settings_cancel_button': 'SettingsActions',
+    'holiday_event_interface': 'HolidayInterfaces',
+    'easter_egg_hunt_tracker': 'HolidayInterfaces',
+    'summer_bash_interface': 'HolidayInterfaces',
+    'fear_evolved_interface': 'HolidayInterfaces',
+    'winter_wonderland_interface': 'HolidayInterfaces',
+    'valentines_day_interface': 'HolidayInterfaces',
+    'eggcellent_adventure_ui': 'HolidayInterfaces',
+    'genesis_race_timer': 'GenesisMissions',
+    'genesis_hunt_tracker': 'GenesisMissions',
+    'genesis_fishing_meter': 'GenesisMissions',
+    'tek_generator_interface': 'TekInterfaces',
+    'tek_crop_plot_interface': 'TekInterfaces',
+    'creature_camera_view': 'TekInterfaces',
+    'tek_sensor_interface': 'TekInterfaces',
+    'tek_remote_camera': 'TekInterfaces',
+    'holo_projector_interface': 'TekInterfaces',
+    'megachelon_planter': 'TekInterfaces',
+    'aquatic_tames_oxygen_interface': 'TekCreatureUI',
+    'astrodelphis_energy': 'TekCreatureUI',
+    'noglin_brain_jack_interface': 'TekCreatureUI',
+    'exo_mek_interface': 'TekCreatureUI',
+    'maewing_baby_milk_meter': 'TekCreatureUI',
+    'shadowmane_charge_meter': 'TekCreatureUI',
+    'gacha_crafting_interface': 'TekCreatureUI',
+    'stryder_interface': 'TekCreatureUI',
+    'enforcer_interface': 'TekCreatureUI',
+    'tek_element_icon': 'TekResources',
+    'tek_element_count': 'TekResources',
+    'tek_element_shard_icon': 'TekResources',
+    'tek_element_shard_count': 'TekResources',
+    'tek_element_dust_icon': 'TekResources',
+    'tek_element_dust_count': 'TekResources',
+    'tek_transmitter_interface': 'TekTransmitter',
+    'tek_transmitter_upload_tab': 'TekTransmitter',
+    'tek_transmitter_download_tab': 'TekTransmitter',
+    'tek_transmitter_creatures_tab': 'TekTransmitter',
+    'tek_transmitter_items_tab': 'TekTransmitter',
+    'tek_transmitter_data_tab': 'TekTransmitter',
+    'tek_transmitter_upload_timer': 'TekTransmitter',
+    'tek_transmitter_download_timer': 'TekTransmitter',
+    'tek_transmitter_upload_button': 'TekTransmitter',
+    'tek_transmitter_download_button': 'TekTransmitter',
+    'tek_transmitter_item_list': 'TekTransmitter',
+    'tek_transmitter_creature_list': 'TekTransmitter',
+    'tek_teleporter_interface': 'TekTeleporter',
+    'tek_teleporter_location_list': 'TekTeleporter',
+    'tek_teleporter_location_entry': 'TekTeleporter',
+    'tek_teleporter_teleport_button': 'TekTeleporter',
+    'tek_teleporter_add_location_button': 'TekTeleporter',
+    'tek_teleporter_rename_button': 'TekTeleporter',
+    'tek_teleporter_remove_button': 'TekTeleporter',
+    'tek_replicator_interface': 'TekAdvancedStructures',
+    'tek_replicator_crafting_tab': 'TekAdvancedStructures',
+    'tek_replicator_inventory_tab': 'TekAdvancedStructures',
+    'tek_replicator_element_slot': 'TekAdvancedStructures',
+    'tek_cloning_interface': 'TekAdvancedStructures',
+    'tek_cloning_dino_preview': 'TekAdvancedStructures',
+    'tek_cloning_progress_bar': 'TekAdvancedStructures',
+    'tek_cloning_cost_display': 'TekAdvancedStructures',
+    'tek_cloning_start_button': 'TekAdvancedStructures',
+    'tek_cloning_cancel_button': 'TekAdvancedStructures',
+    'tek_dedicated_storage': 'TekStorage',
+    'tek_dedicated_storage_type': 'TekStorage',
+    'tek_dedicated_storage_count': 'TekStorage',
+    'tek_dedicated_storage_capacity': 'TekStorage',
+    'tek_generator_range_display': 'TekGenerator',
+    'tek_generator_element_level': 'TekGenerator',
+    'tek_generator_power_indicator': 'TekGenerator',
+    'tek_generator_connected_devices': 'TekGenerator',
+    'tek_shield_interface': 'TekShield',
+    'tek_shield_range_display': 'TekShield',
+    'tek_shield_strength_display': 'TekShield',
+    'tek_shield_damage_indicator': 'TekShield',
+    'tek_trough_interface': 'TekTrough',
+    'tek_trough_food_list': 'TekTrough',
+    'tek_trough_range_display': 'TekTrough',
+    'tek_trough_status_indicator': 'TekTrough',
+    'tek_hover_skiff_controls': 'TekVehicles',
+    'tek_hover_skiff_altitude': 'TekVehicles',
+    'tek_hover_skiff_speed': 'TekVehicles',
+    'tek_hover_skiff_fuel': 'TekVehicles',
+    'tek_hover_skiff_passenger_list': 'TekVehicles',
+    'tek_sensor_range_setting': 'TekSensor',
+    'tek_sensor_mode_setting': 'TekSensor',
+    'tek_sensor_entity_filter': 'TekSensor',
+    'tek_sensor_alert_setting': 'TekSensor',
+    'tek_visor_overlay': 'TekVisor',
+    'tek_visor_mode_selector': 'TekVisor',
+    'tek_visor_night_vision': 'TekVisor',
+    'tek_visor_entity_scan': 'TekVisor',
+    'tek_visor_resource_scan': 'TekVisor',
+    'tek_visor_stats_display': 'TekVisor',
+    'tek_visor_range_indicator': 'TekVisor',
+    'tek_visor_battery_indicator': 'TekVisor',
+    'tek_gauntlet_punch_charge': 'TekArmor',
+    'tek_gauntlet_cooldown': 'TekArmor',
+    'tek_boots_speed_indicator': 'TekArmor',
+    'tek_boots_jump_indicator': 'TekArmor',
+    'tek_chestpiece_flight_fuel': 'TekArmor',
+    'tek_chestpiece_flight_speed': 'TekArmor',
+    'tek_chestpiece_flight_altitude': 'TekArmor',
+    'tek_rifle_charge_indicator': 'TekWeapons',
+    'tek_rifle_mode_selector': 'TekWeapons',
+    'tek_rifle_ammo_display': 'TekWeapons',
+    'tek_grenade_launcher_charge': 'TekWeapons',
+    'tek_stryder_interface': 'TekCreatures',
+    'tek_stryder_module_slots': 'TekCreatures',
+    'tek_stryder_resource_capacity': 'TekCreatures',
+    'tek_stryder_farming_indicator': 'TekCreatures',
+    'tek_megachelon_platform': 'TekCreatures',
+    'tek_megachelon_planter': 'TekCreatures',
+    'tek_megachelon_greenhouse': 'TekCreatures',
+    'tek_enforce_mode_interface': 'TekCreatures',
+    'boss_arena_entry_interface': 'BossEntryInterface',
+    'boss_arena_tribute_slots': 'BossEntryInterface',
+    'boss_arena_artifact_slots': 'BossEntryInterface',
+    'boss_arena_player_list': 'BossEntryInterface',
+    'boss_arena_tame_list': 'BossEntryInterface',
+    'boss_arena_difficulty_selector': 'BossEntryInterface',
+    'boss_arena_timer_countdown': 'BossEntryInterface',
+    'boss_arena_start_button': 'BossEntryInterface',
+    'boss_arena_cancel_button': 'BossEntryInterface',
+    'boss_fight_timer': 'BossFightElements',
+    'boss_fight_player_list': 'BossFightElements',
+    'boss_fight_player_entry': 'BossFightElements',
+    'boss_fight_tame_list': 'BossFightElements',
+    'boss_fight_tame_entry': 'BossFightElements',
+    'boss_health_bar': 'BossFightElements',
+    'boss_health_percentage': 'BossFightElements',
+    'boss_name_display': 'BossFightElements',
+    'boss_damage_indicator': 'BossFightElements',
+    'boss_attack_warning': 'BossAttackWarnings',
+    'boss_special_attack_warning': 'BossAttackWarnings',
+    'boss_minion_spawned_alert': 'BossAttackWarnings',
+    'boss_environment_hazard': 'BossAttackWarnings',
+    'boss_arena_safe_zone': 'BossAttackWarnings',
+    'boss_arena_danger_zone': 'BossAttackWarnings',
+    'boss_phase_transition': 'BossAttackWarnings',
+    'boss_arena_exit_timer': 'BossArenaExit',
+    'boss_arena_teleport_indicator': 'BossArenaExit',
+    'boss_arena_item_reward_list': 'BossArenaExit',
+    'boss_arena_tekgram_unlocked': 'BossArenaExit',
+    'boss_arena_defeat_message': 'BossArenaExit',
+    'boss_arena_victory_message': 'BossArenaExit',
+    'boss_arena_disconnect_warning': 'BossArenaExit',
+    'boss_arena_player_death_marker': 'BossArenaExit',
+    'boss_arena_respawn_timer': 'BossArenaExit',
+    'boss_arena_spectator_mode': 'BossArenaExit',
+    'boss_arena_damage_leaderboard': 'BossArenaExit',
+    'boss_artifact_collection_notification': 'BossArtifactElements',
+    'boss_arena_tek_suit_activation': 'BossArtifactElements',
+    'boss_arena_element_reward': 'BossArtifactElements',
+    'boss_arena_experience_reward': 'BossArtifactElements',
+    'boss_arena_ascension_cutscene': 'BossArtifactElements',
+    'boss_arena_reward_multiplier': 'BossArtifactElements',
+    'boss_arena_cave_progress': 'BossArtifactElements',
+    'boss_arena_required_items_list': 'BossArtifactElements',
+    'boss_arena_missing_items': 'BossArtifactElements',
+    'boss_arena_element_buffer': 'BossArtifactElements',
+    'boss_arena_difficulty_icon': 'BossDifficultyElements',
+    'boss_arena_previous_record': 'BossDifficultyElements',
+    'boss_arena_tribe_limit': 'BossDifficultyElements',
+    'boss_arena_dino_limit': 'BossDifficultyElements',
+    'boss_arena_dino_type_restriction': 'BossDifficultyElements',
+    'boss_arena_enrage_timer': 'BossDifficultyElements',
+    'boss_arena_cinematic_skip': 'BossDifficultyElements',
+    'event_interface_background': 'EventBackground',
+    'event_title_header': 'EventBackground',
+    'event_description_text': 'EventBackground',
+    'event_timer_countdown': 'EventBackground',
+    'event_progress_bar': 'EventBackground',
+    'event_objective_list': 'EventObjectives',
+    'event_objective_entry': 'EventObjectives',
+    'event_objective_complete_marker': 'EventObjectives',
+    'event_reward_preview': 'EventObjectives',
+    'event_reward_list': 'EventObjectives',
+    'event_reward_item': 'EventObjectives',
+    'event_leaderboard': 'EventLeaderboard',
+    'event_leaderboard_entry': 'EventLeaderboard',
+    'event_participation_count': 'EventLeaderboard',
+    'event_difficulty_indicator': 'EventLeaderboard',
+    'event_location_marker': 'EventLeaderboard',
+    'event_start_button': 'EventControls',
+    'event_cancel_button': 'EventControls',
+    'event_restart_button': 'EventControls',
+    'death_screen_background': 'DeathScreenBackground',
+    'death_screen_title': 'DeathScreenBackground',
+    'death_message_display': 'DeathScreenBackground',
+    'death_level_lost_indicator': 'DeathScreenBackground',
+    'death_item_lost_list': 'DeathScreenBackground',
+    'death_item_lost_entry': 'DeathScreenBackground',
+    'death_respawn_timer': 'DeathRespawnElements',
+    'death_location_coordinates': 'DeathRespawnElements',
+    'death_map_marker': 'DeathRespawnElements',
+    'death_respawn_button': 'DeathRespawnElements',
+    'death_harvest_body_indicator': 'DeathRespawnElements',
+    'death_spectate_button': 'DeathRespawnElements',
+    'death_tribe_notify_indicator': 'DeathRespawnElements',
+    'death_respawn_location_list': 'DeathRespawnLocations',
+    'death_respawn_location_entry': 'DeathRespawnLocations',
+    'death_respawn_bed_entry': 'DeathRespawnLocations',
+    'death_respawn_sleeping_bag_entry': 'DeathRespawnLocations',
+    'death_respawn_random_entry': 'DeathRespawnLocations',
+    'death_respawn_location_cooldown': 'DeathRespawnLocations',
+    'death_respawn_location_icon': 'DeathRespawnLocations',
+    'death_respawn_location_name': 'DeathRespawnLocations',
+    'death_respawn_region_selector': 'DeathRespawnLocations',
+    'death_respawn_map_view': 'DeathRespawnLocations',
+    'death_body_decay_timer': 'DeathCorpseElements',
+    'death_tribe_corpse_marker': 'DeathCorpseElements',
+    'death_tribe_corpse_name': 'DeathCorpseElements',
+    'death_respawn_search_bar': 'DeathCorpseElements',
+    'death_respawn_filter': 'DeathCorpseElements',
+    'death_respawn_sort_button': 'DeathCorpseElements',
+    'death_obituary_text': 'DeathDetailsElements',
+    'death_killed_by_display': 'DeathDetailsElements',
+    'death_tribe_bed_category': 'DeathDetailsElements',
+    'death_personal_bed_category': 'DeathDetailsElements',
+    'death_public_bed_category': 'DeathDetailsElements',
+    'death_respawn_header': 'DeathDetailsElements',
+    'death_screen_tip': 'DeathDetailsElements',
+    'death_screen_close_button': 'DeathScreenControls',
+    'death_item_recovery_info': 'DeathScreenControls',
+    'death_xp_penalty_display': 'DeathScreenControls',
+    'death_player_level_display': 'DeathScreenControls',
+    'death_tribe_icon': 'DeathScreenControls',
+    'death_transfer_warning': 'DeathScreenControls',
+    'death_retrievable_body_marker': 'DeathScreenControls',
+    'death_retrievable_body_timer': 'DeathScreenControls',
+    'death_environment_killed': 'DeathCauseElements',
+    'death_player_killed': 'DeathCauseElements',
+    'death_creature_killed': 'DeathCauseElements',
+    'death_suicide_indicator': 'DeathCauseElements',
+    'death_disconnect_warning': 'DeathCauseElements',
+    'death_respawn_confirmation': 'DeathCauseElements',
+    'death_item_protected_tag': 'DeathCauseElements',
+    'death_reconnect_button': 'DeathCauseElements',
+    'death_return_to_menu': 'DeathCauseElements',
+    'breeding_interface_background': 'BreedingBackground',
+    'breeding_interface_header': 'BreedingBackground',
+    'breeding_male_stats_panel': 'BreedingBackground',
+    'breeding_female_stats_panel': 'BreedingBackground',
+    'breeding_compatibility_indicator': 'BreedingBackground',
+    'breeding_enable_mating_button': 'BreedingControls',
+    'breeding_disable_mating_button': 'BreedingControls',
+    'breeding_mating_progress_bar': 'BreedingControls',
+    'breeding_mating_cooldown_timer': 'BreedingControls',
+    'breeding_gestation_progress_bar': 'BreedingControls',
+    'breeding_gestation_timer': 'BreedingControls',
+    'breeding_egg_incubation_bar': 'BreedingEggs',
+    'breeding_egg_incubation_timer': 'BreedingEggs',
+    'breeding_egg_temperature_indicator': 'BreedingEggs',
+    'breeding_egg_temperature_bar': 'BreedingEggs',
+    'breeding_egg_too_hot_warning': 'BreedingEggs',
+    'breeding_egg_too_cold_warning': 'BreedingEggs',
+    'breeding_egg_health_bar': 'BreedingEggs',
+    'breeding_egg_inventory_icon': 'BreedingEggs',
+    'breeding_egg_fertility_status': 'BreedingEggs',
+    'breeding_egg_claim_button': 'BreedingEggs',
+    'breeding_egg_destroy_button': 'BreedingEggs',
+    'breeding_egg_pickup_button': 'BreedingEggs',
+    'breeding_egg_drop_button': 'BreedingEggs',
+    'breeding_egg_spoil_timer': 'BreedingEggs',
+    'breeding_mutation_indicator': 'BreedingMutations',
+    'breeding_mutation_counter': 'BreedingMutations',
+    'breeding_baby_claim_prompt': 'BreedingMutations',
+    'breeding_baby_name_field': 'BreedingMutations',
+    'breeding_baby_imprint_status': 'BreedingImprinting',
+    'breeding_imprint_progress_bar': 'BreedingImprinting',
+    'breeding_imprint_quality': 'BreedingImprinting',
+    'breeding_imprint_timer': 'BreedingImprinting',
+    'breeding_imprint_action_icon': 'BreedingImprinting',
+    'breeding_imprint_success_indicator': 'BreedingImprinting',
+    'breeding_maturation_progress_bar': 'BreedingMaturation',
+    'breeding_maturation_timer': 'BreedingMaturation',
+    'breeding_food_consumption_rate': 'BreedingMaturation',
+    'breeding_juvenile_food_warning': 'BreedingMaturation',
+    'breeding_baby_inventory_button': 'BreedingMaturation',
+    'breeding_food_trough_link': 'BreedingMaturation',
+    'breeding_ancestry_button': 'BreedingAncestry',
+    'breeding_ancestry_tree': 'BreedingAncestry',
+    'breeding_ancestry_entry': 'BreedingAncestry',
+    'breeding_stat_inheritance_display': 'BreedingAncestry',
+    'breeding_stat_mutation_highlight': 'BreedingAncestry',
+    'breeding_color_inheritance_display': 'BreedingAncestry',
+    'breeding_color_region_indicator': 'BreedingAncestry',
+    'breeding_region_mutation_highlight': 'BreedingAncestry',
+    'breeding_best_stat_indicator': 'BreedingAncestry',
+    'breeding_mate_boost_indicator': 'BreedingStatusInformation',
+    'breeding_creature_gender_icon': 'BreedingStatusInformation',
+    'breeding_creature_gender_text': 'BreedingStatusInformation',
+    'breeding_growth_phases_display': 'BreedingStatusInformation',
+    'breeding_growth_phase_indicator': 'BreedingStatusInformation',
+    'breeding_cuddle_button': 'BreedingStatusInformation',
+    'breeding_walk_button': 'BreedingStatusInformation',
+    'breeding_feed_button': 'BreedingStatusInformation',
+    'breeding_cryopod_timer': 'BreedingAdvanced',
+    'breeding_cryosickness_timer': 'BreedingAdvanced',
+    'breeding_clone_vs_parent': 'BreedingAdvanced',
+    'breeding_generation_counter': 'BreedingAdvanced',
+    'breeding_linebreeding_indicator': 'BreedingAdvanced',
+    'breeding_mutation_probability': 'BreedingAdvanced',
+    'breeding_breeding_cooldown': 'BreedingAdvanced',
+    'breeding_wandering_warning': 'BreedingAdvanced',
+    'structure_background': 'StructureBackground',
+    'structure_title': 'StructureBackground',
+    'structure_type_icon': 'StructureBackground',
+    'structure_slots_count': 'StructureBackground',
+    'structure_weight_indicator': 'StructureBackground',
+    'structure_weight_bar': 'StructureBackground',
+    'structure_current_weight': 'StructureBackground',
+    'structure_max_weight': 'StructureBackground',
+    'structure_search_bar': 'StructureSearch',
+    'structure_search_icon': 'StructureSearch',
+    'structure_search_results': 'StructureSearch',
+    'structure_close_button': 'StructureSearch',
+    'structure_transfer_all_button': 'StructureSearch',
+    'structure_transfer_one_button': 'StructureSearch',
+    'structure_sort_button': 'StructureSearch',
+    'structure_slot_empty': 'StructureSlots',
+    'structure_slot_filled': 'StructureSlots',
+    'structure_item_icon': 'StructureSlots',
+    'structure_item_name': 'StructureSlots',
+    'structure_item_count': 'StructureSlots',
+    'structure_item_durability': 'StructureSlots',
+    'structure_item_quality': 'StructureSlots',
+    'structure_item_spoil_timer': 'StructureSlots',
+    'structure_grid_view': 'StructureSlots',
+    'structure_list_view': 'StructureSlots',
+    'structure_filter_button': 'StructureSlots',
+    'structure_filter_dropdown': 'StructureSlots',
+    'structure_scroll_bar': 'StructureScrolling',
+    'structure_scroll_up_button': 'StructureScrolling',
+    'structure_scroll_down_button': 'StructureScrolling',
+    'structure_tab_inventory': 'StructureScrolling',
+    'structure_tab_contents': 'StructureScrolling',
+    'structure_pin_code_field': 'StructureScrolling',
+    'structure_locked_indicator': 'StructureScrolling',
+    'structure_unlocked_indicator': 'StructureScrolling',
+    'structure_tribe_access_icon': 'StructureAccess',
+    'structure_public_access_icon': 'StructureAccess',
+    'structure_remote_access_icon': 'StructureAccess',
+    'structure_auto_sort_toggle': 'StructureAccess',
+    'structure_transfer_mode_toggle': 'StructureAccess',
+    'structure_preserve_multiplier': 'StructureAccess',
+    'structure_rename_button': 'StructureManagement',
+    'structure_destroy_button': 'StructureManagement',
+    'structure_repair_button': 'StructureManagement',
+    'structure_pickup_timer': 'StructureManagement',
+    'structure_lock_button': 'StructureManagement',
+    'structure_unlock_button': 'StructureManagement',
+    'structure_tribe_only_toggle': 'StructureManagement',
+    'structure_pin_code_toggle': 'StructureManagement',
+    'structure_unlock_for_all_toggle': 'StructureManagement',
+    'structure_folder_create_button': 'StructureFolders',
+    'structure_folder_icon': 'StructureFolders',
+    'structure_folder_name': 'StructureFolders',
+    'structure_category_tabs': 'StructureFolders',
+    'structure_category_icon': 'StructureFolders',
+    'structure_context_menu': 'StructureFolders',
+    'structure_damage_indicator': 'StructureFolders',
+    'structure_transfer_history': 'StructureFolders',
+    'structure_item_tooltip': 'StructureFolders',
+    'structure_attachments_tab': 'StructureFolders',
+    'structure_attachment_slot': 'StructureFolders',
+    'structure_link_indicator': 'StructureFolders',
+    'structure_slots_upgrade': 'StructureFolders',
+    'crafting_station_background': 'CraftingStationBackground',
+    'crafting_station_title': 'CraftingStationBackground',
+    'crafting_station_type_icon': 'CraftingStationBackground',
+    'crafting_station_level_indicator': 'CraftingStationBackground',
+    'crafting_station_tab_inventory': 'CraftingStationBackground',
+    'crafting_station_tab_crafting': 'CraftingStationBackground',
+    'crafting_station_tab_engrams': 'CraftingStationBackground',
+    'crafting_station_slots_count': 'CraftingStationBackground',
+    'crafting_station_weight_indicator': 'CraftingStationBackground',
+    'crafting_station_weight_bar': 'CraftingStationBackground',
+    'crafting_station_current_weight': 'CraftingStationBackground',
+    'crafting_station_max_weight': 'CraftingStationBackground',
+    'crafting_station_search_bar': 'CraftingStationSearch',
+    'crafting_station_search_results': 'CraftingStationSearch',
+    'crafting_station_close_button': 'CraftingStationSearch',
+    'crafting_station_transfer_all_button': 'CraftingStationSearch',
+    'crafting_station_sort_button': 'CraftingStationSearch',
+    'crafting_station_slot_empty': 'CraftingStationSearch',
+    'crafting_station_slot_filled': 'CraftingStationSearch',
+    'crafting_station_item_icon': 'CraftingStationSearch',
+    'crafting_station_item_count': 'CraftingStationSearch',
+    'crafting_station_item_durability': 'CraftingStationSearch',
+    'crafting_station_crafting_list': 'CraftingStationItems',
+    'crafting_station_crafting_item': 'CraftingStationItems',
+    'crafting_station_blueprint_crafting': 'CraftingStationItems',
+    'crafting_station_materials_required': 'CraftingStationItems',
+    'crafting_station_materials_available': 'CraftingStationItems',
+    'crafting_station_materials_missing': 'CraftingStationItems',
+    'crafting_station_craft_button': 'CraftingStationItems',
+    'crafting_station_craft_all_button': 'CraftingStationItems',
+    'crafting_station_craft_amount_selector': 'CraftingStationItems',
+    'crafting_station_crafting_queue': 'CraftingStationQueue',
+    'crafting_station_queue_item': 'CraftingStationQueue',
+    'crafting_station_progress_bar': 'CraftingStationQueue',
+    'crafting_station_time_remaining': 'CraftingStationQueue',
+    'crafting_station_speed_multiplier': 'CraftingStationQueue',
+    'crafting_station_fuel_slot': 'CraftingStationQueue',
+    'crafting_station_fuel_icon': 'CraftingStationQueue',
+    'crafting_station_fuel_level': 'CraftingStationQueue',
+    'crafting_station_powered_indicator': 'CraftingStationQueue',
+    'crafting_station_unpowered_indicator': 'CraftingStationQueue',
+    'crafting_station_blueprint_modifier': 'CraftingStationModifiers',
+    'crafting_station_skill_modifier': 'CraftingStationModifiers',
+    'crafting_station_bulk_craft_toggle': 'CraftingStationModifiers',
+    'crafting_station_resource_pull_button': 'CraftingStationModifiers',
+    'crafting_station_craft_one_button': 'CraftingStationModifiers',
+    'crafting_station_pin_recipe_button': 'CraftingStationModifiers',
+    'crafting_station_unpinned_recipes': 'CraftingStationModifiers',
+    'crafting_station_pinned_recipes': 'CraftingStationModifiers',
+    'crafting_station_recipe_pin_icon': 'CraftingStationModifiers',
+    'crafting_station_queue_cancel_button': 'CraftingStationModifiers',
+    'crafting_station_quick_access_slots': 'CraftingStationModifiers',
+    'crafting_station_filter_button': 'CraftingStationFilters',
+    'crafting_station_filter_dropdown': 'CraftingStationFilters',
+    'crafting_station_recipe_level_requirement': 'CraftingStationFilters',
+    'crafting_station_recipe_station_requirement': 'CraftingStationFilters',
+    'crafting_station_recipe_dlc_requirement': 'CraftingStationFilters',
+    'crafting_station_tek_requirement': 'CraftingStationFilters',
+    'crafting_station_custom_recipe_button': 'CraftingStationFilters',
+    'crafting_station_recipe_slider': 'CraftingStationFilters',
+    'crafting_station_recipe_ingredient_slot': 'CraftingStationFilters',
+    'crafting_station_recipe_name_field': 'CraftingStationFilters',
+    'crafting_station_recipe_save_button': 'CraftingStationFilters',
+    'crafting_station_recipe_load_button': 'CraftingStationFilters',
+    'crafting_station_recipe_delete_button': 'CraftingStationFilters',
+    'crafting_station_recipe_list': 'CraftingStationFilters',
+    'crafting_station_recipe_entry': 'CraftingStationFilters',
+    'crafting_station_input_slots': 'CraftingStationSlots',
+    'crafting_station_output_slots': 'CraftingStationSlots',
+    'crafting_station_blueprint_slots': 'CraftingStationSlots',
+    'crafting_station_ingredient_tooltip': 'CraftingStationSlots',
+    'crafting_station_craft_amount_field': 'CraftingStationSlots',
+    'crafting_station_learning_progress': 'CraftingStationSlots',
+    'crafting_station_durability_crafting': 'CraftingStationSlots',
+    'crafting_station_upgrade_slot': 'CraftingStationSlots',
+    'crafting_station_augment_slot': 'CraftingStationSlots',
+    'painting_interface_background': 'PaintingBackground',
+    'painting_interface_title': 'PaintingBackground',
+    'painting_interface_canvas': 'PaintingBackground',
+    'painting_interface_color_palette': 'PaintingBackground',
+    'painting_interface_color_picker': 'PaintingBackground',
+    'painting_interface_color_preview': 'PaintingBackground',
+    'painting_interface_rgb_sliders': 'PaintingColorControls',
+    'painting_interface_red_slider': 'PaintingColorControls',
+    'painting_interface_green_slider': 'PaintingColorControls',
+    'painting_interface_blue_slider': 'PaintingColorControls',
+    'painting_interface_hue_slider': 'PaintingColorControls',
+    'painting_interface_saturation_slider': 'PaintingColorControls',
+    'painting_interface_value_slider': 'PaintingColorControls',
+    'painting_interface_brush_size_slider': 'PaintingColorControls',
+    'painting_interface_brush_preview': 'PaintingColorControls',
+    'painting_interface_opacity_slider': 'PaintingColorControls',
+    'painting_interface_tool_selector': 'PaintingTools',
+    'painting_interface_brush_tool': 'PaintingTools',
+    'painting_interface_eraser_tool': 'PaintingTools',
+    'painting_interface_dropper_tool': 'PaintingTools',
+    'painting_interface_fill_tool': 'PaintingTools',
+    'painting_interface_line_tool': 'PaintingTools',
+    'painting_interface_rectangle_tool': 'PaintingTools',
+    'painting_interface_circle_tool': 'PaintingTools',
+    'painting_interface_spray_tool': 'PaintingTools',
+    'painting_interface_text_tool': 'PaintingTools',
+    'painting_interface_mirror_tool': 'PaintingTools',
+    'painting_interface_region_selector': 'PaintingRegions',
+    'painting_interface_region_1_button': 'PaintingRegions',
+    'painting_interface_region_2_button': 'PaintingRegions',
+    'painting_interface_region_3_button': 'PaintingRegions',
+    'painting_interface_region_4_button': 'PaintingRegions',
+    'painting_interface_region_5_button': 'PaintingRegions',
+    'painting_interface_region_6_button': 'PaintingRegions',
+    'painting_interface_region_indicator': 'PaintingRegions',
+    'painting_interface_save_button': 'PaintingActions',
+    'painting_interface_load_button': 'PaintingActions',
+    'painting_interface_clear_button': 'PaintingActions',
+    'painting_interface_undo_button': 'PaintingActions',
+    'painting_interface_redo_button': 'PaintingActions',
+    'painting_interface_saved_paintings': 'PaintingActions',
+    'painting_interface_painting_entry': 'PaintingActions',
+    'painting_interface_painting_preview': 'PaintingActions',
+    'painting_interface_painting_name': 'PaintingActions',
+    'painting_interface_rename_button': 'PaintingActions',
+    'painting_interface_delete_button': 'PaintingActions',
+    'painting_interface_import_button': 'PaintingActions',
+    'painting_interface_export_button': 'PaintingActions',
+    'painting_interface_copy_button': 'PaintingActions',
+    'painting_interface_paste_button': 'PaintingActions',
+    'painting_interface_grid_toggle': 'PaintingCanvasControls',
+    'painting_interface_grid_size_slider': 'PaintingCanvasControls',
+    'painting_interface_snap_to_grid_toggle': 'PaintingCanvasControls',
+    'painting_interface_canvas_zoom_in': 'PaintingCanvasControls',
+    'painting_interface_canvas_zoom_out': 'PaintingCanvasControls',
+    'painting_interface_canvas_pan_tool': 'PaintingCanvasControls',
+    'painting_interface_canvas_reset_view': 'PaintingCanvasControls',
+    'painting_interface_brush_style_selector': 'PaintingBrushSettings',
+    'painting_interface_brush_hardness_slider': 'PaintingBrushSettings',
+    'painting_interface_brush_spacing_slider': 'PaintingBrushSettings',
+    'painting_interface_brush_angle_slider': 'PaintingBrushSettings',
+    'painting_interface_brush_preview_window': 'PaintingBrushSettings',
+    'painting_interface_texture_selector': 'PaintingBrushSettings',
+    'painting_interface_texture_preview': 'PaintingBrushSettings',
+    'painting_interface_layer_list': 'PaintingLayers',
+    'painting_interface_layer_entry': 'PaintingLayers',
+    'painting_interface_layer_visibility': 'PaintingLayers',
+    'painting_interface_layer_opacity': 'PaintingLayers',
+    'painting_interface_add_layer_button': 'PaintingLayers',
+    'painting_interface_delete_layer_button': 'PaintingLayers',
+    'painting_interface_merge_layers_button': 'PaintingLayers',
+    'painting_interface_layer_order_up': 'PaintingLayers',
+    'painting_interface_layer_order_down': 'PaintingLayers',
+    'painting_interface_layer_name': 'PaintingLayers',
+    'painting_interface_text_input_field': 'PaintingText',
+    'painting_interface_font_selector': 'PaintingText',
+    'painting_interface_font_size_slider': 'PaintingText',
+    'painting_interface_text_bold_toggle': 'PaintingText',
+    'painting_interface_text_italic_toggle': 'PaintingText',
+    'painting_interface_text_underline_toggle': 'PaintingText',
+    'painting_interface_text_alignment': 'PaintingText',
+    'painting_interface_tribe_logo_template': 'PaintingTemplates',
+    'painting_interface_template_selector': 'PaintingTemplates',
+    'painting_interface_flag_template': 'PaintingTemplates',
+    'painting_interface_pattern_selector': 'PaintingTemplates',
+    'painting_interface_apply_template_button': 'PaintingTemplates',
+    'painting_interface_recent_colors': 'PaintingTemplates',
+    'painting_interface_custom_colors': 'PaintingTemplates',
+    'painting_interface_add_to_custom_button': 'PaintingTemplates',
+    'cave_entrance_marker': 'CaveEntranceElements',
+    'cave_entrance_name_display': 'CaveEntranceElements',
+    'cave_entrance_difficulty_rating': 'CaveEntranceElements',
+    'cave_entrance_level_requirement': 'CaveEntranceElements',
+    'cave_entrance_temperature_warning': 'CaveEntranceElements',
+    'cave_entrance_resource_indicator': 'CaveEntranceElements',
+    'cave_entrance_artifact_indicator': 'CaveEntranceElements',
+    'cave_entrance_gas_warning': 'CaveEntranceElements',
+    'cave_entrance_water_warning': 'CaveEntranceElements',
+    'cave_entrance_dino_restriction': 'CaveEntranceElements',
+    'cave_entrance_coordinates': 'CaveEntranceElements',
+    'cave_entrance_transfer_prompt': 'CaveEntranceElements',
+    'cave_gas_meter': 'CaveHazardElements',
+    'cave_gas_warning_icon': 'CaveHazardElements',
+    'cave_gas_mask_indicator': 'CaveHazardElements',
+    'cave_radiation_meter': 'CaveHazardElements',
+    'cave_radiation_warning_icon': 'CaveHazardElements',
+    'cave_radiation_suit_indicator': 'CaveHazardElements',
+    'cave_temperature_extreme_indicator': 'CaveHazardElements',
+    'cave_hazard_warning_icon': 'CaveHazardElements',
+    'cave_artifact_glow': 'CaveArtifactElements',
+    'cave_artifact_container': 'CaveArtifactElements',
+    'cave_artifact_name': 'CaveArtifactElements',
+    'cave_artifact_description': 'CaveArtifactElements',
+    'cave_artifact_collect_prompt': 'CaveArtifactElements',
+    'cave_artifact_collect_button': 'CaveArtifactElements',
+    'cave_artifact_cooldown_timer': 'CaveArtifactElements',
+    'cave_artifact_inventory_icon': 'CaveArtifactElements',
+    'cave_exit_marker': 'CaveNavigationElements',
+    'cave_exit_distance': 'CaveNavigationElements',
+    'cave_loot_crate_marker': 'CaveNavigationElements',
+    'cave_loot_crate_timer': 'CaveNavigationElements',
+    'cave_map_overlay': 'CaveNavigationElements',
+    'cave_map_corridor': 'CaveNavigationElements',
+    'cave_map_chamber': 'CaveNavigationElements',
+    'cave_map_water_area': 'CaveNavigationElements',
+    'cave_map_hazard_area': 'CaveNavigationElements',
+    'cave_depth_indicator': 'CaveNavigationElements',
+    'cave_altitude_indicator': 'CaveNavigationElements',
+    'cave_structural_integrity': 'CaveStructuralElements',
+    'cave_ceiling_collapse_warning': 'CaveStructuralElements',
+    'cave_stalactite_warning': 'CaveStructuralElements',
+    'cave_floor_collapse_warning': 'CaveStructuralElements',
+    'cave_enemy_spawner_marker': 'CaveStructuralElements',
+    'cave_enemy_spawner_active': 'CaveStructuralElements',
+    'cave_enemy_spawner_cooldown': 'CaveStructuralElements',
+    'cave_boss_arena_entrance': 'CaveBossElements',
+    'cave_boss_arena_requirements': 'CaveBossElements',
+    'cave_boss_tribute_terminal': 'CaveBossElements',
+    'cave_boss_tribute_slots': 'CaveBossElements',
+    'cave_boss_activate_button': 'CaveBossElements',
+    'cave_boss_entry_countdown': 'CaveBossElements',
+    'cave_artifact_slot': 'CaveBossElements',
+    'cave_tribute_slot': 'CaveBossElements',
+    'cave_tribute_required_count': 'CaveBossElements',
+    'cave_water_depth_indicator': 'CaveWaterElements',
+    'cave_water_current_indicator': 'CaveWaterElements',
+    'cave_swim_stamina_indicator': 'CaveWaterElements',
+    'cave_oxygen_depletion_warning': 'CaveWaterElements',
+    'cave_tek_door_interface': 'CaveTekElements',
+    'cave_tek_door_unlock_requirements': 'CaveTekElements',
+    'cave_note_discovery': 'CaveTekElements',
+    'cave_note_content': 'CaveTekElements',
+    'cave_note_reward': 'CaveTekElements',
+    'cave_note_collection_progress': 'CaveTekElements',
+    'cave_grapple_point_marker': 'CaveClimbingElements',
+    'cave_climbing_pick_point': 'CaveClimbingElements',
+    'cave_zipline_anchor_point': 'CaveClimbingElements',
+    'cave_zipline_active': 'CaveClimbingElements',
+    'cave_swinging_vine_marker': 'CaveClimbingElements',
+    'cave_puzzle_interface': 'CavePuzzleElements',
+    'cave_puzzle_clue': 'CavePuzzleElements',
+    'cave_puzzle_interact_prompt': 'CavePuzzleElements',
+    'cave_puzzle_solution_input': 'CavePuzzleElements',
+    'cave_puzzle_success_indicator': 'CavePuzzleElements',
+    'cave_puzzle_failure_indicator': 'CavePuzzleElements',
+    'cave_puzzle_reset_button': 'CavePuzzleElements',
+    'cave_reward_chest_marker': 'CavePuzzleElements',
+    'cave_completion_reward': 'CaveCompletionElements',
+    'cave_completion_timer': 'CaveCompletionElements',
+    'cave_record_time': 'CaveCompletionElements',
+    'cave_checkpoint_marker': 'CaveCompletionElements',
+    'cave_checkpoint_activated': 'CaveCompletionElements',
+    'creature_riding_controls_overlay': 'CreatureRidingControls',
+    'creature_riding_health_bar': 'CreatureRidingControls',
+    'creature_riding_stamina_bar': 'CreatureRidingControls',
+    'creature_riding_food_bar': 'CreatureRidingControls',
+    'creature_riding_oxygen_bar': 'CreatureRidingControls',
+    'creature_riding_weight_bar': 'CreatureRidingControls',
+    'creature_riding_xp_bar': 'CreatureRidingControls',
+    'creature_riding_name_display': 'CreatureRidingControls',
+    'creature_riding_level_display': 'CreatureRidingControls',
+    'creature_riding_special_ability_icon': 'CreatureRidingAbilities',
+    'creature_riding_special_ability_cooldown': 'CreatureRidingAbilities',
+    'creature_riding_special_ability_active': 'CreatureRidingAbilities',
+    'creature_riding_special_ability_hotkey': 'CreatureRidingAbilities',
+    'creature_riding_attack_indicator': 'CreatureRidingAbilities',
+    'creature_riding_secondary_attack_indicator': 'CreatureRidingAbilities',
+    'creature_riding_tertiary_attack_indicator': 'CreatureRidingAbilities',
+    'creature_riding_movement_controls': 'CreatureRidingMovement',
+    'creature_riding_jump_indicator': 'CreatureRidingMovement',
+    'creature_riding_sprint_indicator': 'CreatureRidingMovement',
+    'creature_riding_land_indicator': 'CreatureRidingMovement',
+    'creature_riding_dismount_indicator': 'CreatureRidingMovement',
+    'creature_riding_control_scheme': 'CreatureRidingMovement',
+    'creature_riding_camera_mode': 'CreatureRidingMovement',
+    'creature_riding_first_person_view': 'CreatureRidingMovement',
+    'creature_riding_third_person_view': 'CreatureRidingMovement',
+    'creature_riding_speed_indicator': 'CreatureRidingMeters',
+    'creature_riding_altitude_indicator': 'CreatureRidingMeters',
+    'creature_riding_depth_indicator': 'CreatureRidingMeters',
+    'creature_riding_barrel_roll_indicator': 'CreatureRidingMeters',
+    'creature_riding_spin_indicator': 'CreatureRidingMeters',
+    'creature_riding_roar_indicator': 'CreatureRidingMeters',
+    'creature_riding_bite_indicator': 'CreatureRidingMeters',
+    'creature_riding_harvest_indicator': 'CreatureRidingMeters',
+    'creature_riding_charge_indicator': 'CreatureRidingMeters',
+    'creature_riding_breath_attack_indicator': 'CreatureRidingMeters',
+    'creature_riding_flame_indicator': 'CreatureRidingAttacks',
+    'creature_riding_poison_indicator': 'CreatureRidingAttacks',
+    'creature_riding_lightning_indicator': 'CreatureRidingAttacks',
+    'creature_riding_tek_saddle_element': 'CreatureRidingAttacks',
+    'creature_riding_tek_saddle_shield': 'CreatureRidingAttacks',
+    'creature_riding_tek_saddle_laser': 'CreatureRidingAttacks',
+    'creature_riding_tek_saddle_dash': 'CreatureRidingAttacks',
+    'creature_riding_turret_mode_indicator': 'CreatureRidingAttacks',
+    'creature_riding_turret_ammo_counter': 'CreatureRidingAttacks',
+    'creature_riding_passenger_indicator': 'CreatureRidingPassengers',
+    'creature_riding_passenger_count': 'CreatureRidingPassengers',
+    'creature_riding_passenger_list': 'CreatureRidingPassengers',
+    'creature_riding_passenger_name': 'CreatureRidingPassengers',
+    'creature_riding_switch_seat_indicator': 'CreatureRidingPassengers',
+    'creature_riding_platform_structure_count': 'CreatureRidingPassengers',
+    'creature_riding_platform_weight': 'CreatureRidingPassengers',
+    'creature_riding_damage_indicator': 'CreatureRidingStatusEffects',
+    'creature_riding_creature_buff_icon': 'CreatureRidingStatusEffects',
+    'creature_riding_pack_bonus_icon': 'CreatureRidingStatusEffects',
+    'creature_riding_mate_boost_icon': 'CreatureRidingStatusEffects',
+    'creature_riding_imprint_bonus_icon': 'CreatureRidingStatusEffects',
+    'creature_riding_fall_damage_warning': 'CreatureRidingStatusEffects',
+    'creature_riding_torpor_warning': 'CreatureRidingStatusEffects',
+    'creature_riding_starving_warning': 'CreatureRidingStatusEffects',
+    'creature_riding_exhaustion_warning': 'CreatureRidingStatusEffects',
+    'creature_riding_encumbered_warning': 'CreatureRidingStatusEffects',
+    'creature_riding_injured_warning': 'CreatureRidingStatusEffects',
+    'creature_riding_drowning_warning': 'CreatureRidingStatusEffects',
+    'creature_riding_temperature_warning': 'CreatureRidingStatusEffects',
+    'creature_riding_territory_warning': 'CreatureRidingStatusEffects',
+    'creature_riding_attack_cooldown': 'CreatureRidingAdditionalInfo',
+    'creature_riding_gathering_efficiency': 'CreatureRidingAdditionalInfo',
+    'creature_riding_resource_gathered_popup': 'CreatureRidingAdditionalInfo',
+    'creature_riding_experience_gained_popup': 'CreatureRidingAdditionalInfo',
+    'creature_riding_whistlewheel_indicator': 'CreatureRidingAdditionalInfo',
+    'creature_riding_behavior_indicator': 'CreatureRidingAdditionalInfo',
+    'creature_riding_follow_distance_indicator': 'CreatureRidingAdditionalInfo',
+    'creature_riding_inventory_access_indicator': 'CreatureRidingAdditionalInfo',
+    'loot_crate_background': 'LootCrateBackground',
+    'loot_crate_title': 'LootCrateBackground',
+    'loot_crate_color_indicator': 'LootCrateBackground',
+    'loot_crate_timer': 'LootCrateBackground',
+    'loot_crate_slot_empty': 'LootCrateBackground',
+    'loot_crate_slot_filled': 'LootCrateBackground',
+    'loot_crate_item_icon': 'LootCrateBackground',
+    'loot_crate_item_name': 'LootCrateBackground',
+    'loot_crate_item_count': 'LootCrateBackground',
+    'loot_crate_item_quality': 'LootCrateBackground',
+    'loot_crate_item_blueprint_icon': 'LootCrateBackground',
+    'loot_crate_close_button': 'LootCrateControls',
+    'loot_crate_take_all_button': 'LootCrateControls',
+    'loot_crate_transfer_all_button': 'LootCrateControls',
+    'loot_crate_sort_button': 'LootCrateControls',
+    'loot_crate_filter_button': 'LootCrateControls',
+    'loot_crate_search_bar': 'LootCrateControls',
+    'loot_crate_rarity_white': 'LootCrateRarity',
+    'loot_crate_rarity_green': 'LootCrateRarity',
+    'loot_crate_rarity_blue': 'LootCrateRarity',
+    'loot_crate_rarity_purple': 'LootCrateRarity',
+    'loot_crate_rarity_yellow': 'LootCrateRarity',
+    'loot_crate_rarity_red': 'LootCrateRarity',
+    'loot_crate_locked_indicator': 'LootCrateUnlock',
+    'loot_crate_unlock_prompt': 'LootCrateUnlock',
+    'loot_crate_pin_code_field': 'LootCrateUnlock',
+    'loot_crate_unlock_button': 'LootCrateUnlock',
+    'loot_crate_tribute_required': 'LootCrateUnlock',
+    'loot_crate_tribute_slot': 'LootCrateUnlock',
+    'loot_crate_tribute_item': 'LootCrateUnlock',
+    'loot_crate_tribute_count': 'LootCrateUnlock',
+    'loot_crate_beacon_light': 'LootCrateEffects',
+    'loot_crate_beacon_ring': 'LootCrateEffects',
+    'loot_crate_drop_location': 'LootCrateEffects',
+    'loot_crate_drop_altitude': 'LootCrateEffects',
+    'loot_crate_landing_countdown': 'LootCrateEffects',
+    'loot_crate_available_notification': 'LootCrateEffects',
+    'loot_crate_map_marker': 'LootCrateEffects',
+    'loot_crate_coordinates_display': 'LootCrateEffects',
+    'loot_crate_contents_preview': 'LootCrateInfo',
+    'loot_crate_level_requirement': 'LootCrateInfo',
+    'loot_crate_tribe_access_indicator': 'LootCrateInfo',
+    'loot_crate_first_open_bonus': 'LootCrateInfo',
+    'loot_crate_item_glow_effect': 'LootCrateInfo',
+    'loot_crate_mission_reward': 'LootCrateInfo',
+    'loot_crate_mission_tier': 'LootCrateInfo',
+    'loot_crate_tribe_lock_timer': 'LootCrateInfo',
+    'loot_crate_unlock_reward': 'LootCrateInfo',
+    'loot_crate_special_event_indicator': 'LootCrateSpecial',
+    'loot_crate_holiday_theme': 'LootCrateSpecial',
+    'loot_crate_tek_variant': 'LootCrateSpecial',
+    'loot_crate_genesis_variant': 'LootCrateSpecial',
+    'loot_crate_cave_variant': 'LootCrateSpecial',
+    'loot_crate_underwater_variant': 'LootCrateSpecial',
+    'loot_crate_artifact_container': 'LootCrateSpecial',
+    'loot_crate_orbital_supply_drop': 'LootCrateSpecial',
+    'loot_crate_gacha_crystal': 'LootCrateSpecial',
+    'loot_crate_already_looted': 'LootCrateSpecial',
+    'loot_crate_nearby_enemy_warning': 'LootCrateWaveDefense',
+    'loot_crate_nearby_allies': 'LootCrateWaveDefense',
+    'loot_crate_wave_defense_status': 'LootCrateWaveDefense',
+    'loot_crate_wave_countdown': 'LootCrateWaveDefense',
+    'loot_crate_defense_success_bar': 'LootCrateWaveDefense',
+    'loot_crate_wave_counter': 'LootCrateWaveDefense',
+    'loot_crate_remaining_enemies': 'LootCrateWaveDefense',
+    'loot_crate_deploy_shield_button': 'LootCrateWaveDefense',
+    'loot_crate_repair_shield_button': 'LootCrateWaveDefense',
+    'loot_crate_shield_health': 'LootCrateWaveDefense',
+    'loot_crate_terminal_health': 'LootCrateWaveDefense',
+    'loot_crate_element_reward': 'LootCrateWaveDefense',
+    'loot_crate_duplicate_item_notification': 'LootCrateRewards',
+    'loot_crate_item_compare': 'LootCrateRewards',
+    'loot_crate_claim_button': 'LootCrateRewards',
+    'loot_crate_discard_button': 'LootCrateRewards',
+    'loot_crate_item_tooltip': 'LootCrateRewards',
+}
+
+# Category label -> subcategory label -> element names
+HIERARCHY = {
+    'HUD Elements': {
+        'Health Indicators': CLASS_SPECS['HUDHealthIndicators'][4],
+        'Stamina Indicators': CLASS_SPECS['HUDStaminaIndicators'][4],
+        'Food Indicators': CLASS_SPECS['HUDFoodIndicators'][4],
+        'Water Indicators': CLASS_SPECS['HUDWaterIndicators'][4],
+        'Oxygen Indicators': CLASS_SPECS['HUDOxygenIndicators'][4],
+        'Weight Indicators': CLASS_SPECS['HUDWeightIndicators'][4],
+        'Torpidity Indicators': CLASS_SPECS['HUDTorpidityIndicators'][4],
+        'Experience Indicators': CLASS_SPECS['HUDExperienceIndicators'][4],
+        'Compass Elements': CLASS_SPECS['HUDCompassElements'][4],
+        'Temperature Indicators': CLASS_SPECS['HUDTemperatureIndicators'][4],
+        'Buff Indicators': CLASS_SPECS['HUDBuffIndicators'][4],
+        'Debuff Indicators': CLASS_SPECS['HUDDebuffIndicators'][4],
+        'Chat Elements': CLASS_SPECS['HUDChatElements'][4],
+        'Crosshair Elements': CLASS_SPECS['HUDCrosshairElements'][4],
+        'Interaction Prompts': CLASS_SPECS['HUDInteractionPrompts'][4],
+        'Wheel Menus': CLASS_SPECS['HUDWheelMenus'][4],
+        'Waypoint Elements': CLASS_SPECS['HUDWaypointElements'][4],
+        'Name Tags': CLASS_SPECS['HUDNameTags'][4],
+        'Marker Elements': CLASS_SPECS['HUDMarkerElements'][4],
+        'Warning Elements': CLASS_SPECS['HUDWarningElements'][4],
+        'Tek HUD Elements': CLASS_SPECS['HUDTekElements'][4],
+        'Overlay Elements': CLASS_SPECS['HUDOverlayElements'][4],
+    },
+    'Quickbar Elements': {
+        'Quickbar Slots': CLASS_SPECS['QuickbarSlots'][4],
+        'Quickbar Indicators': CLASS_SPECS['QuickbarIndicators'][4],
+        'Quickbar Hotkeys': CLASS_SPECS['QuickbarHotkeys'][4],
+    },
+    'Inventory Elements': {
+        'Inventory Panels': CLASS_SPECS['InventoryPanels'][4],
+        'Inventory Slots': CLASS_SPECS['InventorySlots'][4],
+        'Quality Indicators': CLASS_SPECS['InventoryQualityIndicators'][4],
+        'Item Specials': CLASS_SPECS['InventoryItemSpecials'][4],
+        'Inventory Controls': CLASS_SPECS['InventoryControls'][4],
+        'Armor Slots': CLASS_SPECS['InventoryArmorSlots'][4],
+        'Tooltips': CLASS_SPECS['InventoryTooltips'][4],
+        'Context Menu': CLASS_SPECS['InventoryContextMenu'][4],
+        'Folders': CLASS_SPECS['InventoryFolders'][4],
+        'Entity Inventory': CLASS_SPECS['EntityInventoryElements'][4],
+        'Special Inventories': CLASS_SPECS['SpecialInventoryElements'][4],
+        'Terminal Tabs': CLASS_SPECS['_InventoryTerminalTabs'][4],
+    },
+    'Tab Elements': {
+        'Inventory Tabs': CLASS_SPECS['InventoryTabs'][4],
+        'Character Tabs': CLASS_SPECS['CharacterTabs'][4],
+        'Dino Tabs': CLASS_SPECS['DinoTabs'][4],
+        'Terminal Tabs': CLASS_SPECS['TerminalTabs'][4],
+    },
+    'Crafting Elements': {
+        'Crafting Panels': CLASS_SPECS['CraftingPanels'][4],
+        'Crafting Controls': CLASS_SPECS['CraftingControls'][4],
+        'Crafting Queue': CLASS_SPECS['CraftingQueue'][4],
+        'Station Info': CLASS_SPECS['CraftingStationInfo'][4],
+        'Crafting Filters': CLASS_SPECS['CraftingFilters'][4],
+        'Crafting Sorting': CLASS_SPECS['CraftingSorting'][4],
+        'Crafting Boosts': CLASS_SPECS['CraftingBoosts'][4],
+        'Crafting Requirements': CLASS_SPECS['CraftingRequirements'][4],
+        'Resource Costs': CLASS_SPECS['CraftingResourceCosts'][4],
+    },
+    'Engram Elements': {
+        'Engram Icons': CLASS_SPECS['EngramIcons'][4],
+        'Engram Points': CLASS_SPECS['EngramPoints'][4],
+        'Engram Controls': CLASS_SPECS['EngramControls'][4],
+        'Engram Items': CLASS_SPECS['EngramItems'][4],
+        'Engram Search': CLASS_SPECS['EngramSearch'][4],
+        'Engram Categories': CLASS_SPECS['EngramCategories'][4],
+        'Engram Tooltips': CLASS_SPECS['EngramTooltips'][4],
+        'DLC Icons': CLASS_SPECS['EngramDLCIcons'][4],
+        'Engram Navigation': CLASS_SPECS['EngramNavigation'][4],
+    },
+    'Dino Elements': {
+        'Dino Inventory': CLASS_SPECS['DinoInventory'][4],
+        'Dino Behavior': CLASS_SPECS['DinoBehavior'][4],
+        'Dino Targeting': CLASS_SPECS['DinoTargeting'][4],
+        'Dino Stats': CLASS_SPECS['DinoStats'][4],
+        'Dino Imprinting': CLASS_SPECS['DinoImprinting'][4],
+        'Dino Abilities': CLASS_SPECS['DinoAbilities'][4],
+        'Taming Elements': CLASS_SPECS['TamingElements'][4],
+    },
+    'Structure Elements': {
+        'Structure Info': CLASS_SPECS['StructureInfo'][4],
+        'Structure Options': CLASS_SPECS['StructureOptions'][4],
+        'Structure Placement': CLASS_SPECS['StructurePlacement'][4],
+        'Structure Power': CLASS_SPECS['StructurePower'][4],
+    },
+    'Map Elements': {
+        'Map Background': CLASS_SPECS['MapBackground'][4],
+        'Map Markers': CLASS_SPECS['MapMarkers'][4],
+        'Base Markers': CLASS_SPECS['MapBaseMarkers'][4],
+        'Obelisk Markers': CLASS_SPECS['MapObeliskMarkers'][4],
+        'Beacon Markers': CLASS_SPECS['MapBeaconMarkers'][4],
+        'Special Markers': CLASS_SPECS['MapSpecialMarkers'][4],
+        'Water Elements': CLASS_SPECS['MapWaterElements'][4],
+        'Biome Indicators': CLASS_SPECS['MapBiomeIndicators'][4],
+        'Coordinates': CLASS_SPECS['MapCoordinates'][4],
+        'Map Controls': CLASS_SPECS['MapControls'][4],
+        'Additional Info': CLASS_SPECS['MapAdditionalInfo'][4],
+        'Minimap': CLASS_SPECS['MinimapElements'][4],
+    },
+    'Alert Elements': {
+        'Health Alerts': CLASS_SPECS['HealthAlerts'][4],
+        'Notification Alerts': CLASS_SPECS['NotificationAlerts'][4],
+        'Warning Alerts': CLASS_SPECS['WarningAlerts'][4],
+    },
+    'Player Stats Elements': {
+        'Stats Panels': CLASS_SPECS['PlayerStatsPanels'][4],
+        'Health Stats': CLASS_SPECS['PlayerHealthStats'][4],
+        'Stamina Stats': CLASS_SPECS['PlayerStaminaStats'][4],
+        'Oxygen Stats': CLASS_SPECS['PlayerOxygenStats'][4],
+        'Food Stats': CLASS_SPECS['PlayerFoodStats'][4],
+        'Water Stats': CLASS_SPECS['PlayerWaterStats'][4],
+        'Weight Stats': CLASS_SPECS['PlayerWeightStats'][4],
+        'Melee Stats': CLASS_SPECS['PlayerMeleeStats'][4],
+        'Speed Stats': CLASS_SPECS['PlayerSpeedStats'][4],
+        'Fortitude Stats': CLASS_SPECS['PlayerFortitudeStats'][4],
+        'Crafting Stats': CLASS_SPECS['PlayerCraftingStats'][4],
+        'Level Elements': CLASS_SPECS['PlayerLevelElements'][4],
+        'Special Stats': CLASS_SPECS['PlayerSpecialStats'][4],
+    },
+    'Tribe Elements': {
+        'Management Panels': CLASS_SPECS['TribeManagementPanels'][4],
+        'Tribe Members': CLASS_SPECS['TribeMembers'][4],
+        'Tribe Log': CLASS_SPECS['TribeLog'][4],
+        'Tribe Alliances': CLASS_SPECS['TribeAlliances'][4],
+        'Tribe Governance': CLASS_SPECS['TribeGovernance'][4],
+        'Tribe Permissions': CLASS_SPECS['TribePermissions'][4],
+        'Tribe Settings': CLASS_SPECS['TribeSettings'][4],
+        'Advanced Settings': CLASS_SPECS['TribeAdvancedSettings'][4],
+    },
+    'Structure Placement Elements': {
+        'Placement Validation': CLASS_SPECS['PlacementValidation'][4],
+        'Placement Controls': CLASS_SPECS['PlacementControls'][4],
+        'Placement Resources': CLASS_SPECS['PlacementResources'][4],
+        'Placement Timers': CLASS_SPECS['PlacementTimers'][4],
+        'Placement Environment': CLASS_SPECS['PlacementEnvironment'][4],
+        'Placement Specials': CLASS_SPECS['PlacementSpecials'][4],
+    },
+    'Electrical System Elements': {
+        'Electrical Interface': CLASS_SPECS['ElectricalInterface'][4],
+        'Electrical Devices': CLASS_SPECS['ElectricalDevices'][4],
+        'Electrical Circuits': CLASS_SPECS['ElectricalCircuits'][4],
+        'Electrical Generators': CLASS_SPECS['ElectricalGenerators'][4],
+        'Electrical Settings': CLASS_SPECS['ElectricalSettings'][4],
+        'Electrical Grid': CLASS_SPECS['ElectricalGrid'][4],
+        'Electrical Advanced': CLASS_SPECS['ElectricalAdvanced'][4],
+        'Electrical Monitoring': CLASS_SPECS['ElectricalMonitoring'][4],
+    },
+    'Transfer Interface Elements': {
+        'Transfer Background': CLASS_SPECS['TransferBackground'][4],
+        'Server List': CLASS_SPECS['TransferServerList'][4],
+        'Transfer Search': CLASS_SPECS['TransferSearch'][4],
+        'Transfer Buttons': CLASS_SPECS['TransferButtons'][4],
+        'Transfer Tabs': CLASS_SPECS['TransferTabs'][4],
+        'Transfer Players': CLASS_SPECS['TransferPlayers'][4],
+        'Transfer Items': CLASS_SPECS['TransferItems'][4],
+        'Transfer Dinos': CLASS_SPECS['TransferDinos'][4],
+        'Transfer Status': CLASS_SPECS['TransferStatus'][4],
+        'Transfer Confirmation': CLASS_SPECS['TransferConfirmation'][4],
+        'Transfer Filters': CLASS_SPECS['TransferFilters'][4],
+        'Server Info': CLASS_SPECS['TransferServerInfo'][4],
+    },
+    'Settings Menu Elements': {
+        'Settings Background': CLASS_SPECS['SettingsBackground'][4],
+        'Settings Tabs': CLASS_SPECS['SettingsTabs'][4],
+        'Settings Sections': CLASS_SPECS['SettingsSections'][4],
+        'Settings Controls': CLASS_SPECS['SettingsControls'][4],
+        'Settings Actions': CLASS_SPECS['SettingsActions'][4],
+    },
+    'Holiday Event Elements': {
+        'Holiday Interfaces': CLASS_SPECS['HolidayInterfaces'][4],
+        'Genesis Missions': CLASS_SPECS['GenesisMissions'][4],
+    },
+    'Tek Elements': {
+        'Tek Interfaces': CLASS_SPECS['TekInterfaces'][4],
+        'Tek Creature UI': CLASS_SPECS['TekCreatureUI'][4],
+        'Tek Resources': CLASS_SPECS['TekResources'][4],
+        'Tek Transmitter': CLASS_SPECS['TekTransmitter'][4],
+        'Tek Teleporter': CLASS_SPECS['TekTeleporter'][4],
+        'Advanced Structures': CLASS_SPECS['TekAdvancedStructures'][4],
+        'Tek Storage': CLASS_SPECS['TekStorage'][4],
+        'Tek Generator': CLASS_SPECS['TekGenerator'][4],
+        'Tek Shield': CLASS_SPECS['TekShield'][4],
+        'Tek Trough': CLASS_SPECS['TekTrough'][4],
+        'Tek Vehicles': CLASS_SPECS['TekVehicles'][4],
+        'Tek Sensor': CLASS_SPECS['TekSensor'][4],
+        'Tek Visor': CLASS_SPECS['TekVisor'][4],
+        'Tek Armor': CLASS_SPECS['TekArmor'][4],
+        'Tek Weapons': CLASS_SPECS['TekWeapons'][4],
+        'Tek Creatures': CLASS_SPECS['TekCreatures'][4],
+    },
+    'Boss Arena Elements': {
+        'Entry Interface': CLASS_SPECS['BossEntryInterface'][4],
+        'Boss Fight': CLASS_SPECS['BossFightElements'][4],
+        'Attack Warnings': CLASS_SPECS['BossAttackWarnings'][4],
+        'Arena Exit': CLASS_SPECS['BossArenaExit'][4],
+        'Artifact Elements': CLASS_SPECS['BossArtifactElements'][4],
+        'Difficulty Elements': CLASS_SPECS['BossDifficultyElements'][4],
+    },
+    'Event Interface Elements': {
+        'Event Background': CLASS_SPECS['EventBackground'][4],
+        'Event Objectives': CLASS_SPECS['EventObjectives'][4],
+        'Event Leaderboard': CLASS_SPECS['EventLeaderboard'][4],
+        'Event Controls': CLASS_SPECS['EventControls'][4],
+    },
+    'Death Screen Elements': {
+        'Death Screen Background': CLASS_SPECS['DeathScreenBackground'][4],
+        'Respawn Elements': CLASS_SPECS['DeathRespawnElements'][4],
+        'Respawn Locations': CLASS_SPECS['DeathRespawnLocations'][4],
+        'Corpse Elements': CLASS_SPECS['DeathCorpseElements'][4],
+        'Death Details': CLASS_SPECS['DeathDetailsElements'][4],
+        'Death Screen Controls': CLASS_SPECS['DeathScreenControls'][4],
+        'Death Cause': CLASS_SPECS['DeathCauseElements'][4],
+    },
+    'Breeding Interface Elements': {
+        'Breeding Background': CLASS_SPECS['BreedingBackground'][4],
+        'Breeding Controls': CLASS_SPECS['BreedingControls'][4],
+        'Breeding Eggs': CLASS_SPECS['BreedingEggs'][4],
+        'Breeding Mutations': CLASS_SPECS['BreedingMutations'][4],
+        'Breeding Imprinting': CLASS_SPECS['BreedingImprinting'][4],
+        'Breeding Maturation': CLASS_SPECS['BreedingMaturation'][4],
+        'Breeding Ancestry': CLASS_SPECS['BreedingAncestry'][4],
+        'Status Information': CLASS_SPECS['BreedingStatusInformation'][4],
+        'Breeding Advanced': CLASS_SPECS['BreedingAdvanced'][4],
+    },
+    'Structure Storage Elements': {
+        'Structure Background': CLASS_SPECS['StructureBackground'][4],
+        'Structure Search': CLASS_SPECS['StructureSearch'][4],
+        'Structure Slots': CLASS_SPECS['StructureSlots'][4],
+        'Structure Scrolling': CLASS_SPECS['StructureScrolling'][4],
+        'Structure Access': CLASS_SPECS['StructureAccess'][4],
+        'Structure Management': CLASS_SPECS['StructureManagement'][4],
+        'Structure Folders': CLASS_SPECS['StructureFolders'][4],
+    },
+    'Crafting Station Elements': {
+        'Crafting Station Background': CLASS_SPECS['CraftingStationBackground'][4],
+        'Crafting Station Search': CLASS_SPECS['CraftingStationSearch'][4],
+        'Crafting Station Items': CLASS_SPECS['CraftingStationItems'][4],
+        'Crafting Station Queue': CLASS_SPECS['CraftingStationQueue'][4],
+        'Crafting Station Modifiers': CLASS_SPECS['CraftingStationModifiers'][4],
+        'Crafting Station Filters': CLASS_SPECS['CraftingStationFilters'][4],
+        'Crafting Station Slots': CLASS_SPECS['CraftingStationSlots'][4],
+    },
+    'Painting Interface Elements': {
+        'Painting Background': CLASS_SPECS['PaintingBackground'][4],
+        'Color Controls': CLASS_SPECS['PaintingColorControls'][4],
+        'Painting Tools': CLASS_SPECS['PaintingTools'][4],
+        'Painting Regions': CLASS_SPECS['PaintingRegions'][4],
+        'Painting Actions': CLASS_SPECS['PaintingActions'][4],
+        'Canvas Controls': CLASS_SPECS['PaintingCanvasControls'][4],
+        'Brush Settings': CLASS_SPECS['PaintingBrushSettings'][4],
+        'Painting Layers': CLASS_SPECS['PaintingLayers'][4],
+        'Painting Text': CLASS_SPECS['PaintingText'][4],
+        'Painting Templates': CLASS_SPECS['PaintingTemplates'][4],
+    },
+    'Cave Elements': {
+        'Cave Entrance': CLASS_SPECS['CaveEntranceElements'][4],
+        'Cave Hazards': CLASS_SPECS['CaveHazardElements'][4],
+        'Cave Artifacts': CLASS_SPECS['CaveArtifactElements'][4],
+        'Cave Navigation': CLASS_SPECS['CaveNavigationElements'][4],
+        'Cave Structure': CLASS_SPECS['CaveStructuralElements'][4],
+        'Cave Boss': CLASS_SPECS['CaveBossElements'][4],
+        'Cave Water': CLASS_SPECS['CaveWaterElements'][4],
+        'Cave Tek': CLASS_SPECS['CaveTekElements'][4],
+        'Cave Climbing': CLASS_SPECS['CaveClimbingElements'][4],
+        'Cave Puzzles': CLASS_SPECS['CavePuzzleElements'][4],
+        'Cave Completion': CLASS_SPECS['CaveCompletionElements'][4],
+    },
+    'Creature Riding Elements': {
+        'Riding Controls': CLASS_SPECS['CreatureRidingControls'][4],
+        'Riding Abilities': CLASS_SPECS['CreatureRidingAbilities'][4],
+        'Riding Movement': CLASS_SPECS['CreatureRidingMovement'][4],
+        'Riding Meters': CLASS_SPECS['CreatureRidingMeters'][4],
+        'Riding Attacks': CLASS_SPECS['CreatureRidingAttacks'][4],
+        'Riding Passengers': CLASS_SPECS['CreatureRidingPassengers'][4],
+        'Riding Status Effects': CLASS_SPECS['CreatureRidingStatusEffects'][4],
+        'Additional Info': CLASS_SPECS['CreatureRidingAdditionalInfo'][4],
+    },
+    'Loot Crate Elements': {
+        'Loot Crate Background': CLASS_SPECS['LootCrateBackground'][4],
+        'Loot Crate Controls': CLASS_SPECS['LootCrateControls'][4],
+        'Loot Crate Rarity': CLASS_SPECS['LootCrateRarity'][4],
+        'Loot Crate Unlock': CLASS_SPECS['LootCrateUnlock'][4],
+        'Loot Crate Effects': CLASS_SPECS['LootCrateEffects'][4],
+        'Loot Crate Info': CLASS_SPECS['LootCrateInfo'][4],
+        'Loot Crate Special': CLASS_SPECS['LootCrateSpecial'][4],
+        'Wave Defense': CLASS_SPECS['LootCrateWaveDefense'][4],
+        'Loot Crate Rewards': CLASS_SPECS['LootCrateRewards'][4],
+    },
+}